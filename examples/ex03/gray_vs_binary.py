@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Benchmark of Gray encoding against plain binary encoding, the number of
+objective evaluations to reach a target fitness is compared for the function:
+f(x) = -sum(x_i^2 - 10*cos(2*pi*x_i)) (negative Rastrigin function)
+
+Each run is seeded with its run index, so the results are reproducible and the
+two encodings are compared with the same random states.
+'''
+
+import random
+from math import cos, pi
+from statistics import median
+
+from gaft import GAEngine
+from gaft.components import BinaryIndividual, GrayBinaryIndividual
+from gaft.components import Population
+from gaft.operators import TournamentSelection
+from gaft.operators import UniformCrossover
+from gaft.operators import FlipBitMutation
+from gaft.plugin_interfaces.analysis import OnTheFlyAnalysis
+
+# Dimension of the problem.
+DIM = 2
+
+# Target fitness (the global maximum is 0.0 at origin).
+TARGET = -0.5
+
+# Maximum generation number and repeat times of each run.
+NG = 100
+NRUNS = 20
+
+
+def evaluations_to_target(indv_cls, seed):
+    ''' Run the GA and get the number of objective evaluations needed to reach
+    the target fitness, None is returned if the target is not reached.
+
+    :param indv_cls: The individual class with binary or Gray encoding
+    :param seed: The seed of the random number generator for the run
+    '''
+    # NOTE: All random numbers in GAFT are drawn from the random module.
+    random.seed(seed)
+
+    indv_template = indv_cls(ranges=[(-5.12, 5.12)]*DIM, eps=0.001)
+    population = Population(indv_template=indv_template, size=50).init()
+
+    selection = TournamentSelection()
+    crossover = UniformCrossover(pc=0.8, pe=0.5)
+    mutation = FlipBitMutation(pm=0.05)
+
+    engine = GAEngine(population=population, selection=selection,
+                      crossover=crossover, mutation=mutation)
+
+    # Number of objective evaluations.
+    counter = {'evaluations': 0, 'reached': None}
+
+    @engine.fitness_register
+    def fitness(indv):
+        counter['evaluations'] += 1
+        return -sum(x**2 - 10*cos(2*pi*x) for x in indv.solution) - 10*DIM
+
+    @engine.analysis_register
+    class TargetReached(OnTheFlyAnalysis):
+        interval = 1
+        master_only = True
+
+        def setup(self, ng, engine):
+            pass
+
+        def register_step(self, g, population, engine):
+            if counter['reached'] is None and engine.ori_fmax >= TARGET:
+                counter['reached'] = counter['evaluations']
+
+        def finalize(self, population, engine):
+            pass
+
+    engine.run(ng=NG)
+
+    return counter['reached']
+
+
+if '__main__' == __name__:
+    for indv_cls in [BinaryIndividual, GrayBinaryIndividual]:
+        # Run i of each encoding is seeded with i.
+        results = [evaluations_to_target(indv_cls, seed=run) for run in range(NRUNS)]
+        reached = [n for n in results if n is not None]
+        msg = '{:<22} reached: {:>2}/{}, median evaluations to target: {}'
+        print(msg.format(indv_cls.__name__, len(reached), NRUNS,
+                         median(reached) if reached else '-'))
+
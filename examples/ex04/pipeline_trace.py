@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Trace of computation and communication in the MPI generation loop, children
+are bred, evaluated and gathered in batches with non-blocking collectives and
+the timeline is written to pipeline_trace.json (open it with chrome://tracing
+or Perfetto). The wall time is compared with the one of a single batch to check
+if gathering is really hidden behind breeding and evaluation.
+
+Run it with:
+    mpirun -np 4 python pipeline_trace.py
+'''
+
+import time
+from math import sin, cos
+
+from gaft import GAEngine
+from gaft.components import DecimalIndividual
+from gaft.components import Population
+from gaft.operators import TournamentSelection
+from gaft.operators import UniformCrossover
+from gaft.operators import FlipBitMutation
+from gaft.mpiutil import MPIUtil
+
+mpi = MPIUtil()
+
+# Population size, generation number and dimension of the problem.
+SIZE = 200
+NG = 20
+DIM = 200
+
+
+def run(pipeline_batches):
+    ''' Run the GA with given number of batches and get the engine.
+    '''
+    indv_template = DecimalIndividual(ranges=[(0, 10)]*DIM, eps=0.001)
+    population = Population(indv_template=indv_template, size=SIZE).init()
+
+    engine = GAEngine(population=population,
+                      selection=TournamentSelection(),
+                      crossover=UniformCrossover(pc=0.8, pe=0.5),
+                      mutation=FlipBitMutation(pm=0.05),
+                      pipeline_batches=pipeline_batches, trace=True)
+
+    @engine.fitness_register
+    def fitness(indv):
+        # Emulate an expensive objective function.
+        time.sleep(0.001)
+        return sum(x + 10*sin(5*x) + 7*cos(4*x) for x in indv.solution)
+
+    mpi.barrier()
+    start = time.perf_counter()
+    engine.run(NG)
+    mpi.barrier()
+    engine.elapsed = time.perf_counter() - start
+
+    return engine
+
+
+if '__main__' == __name__:
+    elapsed = {}
+    for pipeline_batches in [1, 4]:
+        engine = run(pipeline_batches)
+        elapsed[pipeline_batches] = engine.elapsed
+        summary = engine.trace.summary()
+        all_summaries = mpi.allgather(summary)
+
+        if mpi.is_master:
+            print('pipeline_batches: {}, elapsed: {:.3f}s'.format(pipeline_batches,
+                                                                 engine.elapsed))
+            for rank, s in enumerate(all_summaries):
+                # NOTE: The hidden fraction is an upper bound, N/A in a single process.
+                hidden = 'N/A' if s['hidden'] is None else '<= {:.0%}'.format(s['hidden'])
+                msg = ('  rank {}: compute {:.3f}s, gather in flight {:.3f}s, ' +
+                       'blocked {:.3f}s, hidden {}')
+                print(msg.format(rank, s['compute'], s['comm'], s['wait'], hidden))
+
+        if pipeline_batches > 1:
+            engine.trace.dump('pipeline_trace.json')
+
+    # Overlapping only pays off if the wall time is reduced.
+    if mpi.is_master:
+        saved = elapsed[1] - elapsed[4]
+        if saved > 0.0:
+            print('4 batches are {:.3f}s faster than 1 batch'.format(saved))
+        else:
+            print('4 batches are {:.3f}s slower than 1 batch, '.format(-saved) +
+                  'no communication is hidden')
@@ -2,6 +2,8 @@ import logging
 import sys
 
 from .engine import GAEngine
+from .island_engine import IslandEngine
+from .sharded_engine import ShardedEngine
 
 __version__ = '0.5.7'
 __author__ = 'ShaoZhengjiang <shaozhengjiang@gmail.com>'
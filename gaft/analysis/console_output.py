@@ -28,7 +28,6 @@ class ConsoleOutput(OnTheFlyAnalysis):
         self.logger.info('{} {}'.format(generation_info, population_info))
 
     def register_step(self, g, population, engine):
-        best_indv = population.best_indv(engine.fitness)
         ng_info = 'Generation: {}, '.format(g+1)
         fit_info = 'best fitness: {:.3f}, '.format(engine.ori_fmax)
         scaled_info = 'scaled fitness: {:.3f}'.format(engine.fmax)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Fitness caches keyed by individual chromsome to avoid re-evaluating the
+objective function for identical individuals across generations.
+'''
+
+import sqlite3
+from array import array
+from hashlib import blake2b
+from collections import OrderedDict
+
+from .components.binary_individual import BinaryIndividual
+
+
+def chromsome_key(chromsome):
+    ''' Get a compact hash key (16 bytes) of a chromsome.
+
+    :param chromsome: The chromsome of an individual
+    :type chromsome: list of int/float or memoryview
+
+    :return: The hash key of the chromsome
+    :rtype: bytes
+
+    .. Note::
+        Numeric genes are hashed as float64 values, so that equal int and float
+        genes get the same key.
+    '''
+    if isinstance(chromsome, memoryview) and chromsome.format == 'd':
+        data = chromsome.tobytes()
+    else:
+        try:
+            genes = array('d', chromsome)
+        except (TypeError, OverflowError):
+            genes = None
+        # NOTE: Integers which can not be represented exactly are hashed by value.
+        if genes is not None and genes.tolist() == list(chromsome):
+            data = genes.tobytes()
+        else:
+            data = repr(list(chromsome)).encode('utf-8')
+    return blake2b(data, digest_size=16).digest()
+
+
+def bits_key(bits, length):
+    ''' Get a compact hash key (16 bytes) of a packed binary chromsome.
+
+    :param bits: The packed chromsome
+    :type bits: int
+
+    :param length: The number of bits in chromsome
+    :type length: int
+
+    :return: The hash key of the packed chromsome
+    :rtype: bytes
+    '''
+    data = bits.to_bytes((length + 7)//8, 'big')
+    return blake2b(data, digest_size=16).digest()
+
+
+class FitnessCache(object):
+    ''' Cache for objective values keyed by chromsome hash with least recently
+    used (LRU) eviction.
+
+    :param maxsize: The maximum number of cached values
+    :type maxsize: int
+
+    Attributes:
+
+        hits(:obj:`int`): The number of lookups found in cache.
+
+        misses(:obj:`int`): The number of lookups not found in cache.
+    '''
+    def __init__(self, maxsize=100000):
+        if maxsize <= 0:
+            raise ValueError('Invalid cache size')
+        self.maxsize = maxsize
+
+        self.hits, self.misses = 0, 0
+        self._values = OrderedDict()
+
+    def key(self, indv):
+        ''' Get the cache key of an individual.
+
+        :param indv: The individual to be looked up
+        :type indv: :obj:`gaft.components.IndividualBase`
+        '''
+        if isinstance(indv, BinaryIndividual):
+            # Packed chromsome is hashed without unpacking it.
+            return bits_key(indv.bits, indv.length)
+        return chromsome_key(indv.chromsome)
+
+    def get(self, key):
+        ''' Look up the cached value of a key.
+
+        :param key: The cache key of an individual
+        :type key: bytes
+
+        :return: The cached objective value, None if not found
+        :rtype: float or None
+        '''
+        value = self._values.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._values.move_to_end(key)
+        return value
+
+    def get_many(self, keys):
+        ''' Look up the cached values of keys.
+
+        :param keys: The cache keys of individuals
+        :type keys: list of bytes
+
+        :return: The cached objective values, None for keys not found
+        :rtype: list of float or None
+        '''
+        return [self.get(key) for key in keys]
+
+    def put(self, key, value):
+        ''' Cache the objective value of a key, the least recently used value
+        is evicted if the cache is full.
+
+        :param key: The cache key of an individual
+        :type key: bytes
+
+        :param value: The objective value
+        :type value: float
+        '''
+        self._values[key] = value
+        self._values.move_to_end(key)
+        if len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+
+    def put_many(self, items):
+        ''' Cache the objective values of keys.
+
+        :param items: Pairs of cache key and objective value
+        :type items: list of (bytes, float)
+        '''
+        for key, value in items:
+            self.put(key, value)
+
+    def clear(self):
+        ''' Remove all cached values and reset counters.
+        '''
+        self._values.clear()
+        self.hits, self.misses = 0, 0
+
+    @property
+    def hit_rate(self):
+        ''' The ratio of lookups found in cache.
+        '''
+        nlookups = self.hits + self.misses
+        return self.hits/nlookups if nlookups else 0.0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+
+class PersistentFitnessCache(FitnessCache):
+    ''' Fitness cache stored in a local SQLite database which can be shared
+    across runs, values are keyed by chromsome hash and objective version. The
+    oldest values are evicted if the cache is full.
+
+    :param path: The path of the SQLite database file
+    :type path: str
+
+    :param version: The version of objective function, values cached for other
+                    versions are ignored. Change it when the objective function
+                    or the individual template (ranges, precisions) changes.
+    :type version: str
+
+    :param maxsize: The maximum number of cached values of current version in
+                    database
+    :type maxsize: int
+
+    .. Note::
+        Only float values are stored, values of other types are computed again
+        in later lookups, so that they are checked by the engine as in live
+        calls instead of being converted by the database.
+
+    .. Note::
+        In MPI environment, each process should use its own database file or
+        a database on a local file system supporting file locks.
+    '''
+    # Maximum number of variables in one SQL statement.
+    chunksize = 500
+
+    def __init__(self, path, version='', maxsize=10000000):
+        super(PersistentFitnessCache, self).__init__(maxsize)
+        self.path = path
+        self.version = str(version)
+
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS fitness ('
+                           'version TEXT NOT NULL, key BLOB NOT NULL, '
+                           'value REAL NOT NULL, UNIQUE (version, key))')
+        self._conn.commit()
+
+        # Number of values of current version in database.
+        self._size = len(self)
+
+    def get(self, key):
+        return self.get_many([key])[0]
+
+    def get_many(self, keys):
+        found = {}
+        for i in range(0, len(keys), self.chunksize):
+            chunk = keys[i: i+self.chunksize]
+            sql = ('SELECT key, value FROM fitness WHERE version = ? AND key IN ({})'
+                   .format(', '.join(['?']*len(chunk))))
+            found.update(self._conn.execute(sql, [self.version] + chunk))
+
+        values = [found.get(key) for key in keys]
+        nfound = sum(1 for value in values if value is not None)
+        self.hits += nfound
+        self.misses += len(values) - nfound
+
+        return values
+
+    def put(self, key, value):
+        self.put_many([(key, value)])
+
+    def put_many(self, items):
+        # NOTE: REAL column would convert values of other types to float.
+        rows = [(self.version, key, value) for key, value in items
+                if type(value) is float]
+        if not rows:
+            return
+
+        with self._conn:
+            cursor = self._conn.executemany('INSERT OR IGNORE INTO fitness VALUES (?, ?, ?)',
+                                            rows)
+            self._size += cursor.rowcount
+
+            # Evict the oldest values of current version.
+            if self._size > self.maxsize:
+                cursor = self._conn.execute('DELETE FROM fitness WHERE rowid IN '
+                                            '(SELECT rowid FROM fitness WHERE version = ? '
+                                            'ORDER BY rowid LIMIT ?)',
+                                            (self.version, self._size - self.maxsize))
+                self._size -= cursor.rowcount
+
+    def clear(self):
+        ''' Remove all cached values of current version and reset counters.
+        '''
+        with self._conn:
+            self._conn.execute('DELETE FROM fitness WHERE version = ?', (self.version,))
+        self._size = len(self)
+        self.hits, self.misses = 0, 0
+
+    def close(self):
+        ''' Close the database connection.
+        '''
+        self._conn.close()
+
+    def __len__(self):
+        sql = 'SELECT COUNT(*) FROM fitness WHERE version = ?'
+        return self._conn.execute(sql, (self.version,)).fetchone()[0]
+
+    def __contains__(self, key):
+        sql = 'SELECT 1 FROM fitness WHERE version = ? AND key = ?'
+        return self._conn.execute(sql, (self.version, key)).fetchone() is not None
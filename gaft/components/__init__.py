@@ -1,5 +1,7 @@
-from .individual import IndividualBase
-from .binary_individual import BinaryIndividual
+from .individual import IndividualBase, GeneSpec
+from .binary_individual import BinaryIndividual, GrayBinaryIndividual
 from .decimal_individual import DecimalIndividual
 from .population import Population
 
+from .array_population import ArrayPopulation
+from .sharded_population import ShardedPopulation
@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Module for population with all chromsomes stored in one contiguous array.
+'''
+
+from array import array
+
+from .individual import IndividualBase
+from .binary_individual import BinaryIndividual, pack_bits, unpack_bits
+from .decimal_individual import DecimalIndividual
+from .population import Population, IndvList
+
+
+class RowView(object):
+    ''' Mixin for lightweight individuals whose chromsome is a row of the
+    chromsome array in an :obj:`ArrayPopulation`.
+
+    Gene specification (ranges, precisions, lengths, gene_indices...) is shared
+    with the template individual instead of being copied for each individual.
+
+    :param template: The template individual of the population.
+    :type template: :obj:`gaft.components.IndividualBase`
+
+    :param row: The chromsome row of the individual.
+    :type row: memoryview
+    '''
+    # NOTE: Slots are defined in row view classes to avoid layout conflicts
+    #       with individual classes.
+    __slots__ = ()
+
+    def __init__(self, template, row):
+        self._template = template
+        self.spec = template.spec
+        self._row = row
+        # Solution is decoded on demand.
+        self._solution = None
+
+    def __getattr__(self, name):
+        # Delegate other attributes to the template.
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._template, name)
+
+    def __reduce__(self):
+        return (_restore_row_view,
+                (self._template, self._row.format, self._row.tobytes()))
+
+    @property
+    def chromsome(self):
+        ''' The chromsome row of the individual.
+        '''
+        return self._row
+
+    @chromsome.setter
+    def chromsome(self, chromsome):
+        if len(chromsome) != len(self._row):
+            msg = 'Invalid chromsome length {}, should be {}'
+            raise ValueError(msg.format(len(chromsome), len(self._row)))
+        self._row[:] = array(self._row.format, chromsome)
+        self._solution = None
+
+    def clone(self):
+        ''' Clone a new individual with a detached copy of the chromsome row.
+        '''
+        return self.__class__(self._template, _copy_row(self._row))
+
+
+class BinaryRowView(RowView):
+    ''' Mixin for lightweight individuals with binary encoding.
+    '''
+    __slots__ = ()
+
+    @property
+    def bits(self):
+        ''' The chromsome row packed in an integer.
+        '''
+        return pack_bits(self._row)
+
+    @bits.setter
+    def bits(self, bits):
+        self.chromsome = unpack_bits(bits, len(self._row))
+
+    @property
+    def length(self):
+        ''' The length of the chromsome row.
+        '''
+        return len(self._row)
+
+    @length.setter
+    def length(self, length):
+        # NOTE: The length of a row is fixed.
+        if length != len(self._row):
+            msg = 'Invalid chromsome length {}, should be {}'
+            raise ValueError(msg.format(length, len(self._row)))
+
+
+class DecimalRowView(RowView):
+    ''' Mixin for lightweight individuals with decimal encoding.
+    '''
+    __slots__ = ()
+
+    def decode(self):
+        ''' Decode gene sequence to decimal solution
+        '''
+        return self._row.tolist()
+
+
+class RowList(IndvList):
+    ''' A proxy list of row views in an :obj:`ArrayPopulation`. Assigning an
+    individual to an index writes its chromsome to the row in place through a
+    new row view, other changes of the list repack the chromsome array. The
+    population flag and version are updated in both cases.
+
+    :param population: The population the row views belong to
+    :type population: :obj:`gaft.components.ArrayPopulation`
+    '''
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            self._repack(list.__setitem__, key, value)
+        else:
+            # NOTE: The previous view is replaced by a new one, so that values
+            #       cached for it by identity are never reused for the new row.
+            view = self[key]
+            view = view.__class__(view._template, view._row)
+            view.chromsome = value.chromsome
+            super(IndvList, self).__setitem__(key, view)
+            self.population.update_flag()
+
+    def __delitem__(self, key):
+        self._repack(list.__delitem__, key)
+
+    def __iadd__(self, other):
+        self._repack(list.extend, other)
+        return self
+
+    def __imul__(self, n):
+        self._repack(list.__imul__, n)
+        return self
+
+    def append(self, item):
+        self._repack(list.append, item)
+
+    def extend(self, iterable_item):
+        self._repack(list.extend, iterable_item)
+
+    def insert(self, index, item):
+        self._repack(list.insert, index, item)
+
+    def pop(self, *args):
+        return self._repack(list.pop, *args)
+
+    def remove(self, item):
+        self._repack(list.remove, item)
+
+    def clear(self):
+        self._repack(list.clear)
+
+    def sort(self, *args, **kwargs):
+        self._repack(list.sort, *args, **kwargs)
+
+    def reverse(self):
+        self._repack(list.reverse)
+
+    def _repack(self, method, *args, **kwargs):
+        '''
+        Helper function to apply a list method to a copy of the row views and
+        pack the chromsomes of the result into a new chromsome array.
+        '''
+        indvs = list(self)
+        result = method(indvs, *args, **kwargs)
+        self.population.individuals = indvs
+        return result
+
+    def _reset(self, views):
+        '''
+        Helper function to replace all row views without updating the flag.
+        '''
+        list.__setitem__(self, slice(None), views)
+
+
+# Row view classes for different individual classes.
+_view_classes = {}
+
+def row_view_class(indv_cls):
+    ''' Get the row view class for a specific individual class.
+
+    :param indv_cls: The class of the template individual
+    :type indv_cls: subclass of :obj:`gaft.components.IndividualBase`
+    '''
+    if indv_cls not in _view_classes:
+        if issubclass(indv_cls, DecimalIndividual):
+            mixin = DecimalRowView
+        elif issubclass(indv_cls, BinaryIndividual):
+            mixin = BinaryRowView
+        else:
+            mixin = RowView
+        name = '{}View'.format(indv_cls.__name__)
+        slots = ('_template', '_row')
+        _view_classes[indv_cls] = type(name, (mixin, indv_cls), {'__slots__': slots})
+    return _view_classes[indv_cls]
+
+
+def _copy_row(row):
+    '''
+    Helper function to copy a chromsome row to a new buffer.
+    '''
+    buf = array(row.format)
+    buf.frombytes(row.cast('B'))
+    return memoryview(buf)
+
+
+def _restore_row_view(template, typecode, data):
+    '''
+    Helper function to rebuild a row view from pickled data.
+    '''
+    buf = array(typecode)
+    buf.frombytes(data)
+    return row_view_class(template.__class__)(template, memoryview(buf))
+
+
+class ArrayPopulation(Population):
+    ''' Population whose chromsomes are stored in one contiguous array
+    (uint8 for binary encoding and float64 for decimal encoding) with row
+    views as individuals.
+
+    :param indv_template: A template individual to clone all the other
+                          individuals in current population.
+    :type indv_template: :obj:`gaft.components.BinaryIndividual` or
+                         :obj:`gaft.components.DecimalIndividual`
+
+    :param size: The size of population, number of individuals in population.
+    :type size: int
+
+    .. Note::
+        All chromsomes are laid out row by row in :attr:`chromsomes`, the
+        :attr:`matrix` property provides a 2-D memoryview of it which can be
+        wrapped by other libraries (e.g. ``numpy.asarray``) without copy.
+    '''
+    def __init__(self, indv_template, size=100):
+        super(ArrayPopulation, self).__init__(indv_template, size)
+
+        if isinstance(indv_template, BinaryIndividual):
+            self.typecode = 'B'
+        elif isinstance(indv_template, DecimalIndividual):
+            self.typecode = 'd'
+        else:
+            msg = 'Unsupported individual type for array population: {}'
+            raise TypeError(msg.format(type(indv_template)))
+
+        # Chromsome length of every individual.
+        self.length = len(indv_template.chromsome)
+
+        # Row view class for individuals.
+        self._view_cls = row_view_class(indv_template.__class__)
+
+        # Flat chromsome array and row views on it.
+        self.chromsomes = array(self.typecode)
+        self._individuals = RowList(self)
+
+    @property
+    def individuals(self):
+        ''' Row views for all individuals in population, assigning an individual
+        to an index writes its chromsome to the row.
+        '''
+        return self._individuals
+
+    @individuals.setter
+    def individuals(self, indvs):
+        chromsomes = array(self.typecode)
+        for indv in indvs:
+            chromsome = indv.chromsome
+            if len(chromsome) != self.length:
+                msg = 'Invalid chromsome length {}, should be {}'
+                raise ValueError(msg.format(len(chromsome), self.length))
+            if isinstance(chromsome, memoryview):
+                chromsomes.frombytes(chromsome.cast('B'))
+            else:
+                chromsomes.extend(chromsome)
+        self._set_chromsomes(chromsomes)
+
+    def _set_chromsomes(self, chromsomes):
+        '''
+        Helper function to replace the chromsome array and rebuild row views.
+        '''
+        self.chromsomes = chromsomes
+        buf, n = memoryview(chromsomes), self.length
+        self._individuals._reset([self._view_cls(self.indv_template, buf[i*n: (i+1)*n])
+                                  for i in range(len(chromsomes)//n)])
+        self.update_flag()
+
+    @property
+    def matrix(self):
+        ''' 2-D memoryview of all chromsomes with shape (size, length).
+        '''
+        nrows = len(self.chromsomes)//self.length
+        if nrows == 0:
+            return memoryview(self.chromsomes)
+        return (memoryview(self.chromsomes).cast('B')
+                .cast(self.typecode, shape=[nrows, self.length]))
+
+    def init(self, indvs=None):
+        ''' Initialize current population with individuals.
+
+        :param indvs: Initial individuals in population, randomly initialized
+                      individuals are created if not provided.
+        :type indvs: list of Individual object
+        '''
+        if indvs is None:
+            zero = 0 if self.typecode == 'B' else 0.0
+            self._set_chromsomes(array(self.typecode, [zero])*(self.size*self.length))
+            for indv in self.individuals:
+                indv.init()
+        else:
+            # Check individuals.
+            if len(indvs) != self.size:
+                raise ValueError('Invalid individuals number')
+            for indv in indvs:
+                if not isinstance(indv, IndividualBase):
+                    raise ValueError('individual class must be subclass of IndividualBase')
+            self.individuals = indvs
+
+        self._updated = True
+
+        return self
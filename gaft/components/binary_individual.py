@@ -3,15 +3,103 @@
 
 ''' Module for Individual with binary encoding.
 '''
-from math import log2
+from math import log, log2
+from random import random, getrandbits
 from itertools import accumulate
-import logging
 
 from .individual import IndividualBase
 from ..mpiutil import MPIUtil
 
 mpi = MPIUtil()
 
+# Translation tables between bit values (0/1) and bit characters ('0'/'1').
+_BIT_CHARS = bytes.maketrans(b'\x00\x01', b'01')
+_BIT_VALUES = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def pack_bits(bits):
+    ''' Pack a sequence of bits to an integer, the first bit is the most
+    significant one.
+
+    :param bits: The bit sequence to be packed
+    :type bits: list of int or memoryview of uint8
+
+    :return: The packed integer
+    :rtype: int
+    '''
+    bit_str = bytes(bits).translate(_BIT_CHARS)
+    return int(bit_str, 2) if bit_str else 0
+
+
+def unpack_bits(n, length):
+    ''' Unpack an integer to a list of bits with a specific length.
+
+    :param n: The integer to be unpacked
+    :type n: int
+
+    :param length: The length of the bit sequence
+    :type length: int
+
+    :return: The bit sequence
+    :rtype: list of int
+    '''
+    if length == 0:
+        return []
+    return list('{:0>{}b}'.format(n, length).encode().translate(_BIT_VALUES))
+
+
+def random_mask(length, p):
+    ''' Create a random bit mask in which each bit is set with probability p.
+
+    :param length: The number of bits in mask
+    :type length: int
+
+    :param p: The probability of a bit to be set
+    :type p: float in range [0.0, 1.0]
+
+    :return: The bit mask
+    :rtype: int
+    '''
+    if p >= 1.0:
+        return (1 << length) - 1
+    if p <= 0.0 or length == 0:
+        return 0
+    if p == 0.5:
+        return getrandbits(length)
+
+    # Skip over unset bits with geometric distributed gaps.
+    mask, log_q = 0, log(1.0 - p)
+    i = int(log(1.0 - random())/log_q)
+    while i < length:
+        mask |= 1 << i
+        i += 1 + int(log(1.0 - random())/log_q)
+    return mask
+
+
+class ChromsomeView(list):
+    ''' List view of the packed chromsome of a binary individual, bits written
+    by index or slice are packed into the individual at once.
+
+    :param indv: The individual whose packed chromsome is viewed
+    :type indv: :obj:`gaft.components.BinaryIndividual`
+
+    .. Note::
+        Only the latest view of an individual writes through, a view is
+        detached once the bits of its individual are assigned.
+    '''
+    __slots__ = ('_indv',)
+
+    def __init__(self, indv):
+        super(ChromsomeView, self).__init__(unpack_bits(indv.bits, indv.length))
+        self._indv = indv
+
+    def __setitem__(self, key, value):
+        super(ChromsomeView, self).__setitem__(key, value)
+        indv = self._indv
+        if indv._chromsome is self:
+            # NOTE: Current view is kept for the repacked bits.
+            indv._bits, indv._solution = pack_bits(self), None
+
 
 class BinaryIndividual(IndividualBase):
     '''
@@ -29,50 +117,200 @@ class BinaryIndividual(IndividualBase):
         The decrete precisions for different components in varants may be
         adjusted automatically (possible precision loss) if eps and ranges
         are not appropriate.
+
+    .. Note:
+
+        The chromsome is packed in an integer :attr:`bits` whose most significant
+        bit is the first gene bit, :attr:`chromsome` is a list view of it
+        created on demand and cached until the bits are assigned. Genes written
+        to the view in place are packed into the bits.
     '''
+    __slots__ = ('_bits', 'length')
+
     def __init__(self, ranges, eps=0.001):
-        super(self.__class__, self).__init__(ranges, eps)
+        super(BinaryIndividual, self).__init__(ranges, eps)
+
+        # Initialize individual randomly.
+        self.init()
 
-        # Lengths for all binary sequence in chromsome and adjusted decrete precisions.
-        self.lengths = []
+    def create_spec(self, ranges, eps):
+        ''' Create the gene specification with lengths of all binary sequences
+        in chromsome and adjusted decrete precisions.
+        '''
+        spec = super(BinaryIndividual, self).create_spec(ranges, eps)
 
-        for i, ((a, b), eps) in enumerate(zip(self.ranges, self.eps)):
+        lengths, precisions = [], []
+        for (a, b), eps in zip(spec.ranges, spec.eps):
             length = int(log2((b - a)/eps))
-            precision = (b - a)/(2**length)
-            self.lengths.append(length)
-            self.precisions[i] = precision
+            lengths.append(length)
+            precisions.append((b - a)/(2**length))
 
         # The start and end indices for each gene segment for entries in solution.
-        self.gene_indices = self._get_gene_indices()
+        gene_indices = self._get_gene_indices(lengths)
 
-        # Initialize individual randomly.
-        self.init()
+        return spec.replace(precisions=tuple(precisions), lengths=tuple(lengths),
+                            gene_indices=gene_indices, length=sum(lengths))
+
+    @property
+    def lengths(self):
+        ''' Lengths for all binary sequence in chromsome.
+        '''
+        return self.spec.lengths
+
+    @property
+    def gene_indices(self):
+        ''' The start and end indices for each gene segment in chromsome.
+        '''
+        return self.spec.gene_indices
+
+    @property
+    def bits(self):
+        ''' The packed chromsome.
+        '''
+        return self._bits
+
+    @bits.setter
+    def bits(self, bits):
+        self._bits = bits
+        # Chromsome view and solution are out of date.
+        self._chromsome, self._solution = None, None
+
+    @property
+    def chromsome(self):
+        ''' List view of the packed chromsome.
+        '''
+        if self._chromsome is None:
+            self._chromsome = ChromsomeView(self)
+        return self._chromsome
+
+    @chromsome.setter
+    def chromsome(self, chromsome):
+        self.bits, self.length = pack_bits(chromsome), len(chromsome)
+
+    def init(self, chromsome=None, solution=None, bits=None):
+        ''' Initialize the individual by providing chromsome, solution or packed
+        chromsome bits.
+
+        :param chromsome: chromesome sequence for the individual
+        :type chromsome: list of int
+
+        :param solution: the variable vector of the target function.
+        :type solution: list of float
+
+        :param bits: the packed chromsome
+        :type bits: int
+
+        .. Note::
+            The priority is bits > chromsome > solution. If none is provided,
+            individual would be initialized randomly.
+        '''
+        # Solution would be decoded on demand.
+        if bits is not None:
+            self.bits, self.length = bits, self.spec.length
+        elif chromsome:
+            self.chromsome = chromsome
+        else:
+            solution = solution if solution else self._rand_solution()
+            self.solution = solution
+            self.bits, self.length = self.encode_bits(), self.spec.length
+            # NOTE: Keep the provided solution instead of the decoded one.
+            self.solution = solution
+
+        return self
+
+    def clone(self):
+        ''' Clone a new individual from current one with the immutable packed
+        chromsome shared and the solution copied.
+        '''
+        indv = self._empty()
+        indv._bits, indv.length = self._bits, self.length
+        indv._chromsome = None
+        indv._solution = None if self._solution is None else list(self._solution)
+        return indv
+
+    def chromsome_bytes(self):
+        ''' Serialize the packed chromsome to big-endian bytes with fixed size
+        for communication.
+        '''
+        return self.bits.to_bytes((self.spec.length + 7)//8, 'big')
+
+    def from_chromsome_bytes(self, data):
+        ''' Create a new individual sharing the gene specification with current
+        one from the serialized packed chromsome.
+        '''
+        return self._empty().init(bits=int.from_bytes(data, 'big'))
 
     def encode(self):
         ''' Encode solution to gene sequence in individual using different encoding.
         '''
-        chromsome = []
+        return unpack_bits(self.encode_bits(), self.length)
+
+    def encode_bits(self):
+        ''' Encode solution to packed chromsome.
+        '''
+        bits = 0
         for var, (a, _), length, eps in zip(self.solution, self.ranges,
                                             self.lengths, self.precisions):
-            chromsome.extend(self.binarize(var-a, eps, length))
+            # NOTE: The upper bound of range can not be represented with length bits.
+            n = min(int((var - a)/eps), (1 << length) - 1)
+            bits = (bits << length) | n
 
-        return chromsome
+        return bits
 
     def decode(self):
         ''' Decode gene sequence to solution of target function.
         '''
-        solution =  [self.decimalize(self.chromsome[start: end], eps, lower_bound)
-                     for (start, end), (lower_bound, _), eps in
-                     zip(self.gene_indices, self.ranges, self.precisions)]
+        return self._decimalize_bits(self._plain_bits(self.bits))
+
+    def decode_many(self, individuals):
+        ''' Decode solutions of individuals sharing the gene specification with
+        current one at once, gene segment metadata is prepared only once.
+
+        :param individuals: The individuals to be decoded
+        :type individuals: list of :obj:`gaft.components.BinaryIndividual`
+
+        :return: Solutions of all individuals
+        :rtype: list of list of float
+        '''
+        segments = [(end, (1 << (end - start)) - 1, lower_bound, eps)
+                    for (start, end), (lower_bound, _), eps in
+                    zip(self.gene_indices, self.ranges, self.precisions)]
+        plain_bits, spec = self._plain_bits, self.spec
+
+        solutions = []
+        for indv in individuals:
+            if indv._solution is None and indv.spec is spec:
+                bits, length = plain_bits(indv.bits), indv.length
+                indv._solution = [lower_bound + ((bits >> (length - end)) & mask)*eps
+                                  for end, mask, lower_bound, eps in segments]
+            solutions.append(indv.solution)
+
+        return solutions
+
+    def _plain_bits(self, bits):
+        '''
+        Helper function to convert the packed chromsome to plain binary genes.
+        '''
+        return bits
+
+    def _decimalize_bits(self, bits):
+        '''
+        Helper function to convert packed binary genes to solution.
+        '''
+        length = self.length
+        solution = [lower_bound + ((bits >> (length - end)) & ((1 << (end - start)) - 1))*eps
+                    for (start, end), (lower_bound, _), eps in
+                    zip(self.gene_indices, self.ranges, self.precisions)]
         return solution
 
-    def _get_gene_indices(self):
+    @staticmethod
+    def _get_gene_indices(lengths):
         '''
         Helper function to get gene slice indices.
         '''
-        end_indices = list(accumulate(self.lengths))
+        end_indices = list(accumulate(lengths))
         start_indices = [0] + end_indices[: -1]
-        return list(zip(start_indices, end_indices))
+        return tuple(zip(start_indices, end_indices))
 
     @staticmethod
     def binarize(decimal, eps, length):
@@ -87,9 +325,9 @@ class BinaryIndividual(IndividualBase):
         :param length: the length of binary sequence.
         :type length: int
         '''
-        n = int(decimal/eps)
-        bin_str = '{:0>{}b}'.format(n, length)
-        return [int(i) for i in bin_str]
+        # NOTE: The upper bound of range can not be represented with length bits.
+        n = min(int(decimal/eps), 2**length - 1)
+        return unpack_bits(n, length)
 
     @staticmethod
     def decimalize(binary, eps, lower_bound):
@@ -104,6 +342,68 @@ class BinaryIndividual(IndividualBase):
         :param lower_bound: the lower bound for decimal number
         :type lower_bound: float
         '''
-        bin_str = ''.join([str(bit) for bit in binary])
-        return lower_bound + int(bin_str, 2)*eps
+        return lower_bound + pack_bits(binary)*eps
+
+
+class GrayBinaryIndividual(BinaryIndividual):
+    '''
+    Individual with Gray encoding in which adjacent values differ in only one
+    bit. The chromsome layout (lengths and gene_indices) is the same as
+    :obj:`BinaryIndividual`.
+
+    :param ranges: value ranges for all entries in solution.
+    :type ranges: tuple list
+
+    :param eps: decrete precisions for binary encoding, default is 0.001.
+    :type eps: float or float list (with the same length with ranges)
+    '''
+    __slots__ = ()
+
+    def create_spec(self, ranges, eps):
+        ''' Create the gene specification with masks for Gray decoding.
+        '''
+        spec = super(GrayBinaryIndividual, self).create_spec(ranges, eps)
+        return spec.replace(gray_masks=self._get_gray_masks(spec.lengths))
+
+    @property
+    def gray_masks(self):
+        ''' Masks for shifts 1, 2, 4... in Gray decoding.
+        '''
+        return self.spec.gray_masks
+
+    def encode_bits(self):
+        ''' Encode solution to packed chromsome with Gray encoding.
+        '''
+        bits = super(GrayBinaryIndividual, self).encode_bits()
+        # Gray code of a segment: g = b ^ (b >> 1)
+        _, mask = self.gray_masks[0]
+        return bits ^ ((bits >> 1) & mask)
+
+    def _plain_bits(self, bits):
+        '''
+        Helper function to convert Gray genes to plain binary genes.
+        '''
+        # Prefix XOR in all segments at the same time: b = g ^ (g >> 1) ^ (g >> 2) ^ ...
+        for shift, mask in self.gray_masks:
+            bits ^= (bits >> shift) & mask
+        return bits
+
+    @staticmethod
+    def _get_gray_masks(lengths):
+        '''
+        Helper function to get masks for shifts 1, 2, 4... which keep the
+        shifted bits inside their own gene segments.
+        '''
+        masks = []
+        shift = 1
+        while shift < max(max(lengths), 2):
+            mask = 0
+            for length in lengths:
+                # Bits in a segment except its highest shift bits.
+                n = max(length - shift, 0)
+                mask = (mask << length) | ((1 << n) - 1)
+            masks.append((shift, mask))
+            shift <<= 1
+        return tuple(masks)
+
 
@@ -15,18 +15,20 @@ class DecimalIndividual(IndividualBase):
     :param eps: decrete precisions for binary encoding, default is 0.001.
     :type eps: float or float list (with the same length with ranges)
     '''
+    __slots__ = ()
+
     def __init__(self, ranges, eps=0.001):
-        super(self.__class__, self).__init__(ranges, eps)
+        super(DecimalIndividual, self).__init__(ranges, eps)
         # Initialize it randomly.
         self.init()
 
     def encode(self):
         ''' Encode solution to gene sequence
         '''
-        return self.solution
+        return list(self.solution)
 
     def decode(self):
         ''' Decode gene sequence to decimal solution
         '''
-        return self.solution
+        return list(self.chromsome)
 
@@ -2,20 +2,67 @@
 # -*- coding: utf-8 -*-
 
 from random import uniform
+from array import array
 from copy import deepcopy
 
 
-class SolutionRanges(object):
-    ''' Descriptor for solution ranges.
+class GeneSpec(object):
+    ''' Immutable gene specification (solution ranges, decrete precisions and
+    other encoding metadata) shared by a template individual and all individuals
+    cloned from it.
+
+    :param ranges: value ranges for all entries in solution.
+    :type ranges: tuple list
+
+    :param eps: decrete precisions provided by users.
+    :type eps: float or float list (with the same length with ranges)
+
+    :param precisions: actual decrete precisions used in GA, eps is used if not
+                       provided.
+    :type precisions: float list
+
+    :param metadata: Other encoding metadata, e.g. lengths of gene segments.
     '''
-    def __init__(self):
-        self.__ranges = []
+    def __init__(self, ranges, eps, precisions=None, **metadata):
+        ranges = self._check_ranges(ranges)
+        eps = self._check_precisions(eps, ranges)
+        precisions = eps if precisions is None else tuple(precisions)
+
+        fields = dict(metadata, ranges=ranges, eps=eps, precisions=precisions)
+        self.__dict__.update(fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('GeneSpec is immutable')
 
-    def __get__(self, obj, owner):
-        return self.__ranges
+    def __delattr__(self, name):
+        raise AttributeError('GeneSpec is immutable')
 
-    def __set__(self, obj, ranges):
-        # Check.
+    def __eq__(self, other):
+        return isinstance(other, GeneSpec) and self.__dict__ == other.__dict__
+
+    def __hash__(self):
+        return hash((self.ranges, self.eps, self.precisions))
+
+    def __repr__(self):
+        fields = ', '.join('{}={!r}'.format(k, v) for k, v in sorted(self.__dict__.items()))
+        return 'GeneSpec({})'.format(fields)
+
+    def __reduce__(self):
+        metadata = {k: v for k, v in self.__dict__.items()
+                    if k not in ('ranges', 'eps', 'precisions')}
+        return (_restore_gene_spec, (self.ranges, self.eps, self.precisions, metadata))
+
+    def replace(self, **fields):
+        ''' Create a new gene specification with some fields replaced.
+        '''
+        kwargs = dict(self.__dict__, **fields)
+        return self.__class__(**kwargs)
+
+    @staticmethod
+    def _check_ranges(ranges):
+        '''
+        Helper function to check solution ranges.
+        '''
         if type(ranges) not in [tuple, list]:
             raise TypeError('solution ranges must be a list of range tuples')
         for rng in ranges:
@@ -26,32 +73,31 @@ class SolutionRanges(object):
             a, b = rng
             if a >= b:
                 raise ValueError('Wrong range value {}'.format(rng))
-        # Assignment.
-        self.__ranges = ranges
+        return tuple(tuple(rng) for rng in ranges)
 
-
-class DecretePrecision(object):
-    ''' Descriptor for individual decrete precisions.
-    '''
-    def __init__(self):
-        self.__precisions = []
-
-    def __get__(self, obj, owner):
-        return self.__precisions
-
-    def __set__(self, obj, precisions):
+    @staticmethod
+    def _check_precisions(precisions, ranges):
+        '''
+        Helper function to check decrete precisions.
+        '''
         if type(precisions) in [int, float]:
-            precisions = [precisions]*len(obj.ranges)
-        # Check.
+            precisions = [precisions]*len(ranges)
         if type(precisions) not in [tuple, list]:
             raise TypeError('precisions must be a list of numbers')
-        if len(precisions) != len(obj.ranges):
+        if len(precisions) != len(ranges):
             raise ValueError('Lengths of eps and ranges should be the same')
-        for (a, b), eps in zip(obj.ranges, precisions):
+        for (a, b), eps in zip(ranges, precisions):
             if eps > (b - a):
                 msg = 'Invalid precision {} in range ({}, {})'.format(eps, a, b)
                 raise ValueError(msg)
-        self.__precisions = precisions
+        return tuple(precisions)
+
+
+def _restore_gene_spec(ranges, eps, precisions, metadata):
+    '''
+    Helper function to rebuild a gene specification from pickled data.
+    '''
+    return GeneSpec(ranges, eps, precisions, **metadata)
 
 
 class IndividualBase(object):
@@ -62,22 +108,78 @@ class IndividualBase(object):
 
     :param eps: decrete precisions for binary encoding, default is 0.001.
     :type eps: float or float list (with the same length with ranges)
-    '''
-    # Solution ranges.
-    ranges = SolutionRanges()
 
-    # Orginal decrete precisions (provided by users).
-    eps = DecretePrecision()
-    
-    # Actual decrete precisions used in GA.
-    precisions = DecretePrecision()
+    .. Note::
+        The gene specification is validated and created only once in the
+        constructor and shared by all cloned individuals.
+    '''
+    __slots__ = ('spec', '_solution', '_chromsome')
 
     def __init__(self, ranges, eps):
-        self.ranges = ranges
-        self.eps = eps
-        self.precisions = eps
+        self.spec = self.create_spec(ranges, eps)
+        self.chromsome, self.solution = [], []
 
-        self.solution, self.chromsome = [], []
+    def create_spec(self, ranges, eps):
+        ''' Create the gene specification of the individual, override it to
+        add encoding metadata.
+
+        :param ranges: value ranges for all entries in solution.
+        :type ranges: tuple list
+
+        :param eps: decrete precisions for binary encoding.
+        :type eps: float or float list (with the same length with ranges)
+
+        :return: The gene specification
+        :rtype: :obj:`gaft.components.GeneSpec`
+        '''
+        return GeneSpec(ranges, eps)
+
+    @property
+    def ranges(self):
+        ''' Solution ranges.
+        '''
+        return self.spec.ranges
+
+    @property
+    def eps(self):
+        ''' Orginal decrete precisions (provided by users).
+        '''
+        return self.spec.eps
+
+    @property
+    def precisions(self):
+        ''' Actual decrete precisions used in GA.
+        '''
+        return self.spec.precisions
+
+    @property
+    def chromsome(self):
+        ''' The chromsome sequence of the individual.
+
+        .. Note::
+            The solution is decoded again only after a chromsome is assigned,
+            assign the chromsome after modifying it in place.
+        '''
+        return self._chromsome
+
+    @chromsome.setter
+    def chromsome(self, chromsome):
+        self._chromsome = chromsome
+        # Solution is out of date.
+        self._solution = None
+
+    @property
+    def solution(self):
+        ''' The solution decoded from chromsome, it is decoded lazily and cached
+        until the chromsome is changed.
+        '''
+        if self._solution is None:
+            self._solution = self.decode()
+        return self._solution
+
+    @solution.setter
+    def solution(self, solution):
+        self._solution = solution
 
     def init(self, chromsome=None, solution=None):
         ''' Initialize the individual by providing chromsome or solution.
@@ -92,25 +194,82 @@ class IndividualBase(object):
             If both chromsome and solution are provided, only the chromsome would
             be used. If neither is provided, individual would be initialized randomly.
         '''
-        if not any([chromsome, solution]):
-            self.solution = self._rand_solution()
-            self.chromsome = self.encode()
-        elif chromsome:
+        if chromsome:
+            # Solution would be decoded on demand.
             self.chromsome = chromsome
-            self.solution = self.decode()
-        else:
-            self.solution = solution
-            self.chromsome = self.encode()
+            return self
+
+        solution = solution if solution else self._rand_solution()
+        self.solution = solution
+        self.chromsome = self.encode()
+        # NOTE: Keep the provided solution instead of the decoded one.
+        self.solution = solution
 
         return self
 
     def clone(self):
-        ''' Clone a new individual from current one.
+        ''' Clone a new individual from current one, the gene specification is
+        shared and no validation or random initialization is done.
+
+        .. Note::
+            The chromsome and the decoded solution are copied when cloning, so
+            that modifying the clone in place never changes current individual.
+        '''
+        indv = self._empty()
+        indv.chromsome = list(self.chromsome)
+        if self._solution is not None:
+            indv._solution = list(self._solution)
+        return indv
+
+    def _empty(self):
         '''
-        indv = self.__class__(deepcopy(self.ranges), eps=deepcopy(self.eps))
-        indv.init(chromsome=deepcopy(self.chromsome))
+        Helper function to create an uninitialized individual sharing the gene
+        specification with current one, other attributes in instance dict of
+        subclasses are deep copied.
+        '''
+        indv = self.__class__.__new__(self.__class__)
+        indv.spec = self.spec
+        if hasattr(self, '__dict__'):
+            indv.__dict__.update(deepcopy(self.__dict__))
         return indv
 
+    def chromsome_bytes(self):
+        ''' Serialize the chromsome to bytes with fixed size for communication.
+
+        .. Note::
+            Genes are stored as float64 by default, override it (and
+            :meth:`from_chromsome_bytes`) for other encodings.
+
+        :return: The serialized chromsome
+        :rtype: bytes
+        '''
+        return array('d', self.chromsome).tobytes()
+
+    def from_chromsome_bytes(self, data):
+        ''' Create a new individual sharing the gene specification with current
+        one from the serialized chromsome.
+
+        :param data: The serialized chromsome
+        :type data: bytes-like object
+
+        :return: The new individual
+        :rtype: :obj:`gaft.components.IndividualBase`
+        '''
+        chromsome = array('d')
+        chromsome.frombytes(data)
+        return self._empty().init(chromsome=chromsome.tolist())
+
+    def decode_many(self, individuals):
+        ''' Decode solutions of individuals sharing the gene specification with
+        current one at once, decoded solutions are cached in individuals.
+
+        :param individuals: The individuals to be decoded
+        :type individuals: list of :obj:`gaft.components.IndividualBase`
+
+        :return: Solutions of all individuals
+        :rtype: list of list of float
+        '''
+        return [indv.solution for indv in individuals]
 
     def encode(self):
         ''' **NEED IMPLIMENTATION**
@@ -142,4 +301,3 @@ class IndividualBase(object):
             solution.append(a + n*eps)
         return solution
 
-
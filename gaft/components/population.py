@@ -1,35 +1,116 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from math import sqrt
+from functools import partial
+from collections import namedtuple
+
 from .individual import IndividualBase
 
+# Statistics of fitness values in population.
+Statistics = namedtuple('Statistics', ['max', 'min', 'mean', 'std', 'argmax', 'argmin'])
+
 
 class Memoized(object):
     ''' Descriptor for population statistical varibles caching.
+
+    .. Note::
+        Results are cached in each population for all fitness functions and
+        are invalidated once the version of population changes.
     '''
     def __init__(self, func):
         self.func = func
-        self.result = None
-        self.fitness = None
+        self.name = '_{}_cache'.format(func.__name__)
 
     def __get__(self, instance, cls):
-        self.instance = instance
-        return self
+        if instance is None:
+            return self
+        return partial(self.__call__, instance)
 
-    def __call__(self, fitness):
-        if ((not self.instance.updated)          # population not changed
-                and (self.result is not None)    # result already cached
-                and (fitness == self.fitness)):  # fitness not changed
+    def __call__(self, instance, fitness):
+        cache = instance.__dict__.setdefault(self.name, {})
+        version = instance.version
+
+        entry = cache.get(fitness)
+        if entry is not None and entry[0] == version:
             # Return cached result directly.
-            return self.result
-        else:
-            # Update fitness function.
-            self.fitness = fitness
-            # Update and memoize result.
-            self.result = self.func(self.instance, fitness)
-            # Recover flag.
-            self.instance._updated = False
-            return self.result
+            return entry[1]
+
+        # Drop results for previous versions.
+        for fn in [fn for fn, (v, _) in cache.items() if v != version]:
+            del cache[fn]
+
+        # Update and memoize result.
+        result = self.func(instance, fitness)
+        cache[fitness] = (version, result)
+        # Recover flag.
+        instance._updated = False
+
+        return result
+
+
+class IndvList(list):
+    ''' A proxy class inherited from built-in list to contain all individuals
+    which can update the population flag and version automatically when its
+    content is changed.
+
+    :param population: The population the individuals belong to
+    :type population: :obj:`gaft.components.Population`
+    '''
+    def __init__(self, population, *args):
+        super(IndvList, self).__init__(*args)
+        self.population = population
+
+    def __setitem__(self, key, value):
+        super(IndvList, self).__setitem__(key, value)
+        self.population.update_flag()
+
+    def __delitem__(self, key):
+        super(IndvList, self).__delitem__(key)
+        self.population.update_flag()
+
+    def __iadd__(self, other):
+        result = super(IndvList, self).__iadd__(other)
+        self.population.update_flag()
+        return result
+
+    def __imul__(self, n):
+        result = super(IndvList, self).__imul__(n)
+        self.population.update_flag()
+        return result
+
+    def append(self, item):
+        super(IndvList, self).append(item)
+        self.population.update_flag()
+
+    def extend(self, iterable_item):
+        super(IndvList, self).extend(iterable_item)
+        self.population.update_flag()
+
+    def insert(self, index, item):
+        super(IndvList, self).insert(index, item)
+        self.population.update_flag()
+
+    def pop(self, *args):
+        item = super(IndvList, self).pop(*args)
+        self.population.update_flag()
+        return item
+
+    def remove(self, item):
+        super(IndvList, self).remove(item)
+        self.population.update_flag()
+
+    def clear(self):
+        super(IndvList, self).clear()
+        self.population.update_flag()
+
+    def sort(self, *args, **kwargs):
+        super(IndvList, self).sort(*args, **kwargs)
+        self.population.update_flag()
+
+    def reverse(self):
+        super(IndvList, self).reverse()
+        self.population.update_flag()
 
 
 class Individuals(object):
@@ -46,7 +127,7 @@ class Individuals(object):
         return instance.__dict__[self.name]
 
     def __set__(self, instance, value):
-        instance.__dict__[self.name] = value
+        instance.__dict__[self.name] = IndvList(instance, value)
         # Update flag.
         instance.update_flag()
 
@@ -73,48 +154,12 @@ class Population(object):
         # Template individual.
         self.indv_template = indv_template
 
-        # Flag for monitoring changes of population.
+        # Flag and version for monitoring changes of population.
         self._updated = False
+        self._version = 0
 
         # Container for all individuals.
-        class IndvList(list):
-            ''' A proxy class inherited from built-in list to contain all
-            individuals which can update the population._updated flag
-            automatically when its content is changed.
-            '''
-            # {{{
-            # NOTE: Use 'this' here to avoid name conflict.
-            def __init__(this, *args):
-                super(this.__class__, this).__init__(*args)
-
-            def __setitem__(this, key, value):
-                '''
-                Override __setitem__ in built-in list type.
-                '''
-                old_value = this[key]
-                if old_value == value:
-                    return
-                super(this.__class__, self).__setitem__(key, value)
-                # Update population flag.
-                self.update_flag()
-
-            def append(this, item):
-                '''
-                Override append method of built-in list type.
-                '''
-                super(this.__class__, this).append(item)
-                # Update population flag.
-                self.update_flag()
-
-            def extend(this, iterable_item):
-                if not iterable_item:
-                    return
-                super(this.__class__, this).extend(iterable_item)
-                # Update population flag.
-                self.update_flag()
-            # }}}
-
-        self._individuals = IndvList()
+        self._individuals = IndvList(self)
 
     def init(self, indvs=None):
         ''' Initialize current population with individuals.
@@ -123,12 +168,10 @@ class Population(object):
                       individuals are created if not provided.
         :type indvs: list of Individual object
         '''
-        IndvType = self.indv_template.__class__
-
         if indvs is None:
             for _ in range(self.size):
-                indv = IndvType(ranges=self.indv_template.ranges,
-                                eps=self.indv_template.eps)
+                # Share gene specification with the template.
+                indv = self.indv_template.clone().init()
                 self.individuals.append(indv)
         else:
             # Check individuals.
@@ -144,9 +187,11 @@ class Population(object):
         return self
 
     def update_flag(self):
-        ''' Interface for updating individual update flag to True.
+        ''' Interface for updating individual update flag to True and
+        increasing the version of population.
         '''
         self._updated = True
+        self._version += 1
 
     @property
     def updated(self):
@@ -154,6 +199,13 @@ class Population(object):
         '''
         return self._updated
 
+    @property
+    def version(self):
+        ''' Query function for population version which is increased once the
+        individuals in population are changed.
+        '''
+        return self._version
+
     def new(self):
         ''' Create a new emtpy population.
         '''
@@ -183,9 +235,7 @@ class Population(object):
         :return: the best individual in current population
         :rtype: :obj:`gaft.components.IndividualBase`
         '''
-        all_fits = self.all_fits(fitness)
-        return max(self.individuals,
-                   key=lambda indv: all_fits[self.individuals.index(indv)])
+        return self.individuals[self.argmax(fitness)]
 
     def worst_indv(self, fitness):
         ''' The individual with the worst fitness.
@@ -196,9 +246,56 @@ class Population(object):
         :return: the worst individual in current population
         :rtype: :obj:`gaft.components.IndividualBase`
         '''
+        return self.individuals[self.argmin(fitness)]
+
+    def argmax(self, fitness):
+        ''' The index of the individual with the best fitness.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: The index of the best individual
+        :rtype: int
+        '''
+        return self.statistics(fitness).argmax
+
+    def argmin(self, fitness):
+        ''' The index of the individual with the worst fitness.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: The index of the worst individual
+        :rtype: int
+        '''
+        return self.statistics(fitness).argmin
+
+    @Memoized
+    def argsort(self, fitness):
+        ''' The indices of individuals sorted by fitness in ascending order.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: Indices of individuals from the worst to the best
+        :rtype: list of int
+        '''
         all_fits = self.all_fits(fitness)
-        return min(self.individuals,
-                   key=lambda indv: all_fits[self.individuals.index(indv)])
+        return sorted(range(len(all_fits)), key=all_fits.__getitem__)
+
+    def fitness_of(self, index, fitness):
+        ''' Get the fitness value of the individual with a specific index.
+
+        :param index: The index of the individual
+        :type index: int
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: The fitness value
+        :rtype: float
+        '''
+        return self.all_fits(fitness)[index]
 
     def max(self, fitness):
         ''' Get the maximum fitness value in population.
@@ -234,6 +331,27 @@ class Population(object):
         all_fits = self.all_fits(fitness)
         return sum(all_fits)/len(all_fits)
 
+    @Memoized
+    def statistics(self, fitness):
+        ''' Get the maximum, minimum, average, standard deviation and the
+        indices of the maximum and minimum of fitness values in population
+        with one evaluation of all fitness values.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: Statistics of fitness values
+        :rtype: :obj:`gaft.components.population.Statistics`
+        '''
+        all_fits = self.all_fits(fitness)
+
+        fmax, fmin = max(all_fits), min(all_fits)
+        fmean = sum(all_fits)/len(all_fits)
+        fstd = sqrt(sum([(f - fmean)**2 for f in all_fits])/len(all_fits))
+
+        return Statistics(max=fmax, min=fmin, mean=fmean, std=fstd,
+                          argmax=all_fits.index(fmax), argmin=all_fits.index(fmin))
+
     @Memoized
     def all_fits(self, fitness):
         ''' Get all fitness values in population.
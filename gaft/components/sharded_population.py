@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Module for population distributed as shards in MPI processes.
+'''
+
+from math import sqrt, inf
+from bisect import bisect_right
+
+from .individual import IndividualBase
+from .population import Population, Statistics, Memoized
+from ..mpiutil import MPIUtil
+
+mpi = MPIUtil()
+
+
+class ShardedPopulation(Population):
+    ''' Population whose individuals are distributed in all MPI processes, each
+    process holds only a shard of the population, so the memory in a process
+    scales with size/processes instead of size.
+
+    Individuals are indexed globally in rank order, the shard in current process
+    contains the individuals from ``offset`` to ``offset + shard_size``.
+
+    Statistical queries (:meth:`statistics`, :meth:`max`, :meth:`min`,
+    :meth:`mean`, :meth:`argmax`, :meth:`argmin`, :meth:`best_indv` and
+    :meth:`worst_indv`) are about the whole population and are collective
+    operations which must be called in all processes. The results are memoized
+    until the shard changes, :obj:`gaft.sharded_engine.ShardedEngine` computes
+    them in all processes in every generation so that analysis plugins only
+    running in master process can query them.
+
+    Other methods (:meth:`all_fits`, :meth:`argsort`, :meth:`fitness_of` and
+    indexing) work on the shard in current process only.
+
+    :param indv_template: A template individual to clone all the other
+                          individuals in current population.
+    :type indv_template: :obj:`gaft.components.IndividualBase`
+
+    :param size: The size of the whole population.
+    :type size: int
+    '''
+    def __init__(self, indv_template, size=100):
+        super(ShardedPopulation, self).__init__(indv_template, size)
+
+        # Shard sizes and offsets of all processes.
+        self.shard_sizes = [size//mpi.size + (1 if rank < size % mpi.size else 0)
+                            for rank in range(mpi.size)]
+        self.offsets = [sum(self.shard_sizes[: rank]) for rank in range(mpi.size)]
+
+    @property
+    def shard_size(self):
+        ''' The number of individuals in current process.
+        '''
+        return self.shard_sizes[mpi.rank]
+
+    @property
+    def offset(self):
+        ''' The global index of the first individual in current process.
+        '''
+        return self.offsets[mpi.rank]
+
+    def init(self, indvs=None):
+        ''' Initialize the shard in current process with individuals.
+
+        :param indvs: Initial individuals in the shard, randomly initialized
+                      individuals are created if not provided.
+        :type indvs: list of Individual object
+        '''
+        if indvs is None:
+            indvs = [self.indv_template.clone().init() for _ in range(self.shard_size)]
+        else:
+            # Check individuals.
+            if len(indvs) != self.shard_size:
+                raise ValueError('Invalid individuals number')
+            for indv in indvs:
+                if not isinstance(indv, IndividualBase):
+                    raise ValueError('individual class must be subclass of IndividualBase')
+
+        self.individuals = indvs
+        self._updated = True
+
+        return self
+
+    def owner(self, index):
+        ''' The rank of the process holding the individual with a global index.
+
+        :param index: The global index of the individual
+        :type index: int
+
+        :return: The rank of the owner process
+        :rtype: int
+        '''
+        if index < 0 or index >= self.size:
+            raise IndexError('Individual index({}) out of range'.format(index))
+        return bisect_right(self.offsets, index) - 1
+
+    def local_index(self, index):
+        ''' The index in the shard of current process of an individual with a
+        global index, None is returned if it is in other processes.
+
+        :param index: The global index of the individual
+        :type index: int
+
+        :rtype: int or None
+        '''
+        if self.owner(index) != mpi.rank:
+            return None
+        return index - self.offset
+
+    def fetch(self, index):
+        ''' Get the individual with a global index from its owner process, it
+        must be called in all processes.
+
+        :param index: The global index of the individual
+        :type index: int
+
+        :return: The individual
+        :rtype: :obj:`gaft.components.IndividualBase`
+        '''
+        owner = self.owner(index)
+        if mpi.size == 1:
+            return self.individuals[index]
+
+        if owner == mpi.rank:
+            indv = self.individuals[index - self.offset]
+            mpi.bcast(indv.chromsome_bytes(), root=owner)
+            return indv
+
+        data = mpi.bcast(None, root=owner)
+        return self.indv_template.from_chromsome_bytes(data)
+
+    @Memoized
+    def best_indv(self, fitness):
+        ''' The individual with the best fitness in the whole population, it
+        is fetched from its owner process.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: the best individual in current population
+        :rtype: :obj:`gaft.components.IndividualBase`
+        '''
+        return self.fetch(self.argmax(fitness))
+
+    @Memoized
+    def worst_indv(self, fitness):
+        ''' The individual with the worst fitness in the whole population, it
+        is fetched from its owner process.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: the worst individual in current population
+        :rtype: :obj:`gaft.components.IndividualBase`
+        '''
+        return self.fetch(self.argmin(fitness))
+
+    def max(self, fitness):
+        ''' Get the maximum fitness value in the whole population.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: The maximum fitness value
+        :rtype: float
+        '''
+        return self.statistics(fitness).max
+
+    def min(self, fitness):
+        ''' Get the minimum fitness value in the whole population.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: The minimum fitness value
+        :rtype: float
+        '''
+        return self.statistics(fitness).min
+
+    def mean(self, fitness):
+        ''' Get the average fitness value in the whole population.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: The average fitness value
+        :rtype: float
+        '''
+        return self.statistics(fitness).mean
+
+    @Memoized
+    def statistics(self, fitness):
+        ''' Get the maximum, minimum, average, standard deviation and the
+        global indices of the maximum and minimum of fitness values in the
+        whole population with reductions of statistics of all shards.
+
+        :param fitness: Fitness function to calculate fitness value
+        :type fitness: function
+
+        :return: Statistics of fitness values
+        :rtype: :obj:`gaft.components.population.Statistics`
+        '''
+        all_fits = self.all_fits(fitness)
+
+        n, fsum, fsqsum = mpi.allreduce([len(all_fits), sum(all_fits),
+                                         sum([f**2 for f in all_fits])], op='sum')
+        fmean = fsum/n
+        fstd = sqrt(max(fsqsum/n - fmean**2, 0.0))
+
+        # NOTE: Empty shards are ignored in reductions of extrema.
+        if all_fits:
+            fmax, fmin = max(all_fits), min(all_fits)
+        else:
+            fmax, fmin = -inf, inf
+        fmax, neg_fmin = mpi.allreduce([fmax, -fmin], op='max')
+        fmin = -neg_fmin
+
+        # The first global indices of extrema.
+        argmax = self.offset + all_fits.index(fmax) if fmax in all_fits else inf
+        argmin = self.offset + all_fits.index(fmin) if fmin in all_fits else inf
+        argmax, argmin = mpi.allreduce([argmax, argmin], op='min')
+
+        return Statistics(max=fmax, min=fmin, mean=fmean, std=fstd,
+                          argmax=int(argmax), argmin=int(argmin))
@@ -6,7 +6,13 @@
 
 import logging
 import math
+import asyncio
+import inspect
+from array import array
 from functools import wraps
+from time import perf_counter
+from contextlib import nullcontext
+from collections import OrderedDict
 
 # Imports for profiling.
 import cProfile
@@ -16,7 +22,9 @@ import os
 from .components import IndividualBase, Population
 from .plugin_interfaces.operators import Selection, Crossover, Mutation
 from .plugin_interfaces.analysis import OnTheFlyAnalysis
-from .mpiutil import MPIUtil
+from .plugin_interfaces.evaluator import Evaluator
+from .evaluators.async_evaluator import run_outside_loop
+from .mpiutil import MPIUtil, CommTrace
 
 mpi = MPIUtil()
 
@@ -57,24 +65,20 @@ class StatVar(object):
         # Protected.
         self.name = '_{}'.format(name)
 
+        # Field name in population statistics.
+        self.field = name.split('_')[-1][1:]
+
     def __get__(self, engine, cls):
         '''
         Getter.
         '''
         stat_var = getattr(engine, self.name)
         if stat_var is None:
-            if 'min' in self.name and 'ori' in self.name:
-                stat_var = engine.population.min(engine.ori_fitness)
-            elif 'min' in self.name:
-                stat_var = engine.population.min(engine.fitness)
-            elif 'max' in self.name and 'ori' in self.name:
-                stat_var = engine.population.max(engine.ori_fitness)
-            elif 'max' in self.name:
-                stat_var = engine.population.max(engine.fitness)
-            elif 'mean' in self.name and 'ori' in self.name:
-                stat_var = engine.population.mean(engine.ori_fitness)
-            elif 'mean' in self.name:
-                stat_var = engine.population.mean(engine.fitness)
+            if 'ori' in self.name:
+                stats = engine.population.statistics(engine.ori_fitness)
+            else:
+                stats = engine.population.statistics(engine.fitness)
+            stat_var = getattr(stats, self.field)
             setattr(engine, self.name, stat_var)
         return stat_var
 
@@ -109,15 +113,51 @@ class GAEngine(object):
 
     :param analysis: All analysis class for on-the-fly analysis.
     :type analysis: :obj:`OnTheFlyAnalysis` list
+
+    :param evaluator: The Evaluator to be used for evaluating the objective
+                      function of a generation, objective function is called
+                      sequentially if not provided. A batch fitness function
+                      is always called directly.
+    :type evaluator: :obj:`gaft.plugin_interfaces.evaluator.Evaluator`
+
+    :param cache: The cache for objective values keyed by chromsome, individuals
+                  with cached chromsomes are not evaluated again.
+    :type cache: :obj:`gaft.cache.FitnessCache` or
+                 :obj:`gaft.cache.PersistentFitnessCache`
+
+    :param schedule: How new individuals are evaluated in MPI processes,
+                     possible values:
+
+        - 'static': each process evaluates the children it created (default).
+        - 'dynamic': children are gathered first and evaluated in chunks handed
+          out on demand by the master process, see
+          :meth:`gaft.mpiutil.MPIUtil.dynamic_map`. It is preferred when the
+          cost of fitness evaluation varies a lot between individuals.
+
+    :type schedule: str
+
+    :param pipeline_batches: The number of batches children in each process
+                             are bred, evaluated and gathered in, default is 1.
+                             With more batches, gathering a batch with
+                             non-blocking collectives may overlap breeding and
+                             evaluating the next batch, check the wall time
+                             in ``engine.trace`` to know if it pays off.
+    :type pipeline_batches: int
+
+    :param trace: If the timeline of computation and communication is recorded
+                  in ``engine.trace``, default is False
+    :type trace: bool
     '''
     # Statistical attributes for population.
     fmax, fmin, fmean = StatVar('fmax'), StatVar('fmin'), StatVar('fmean')
     ori_fmax, ori_fmin, ori_fmean = (StatVar('ori_fmax'),
                                      StatVar('ori_fmin'),
                                      StatVar('ori_fmean'))
+    fstd, ori_fstd = StatVar('fstd'), StatVar('ori_fstd')
 
     def __init__(self, population, selection, crossover, mutation,
-                 fitness=None, analysis=None):
+                 fitness=None, analysis=None, evaluator=None, cache=None,
+                 schedule='static', pipeline_batches=1, trace=False):
         # Set logger.
         logger_name = 'gaft.{}'.format(self.__class__.__name__)
         self.logger = logging.getLogger(logger_name)
@@ -129,14 +169,35 @@ class GAEngine(object):
         self.crossover = crossover
         self.mutation = mutation
         self.analysis = [] if analysis is None else [a() for a in analysis]
+        self.evaluator = evaluator
+        self.cache = cache
+        self.schedule = schedule
+
+        self.pipeline_batches = pipeline_batches
+
+        # Report of the last dynamic scheduling with idle time of processes.
+        self.schedule_report = None
+
+        # Timeline of computation and communication.
+        self.trace = CommTrace() if trace else None
 
         # Maxima and minima in population.
         self._fmax, self._fmin, self._fmean = None, None, None
         self._ori_fmax, self._ori_fmin, self._ori_fmean = None, None, None
+        self._fstd, self._ori_fstd = None, None
+
+        # Statistics of current generation wrt original and decorated fitness.
+        self.ori_stats, self.stats = None, None
 
         # Default fitness functions.
         self.ori_fitness = None if self.fitness is None else self.fitness
 
+        # User-defined objective function wrapped by fitness decorators and
+        # its values for individuals in current population.
+        self.objective = None
+        self._objective_values = {}
+        self._batch = False
+
         # Store current generation number.
         self.current_generation = -1  # Starts from 0.
 
@@ -153,6 +214,8 @@ class GAEngine(object):
         if self.fitness is None:
             raise AttributeError('No fitness function in GA engine')
 
+        self._sync_population()
+        self._evaluate()
         self._update_statvars()
 
         # Setup analysis objects.
@@ -164,37 +227,19 @@ class GAEngine(object):
             for g in range(ng):
                 self.current_generation = g
 
-                # The best individual in current population. 
-                if mpi.is_master:
-                    best_indv = self.population.best_indv(self.fitness)
-                else:
-                    best_indv = None
-                best_indv = mpi.bcast(best_indv)
-
-                # Scatter jobs to all processes.
-                local_indvs = []
-                # NOTE: One series of genetic operation generates 2 new individuals.
-                local_size = mpi.split_size(self.population.size // 2)
-
-                # Fill the new population.
-                for _ in range(local_size):
-                    # Select father and mother.
-                    parents = self.selection.select(self.population, fitness=self.fitness)
-                    # Crossover.
-                    children = self.crossover.cross(*parents)
-                    # Mutation.
-                    children = [self.mutation.mutate(child, self) for child in children]
-                    # Collect children.
-                    local_indvs.extend(children)
-
-                # Gather individuals from all processes.
-                indvs = mpi.merge_seq(local_indvs)
-                # Retain the previous best individual.
-                indvs[0] = best_indv
+                # The best individual in current population.
+                # NOTE: Populations and fitness values are the same in all processes.
+                best_indv = self.population[self.stats.argmax]
+
+                # Breed and evaluate children in all processes and gather them.
+                indvs, values = self._reproduce(best_indv)
                 # The next generation.
                 self.population.individuals = indvs
+                self._set_objective_values(self.population.individuals, values)
 
-                # Update statistic variables.
+                # Evaluate the new population and update statistic variables.
+                with self._span('evaluate'):
+                    self._evaluate()
                 self._update_statvars()
 
                 # Run all analysis if needed.
@@ -210,24 +255,433 @@ class GAEngine(object):
         finally:
             # Recover current generation number.
             self.current_generation = -1
+            # Release resources of evaluator.
+            if self.evaluator is not None:
+                self.evaluator.shutdown()
             # Perform the analysis post processing.
             for a in self.analysis:
                 a.finalize(population=self.population, engine=self)
 
+    def _breed(self, n_pairs):
+        '''
+        Private helper function to create new individuals from current population
+        using selection, crossover and mutation operators.
+        '''
+        children = []
+        for parents in self._select_parents(n_pairs):
+            # Crossover.
+            indvs = self.crossover.cross(*parents)
+            # Mutation.
+            children.extend([self.mutation.mutate(indv, self) for indv in indvs])
+
+        return children
+
+    def _select_parents(self, n_pairs):
+        '''
+        Private helper function to select pairs of parents in current population.
+        '''
+        if hasattr(self.selection, 'select_batch'):
+            indices = self.selection.select_batch(self.population,
+                                                  fitness=self.fitness,
+                                                  n_pairs=n_pairs)
+            indvs = self.population.individuals
+            return [(indvs[i], indvs[j]) for i, j in indices]
+
+        return (self.selection.select(self.population, fitness=self.fitness)
+                for _ in range(n_pairs))
+
+    def _evaluate(self):
+        '''
+        Private helper function to evaluate the objective function for all
+        individuals in current population at once, values of individuals
+        remaining in population are reused.
+        '''
+        if self.objective is None:
+            return
+
+        values, pending = {}, []
+        for indv in self.population.individuals:
+            entry = self._objective_values.get(id(indv))
+            if entry is not None and entry[0] is indv:
+                values[id(indv)] = entry
+            else:
+                pending.append(indv)
+
+        pending_values = self._distributed_values(pending)
+
+        for indv, value in zip(pending, pending_values):
+            values[id(indv)] = (indv, value)
+        self._objective_values = values
+
+    def _local_values(self, indvs):
+        '''
+        Private helper function to compute objective values of individuals in
+        current process with fitness cache if provided.
+        '''
+        values = [self._objective_value(indv) for indv in indvs]
+        pending = [indv for indv, value in zip(indvs, values) if value is None]
+
+        # Decode solutions of new individuals at once before evaluation.
+        self.population.indv_template.decode_many(pending)
+
+        if self.cache is None:
+            pending_values = iter(self._compute_values(pending))
+        else:
+            pending_values = iter(self._cached_values(pending))
+
+        return [next(pending_values) if value is None else value for value in values]
+
+    def _distributed_values(self, indvs):
+        '''
+        Private helper function to compute objective values of individuals
+        existing in all processes, each process computes a strided part of them
+        and all values are gathered.
+        '''
+        # NOTE: Individuals are the same in all processes.
+        if mpi.size == 1 or not indvs:
+            return self._local_values(indvs)
+
+        if self.schedule == 'dynamic':
+            values, self.schedule_report = mpi.dynamic_map(self._local_values, indvs)
+            return values
+
+        local_values = self._local_values(indvs[mpi.rank::mpi.size])
+        all_values, counts = mpi.allgatherv(array('d', local_values))
+
+        values, start = [None]*len(indvs), 0
+        for rank, count in enumerate(counts):
+            values[rank::mpi.size] = all_values[start: start+count].tolist()
+            start += count
+
+        return values
+
+    def _reproduce(self, best_indv):
+        '''
+        Private helper function to create the next generation in all processes.
+        Children in current process are bred, evaluated and gathered in batches,
+        the non-blocking gathering of a batch is in flight while breeding and
+        evaluating the next batch. The best individual is retained in master process.
+        '''
+        # NOTE: One series of genetic operation generates 2 new individuals.
+        batch_pairs = [self._split_batches(n_pairs)
+                       for n_pairs in mpi.split_sizes(self.population.size // 2)]
+
+        gathers = []
+        for b in range(self.pipeline_batches):
+            with self._span('breed'):
+                local_indvs = self._breed(batch_pairs[mpi.rank][b])
+                if b == 0 and mpi.is_master:
+                    local_indvs[0] = best_indv
+
+            with self._span('evaluate'):
+                local_values = self._children_values(local_indvs)
+
+            counts = [2*pairs[b] for pairs in batch_pairs]
+            gathers.append(self._start_gather(local_indvs, local_values, counts))
+
+            # Drive the progress of gatherings in flight.
+            self._poll_gathers(gathers)
+
+        return self._finish_gathers(gathers)
+
+    def _split_batches(self, n_pairs):
+        '''
+        Private helper function to split the number of parent pairs into batches.
+        '''
+        nb = self.pipeline_batches
+        return [n_pairs//nb + (1 if b < n_pairs % nb else 0) for b in range(nb)]
+
+    def _children_values(self, indvs):
+        '''
+        Private helper function to evaluate children created in current process.
+        With dynamic schedule, only known values are returned and the others
+        are evaluated later in :meth:`_evaluate`.
+        '''
+        if self.objective is None:
+            return [None]*len(indvs)
+        elif self.schedule == 'dynamic':
+            return [self._objective_value(indv) for indv in indvs]
+        else:
+            return self._local_values(indvs)
+
+    def _start_gather(self, local_indvs, local_values, counts):
+        '''
+        Private helper function to post non-blocking gathering of chromsomes and
+        objective values of individuals in current process, the numbers of
+        individuals in all processes are known in advance.
+        '''
+        gather = {'requests': [], 'posted': perf_counter(), 'completed': None,
+                  'indvs': local_indvs, 'values': local_values, 'counts': counts,
+                  'all_chromsomes': None, 'all_values': None}
+        if mpi.size == 1:
+            return gather
+
+        size = self._chromsome_size()
+        request, chromsomes = mpi.iallgatherv(self._pack_chromsomes(local_indvs),
+                                              [c*size for c in counts])
+        gather['requests'].append(request)
+        gather['all_chromsomes'] = chromsomes
+
+        if self.objective is not None:
+            # NOTE: NaN stands for unknown values which are never valid fitness.
+            data = array('d', [math.nan if v is None else v for v in local_values])
+            request, values = mpi.iallgatherv(data, counts)
+            gather['requests'].append(request)
+            gather['all_values'] = values
+
+        return gather
+
+    def _poll_gathers(self, gathers):
+        '''
+        Private helper function to test gatherings in flight without blocking
+        and record the completion time.
+        '''
+        for gather in gathers:
+            if gather['completed'] is None and mpi.testall(gather['requests']):
+                gather['completed'] = perf_counter()
+                # NOTE: Only gatherings with outstanding requests are traced.
+                if self.trace is not None and gather['requests']:
+                    self.trace.add('gather', 'comm', gather['posted'], gather['completed'])
+
+    def _finish_gathers(self, gathers):
+        '''
+        Private helper function to wait for all gatherings and rebuild individuals
+        from other processes against the template individual.
+        '''
+        with self._span('wait', 'wait'):
+            mpi.waitall([r for gather in gathers for r in gather['requests']])
+        self._poll_gathers(gathers)
+
+        # Children ordered by processes and then batches.
+        indvs = [[] for _ in range(mpi.size)]
+        values = [[] for _ in range(mpi.size)]
+        size = self._chromsome_size()
+
+        for gather in gathers:
+            all_values, start = gather['all_values'], 0
+            for rank, count in enumerate(gather['counts']):
+                if rank == mpi.rank:
+                    indvs[rank].extend(gather['indvs'])
+                    values[rank].extend(gather['values'])
+                else:
+                    data = gather['all_chromsomes'][start*size: (start+count)*size]
+                    indvs[rank].extend(self._unpack_chromsomes(data))
+                    if all_values is None:
+                        values[rank].extend([None]*count)
+                    else:
+                        values[rank].extend([None if math.isnan(v) else v
+                                             for v in all_values[start: start+count]])
+                start += count
+
+        return ([indv for rank_indvs in indvs for indv in rank_indvs],
+                [value for rank_values in values for value in rank_values])
+
+    def _span(self, name, category='compute'):
+        '''
+        Private helper function to get a context manager recording a span in
+        the communication trace if enabled.
+        '''
+        if self.trace is None:
+            return nullcontext()
+        return self.trace.span(name, category)
+
+    def _sync_population(self):
+        '''
+        Private helper function to replace individuals in all processes with
+        the ones in master process, so that the objective values can be
+        computed in different processes for the same population. Known
+        objective values in master process are synchronized as well, so that
+        the same individuals are pending for evaluation in all processes.
+        '''
+        if mpi.size == 1:
+            return
+
+        if mpi.is_master:
+            indvs = self.population.individuals
+            chromsomes = self._pack_chromsomes(indvs)
+            # NOTE: NaN stands for unknown values which are never valid fitness.
+            values = array('d', [math.nan if v is None else v
+                                 for v in map(self._objective_value, indvs)])
+        else:
+            chromsomes, values = None, None
+        chromsomes = mpi.bcast_array(chromsomes)
+        values = mpi.bcast_array(values)
+
+        if not mpi.is_master:
+            self.population.individuals = self._unpack_chromsomes(chromsomes)
+        self._set_objective_values(self.population.individuals,
+                                   [None if math.isnan(v) else v for v in values])
+
+    def _chromsome_size(self):
+        '''
+        Private helper function to get the size of a serialized chromsome.
+        '''
+        return len(self.population.indv_template.chromsome_bytes())
+
+    def _pack_chromsomes(self, indvs):
+        '''
+        Private helper function to pack chromsomes of individuals into one
+        contiguous byte array.
+        '''
+        return array('B', b''.join([indv.chromsome_bytes() for indv in indvs]))
+
+    def _unpack_chromsomes(self, data):
+        '''
+        Private helper function to rebuild individuals from a byte array of
+        packed chromsomes.
+        '''
+        template, size = self.population.indv_template, self._chromsome_size()
+        buf = memoryview(data)
+        return [template.from_chromsome_bytes(buf[i: i+size])
+                for i in range(0, len(buf), size)]
+
+    def _objective_value(self, indv):
+        '''
+        Private helper function to get the known objective value of an individual
+        in current population.
+        '''
+        entry = self._objective_values.get(id(indv))
+        if entry is not None and entry[0] is indv:
+            return entry[1]
+        return None
+
+    def _set_objective_values(self, indvs, values):
+        '''
+        Private helper function to store known objective values of individuals.
+        '''
+        self._objective_values = {id(indv): (indv, value)
+                                  for indv, value in zip(indvs, values)
+                                  if value is not None}
+
+    def _compute_values(self, indvs):
+        '''
+        Private helper function to compute objective values of individuals
+        using batch objective function or the evaluator.
+        '''
+        if not indvs:
+            return []
+        elif self._batch:
+            return self._batch_values(indvs)
+        elif self.evaluator is not None:
+            return self.evaluator.evaluate(self.objective, indvs)
+        else:
+            return [self._call_objective(indv) for indv in indvs]
+
+    def _cached_values(self, indvs):
+        '''
+        Private helper function to get objective values of individuals from
+        fitness cache, only individuals with new chromsomes are computed.
+        '''
+        keys = [self.cache.key(indv) for indv in indvs]
+
+        # Unique chromsomes.
+        unique = OrderedDict()
+        for key, indv in zip(keys, indvs):
+            unique.setdefault(key, indv)
+
+        values, missing = {}, []
+        for (key, indv), value in zip(unique.items(), self.cache.get_many(list(unique))):
+            if value is None:
+                missing.append((key, indv))
+            else:
+                values[key] = value
+
+        computed = self._compute_values([indv for _, indv in missing])
+        self.cache.put_many([(key, value) for (key, _), value in zip(missing, computed)])
+        values.update((key, value) for (key, _), value in zip(missing, computed))
+
+        return [values[key] for key in keys]
+
+    def _batch_values(self, indvs):
+        '''
+        Private helper function to evaluate the batch objective function for
+        individuals with fitness values check.
+        '''
+        values = self._call_objective([indv.solution for indv in indvs])
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+
+        if len(values) != len(indvs):
+            msg = 'Fitness values number({}) is not equal to individuals number({})'
+            raise ValueError(msg.format(len(values), len(indvs)))
+
+        for fitness in values:
+            is_invalid = (type(fitness) is not float) or (math.isnan(fitness))
+            if is_invalid:
+                msg = 'Fitness value(value: {}, type: {}) is invalid'
+                msg = msg.format(fitness, type(fitness))
+                raise ValueError(msg)
+
+        return values
+
+    def _objective(self, fn):
+        '''
+        Private helper function to wrap the user-defined objective function so
+        that the values evaluated in :meth:`_evaluate` can be reused by fitness
+        function and all its decorators.
+        '''
+        # Already wrapped by another decorator.
+        if getattr(fn, 'is_objective', False):
+            return fn
+
+        self.objective = fn
+        self._objective_values = {}
+
+        @wraps(fn)
+        def _fn_with_values(indv):
+            entry = self._objective_values.get(id(indv))
+            if entry is not None and entry[0] is indv:
+                return entry[1]
+
+            if self.cache is not None:
+                key = self.cache.key(indv)
+                value = self.cache.get(key)
+                if value is None:
+                    value = self._single_value(indv)
+                    self.cache.put(key, value)
+                return value
+
+            return self._single_value(indv)
+
+        _fn_with_values.is_objective = True
+
+        return _fn_with_values
+
+    def _single_value(self, indv):
+        '''
+        Private helper function to compute objective value of an individual.
+        '''
+        if self._batch:
+            return self._batch_values([indv])[0]
+        return self._call_objective(indv)
+
+    def _call_objective(self, arg):
+        '''
+        Private helper function to call the objective function, coroutine
+        function is run to completion in a new event loop (in a separate thread
+        if an event loop is already running).
+        '''
+        if inspect.iscoroutinefunction(self.objective):
+            return run_outside_loop(asyncio.run, self.objective(arg))
+        return self.objective(arg)
+
     def _update_statvars(self):
         '''
         Private helper function to update statistic variables in GA engine, like
         maximum, minimum and mean values.
         '''
         # Wrt original fitness.
-        self.ori_fmax = self.population.max(self.ori_fitness)
-        self.ori_fmin = self.population.min(self.ori_fitness)
-        self.ori_fmean = self.population.mean(self.ori_fitness)
+        self.ori_stats = self.population.statistics(self.ori_fitness)
+        self.ori_fmax, self.ori_fmin = self.ori_stats.max, self.ori_stats.min
+        self.ori_fmean, self.ori_fstd = self.ori_stats.mean, self.ori_stats.std
 
         # Wrt decorated fitness.
-        self.fmax = self.population.max(self.fitness)
-        self.fmin = self.population.min(self.fitness)
-        self.fmean = self.population.mean(self.fitness)
+        # NOTE: Scaled fitness depends on statistics wrt original fitness.
+        if self.fitness is self.ori_fitness:
+            self.stats = self.ori_stats
+        else:
+            self.stats = self.population.statistics(self.fitness)
+        self.fmax, self.fmin = self.stats.max, self.stats.min
+        self.fmean, self.fstd = self.stats.mean, self.stats.std
 
     def _check_parameters(self):
         '''
@@ -241,6 +695,12 @@ class GAEngine(object):
             raise TypeError('crossover operator must be a Crossover instance')
         if not isinstance(self.mutation, Mutation):
             raise TypeError('mutation operator must be a Mutation instance')
+        if self.evaluator is not None and not isinstance(self.evaluator, Evaluator):
+            raise TypeError('evaluator must be an Evaluator instance')
+        if self.schedule not in ['static', 'dynamic']:
+            raise ValueError('Invalid schedule type({})'.format(self.schedule))
+        if self.pipeline_batches < 1:
+            raise ValueError('pipeline_batches must be a positive integer')
 
         for ap in self.analysis:
             if not isinstance(ap, OnTheFlyAnalysis):
@@ -249,12 +709,40 @@ class GAEngine(object):
 
     # Decorators.
 
-    def fitness_register(self, fn):
+    def fitness_register(self, fn=None, batch=False):
         ''' A decorator for fitness function register.
 
         :param fn: Fitness function to be registered
         :type fn: function
+
+        :param batch: If the fitness function evaluates all individuals at once,
+                      default is False. A batch fitness function receives a 2-D
+                      solution matrix (list of solutions) and returns a sequence
+                      of fitness values for all solutions.
+        :type batch: bool
+
+        .. Note::
+            Use it as ``@engine.fitness_register(batch=True)`` to register a
+            batch fitness function, the scaling decorators can be applied on
+            it as usual.
+
+            The fitness function can also be a coroutine function defined with
+            ``async def``, use :obj:`gaft.evaluators.AsyncEvaluator` to evaluate
+            a generation concurrently.
         '''
+        if fn is None:
+            return lambda fn: self.fitness_register(fn, batch=batch)
+
+        self._batch = batch
+        fn = self._objective(fn)
+
+        # Fitness values are checked when the whole population is evaluated.
+        if batch:
+            self.fitness = fn
+            if self.ori_fitness is None:
+                self.ori_fitness = fn
+            return
+
         @wraps(fn)
         def _fn_with_fitness_check(indv):
             '''
@@ -311,6 +799,7 @@ class GAEngine(object):
 
         '''
         def _linear_scaling(fn):
+            fn = self._objective(fn)
             # For original fitness calculation.
             self.ori_fitness = fn
 
@@ -354,6 +843,7 @@ class GAEngine(object):
             For maximizaiton, :math:`f' = f(x) - \min f(x) + {\\xi}^{k}`, :math:`k` is generation number.
         '''
         def _dynamic_linear_scaling(fn):
+            fn = self._objective(fn)
             # For original fitness calculation.
             self.ori_fitness = fn
 
@@ -380,6 +870,8 @@ class GAEngine(object):
         :param fn: Original fitness function
         :type fn: function
         '''
+        fn = self._objective(fn)
+
         @wraps(fn)
         def _minimize(indv):
             return -fn(indv)
@@ -0,0 +1,4 @@
+''' Package for built-in fitness evaluators '''
+
+from .process_pool_evaluator import ProcessPoolEvaluator
+from .async_evaluator import AsyncEvaluator
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Asyncio fitness evaluator implementation. '''
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from ..plugin_interfaces.evaluator import Evaluator
+
+
+def run_outside_loop(func, *args):
+    ''' Call a function which runs an event loop to completion. If an event
+    loop is already running in current thread (e.g. in Jupyter or an async
+    application), where another loop can not be run, the function is called in
+    a separate thread and current thread is blocked until it returns.
+
+    :param func: The function to be called
+    :type func: function
+
+    :return: The return value of the function
+    '''
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return func(*args)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(func, *args).result()
+
+
+class AsyncEvaluator(Evaluator):
+    ''' Evaluator running the objective evaluations of a generation concurrently
+    in an asyncio event loop, for I/O-bound objective functions which shell out
+    to external programs or wait for files.
+
+    :param concurrency: The maximum number of evaluations running at the same
+                        time, no limit by default.
+    :type concurrency: int
+
+    .. Note::
+        Coroutine objective functions (defined with ``async def``) are awaited
+        in the event loop, normal objective functions are run in the default
+        thread pool executor of the loop. The loop is owned by the evaluator,
+        it is run in a separate thread if an event loop is already running in
+        the calling thread, so the objective must not rely on that loop.
+    '''
+    def __init__(self, concurrency=None):
+        if concurrency is not None and concurrency <= 0:
+            raise ValueError('Invalid concurrency limit')
+        self.concurrency = concurrency
+
+        self._loop = None
+
+    def evaluate(self, objective, individuals):
+        ''' Evaluate the objective function for individuals concurrently.
+
+        :param objective: The user-defined objective function
+        :type objective: function or coroutine function
+
+        :param individuals: Individuals to be evaluated
+        :type individuals: list of :obj:`gaft.components.IndividualBase`
+
+        :return: Objective values in the same order with individuals
+        :rtype: list of float
+        '''
+        # Event loop is reused in following generations.
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+
+        return run_outside_loop(self._loop.run_until_complete,
+                                self._gather(objective, individuals))
+
+    async def _gather(self, objective, individuals):
+        '''
+        Helper coroutine to evaluate all individuals with concurrency limit.
+        '''
+        semaphore = asyncio.Semaphore(self.concurrency or max(len(individuals), 1))
+        is_coroutine = inspect.iscoroutinefunction(objective)
+
+        async def _evaluate(indv):
+            async with semaphore:
+                if is_coroutine:
+                    return await objective(indv)
+                return await self._loop.run_in_executor(None, objective, indv)
+
+        return list(await asyncio.gather(*[_evaluate(indv) for indv in individuals]))
+
+    def shutdown(self):
+        ''' Close the event loop.
+        '''
+        if self._loop is not None:
+            run_outside_loop(self._loop.run_until_complete,
+                             self._loop.shutdown_default_executor())
+            self._loop.close()
+            self._loop = None
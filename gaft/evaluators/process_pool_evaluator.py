@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Process pool fitness evaluator implementation. '''
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from ..plugin_interfaces.evaluator import Evaluator
+
+# Objective function in worker process.
+_objective = None
+
+def _init_worker(objective):
+    '''
+    Initializer of worker processes to set the objective function.
+    '''
+    global _objective
+    _objective = objective
+
+def _evaluate(indv):
+    '''
+    Evaluate the objective function in worker process.
+    '''
+    return _objective(indv)
+
+
+class ProcessPoolEvaluator(Evaluator):
+    ''' Evaluator farming out the objective evaluation of a generation to a
+    pool of worker processes on the current node.
+
+    :param workers: The number of worker processes, default is the number of
+                    processors on the machine.
+    :type workers: int
+
+    :param chunksize: The number of individuals sent to a worker at a time.
+    :type chunksize: int
+
+    :param start_method: The start method of worker processes, 'fork', 'spawn'
+                         or 'forkserver', default is the platform default.
+    :type start_method: str
+
+    .. Note::
+        Workers are started at the first evaluation and reused in following
+        generations. The objective function is passed to workers once when
+        they are started, so it must be picklable unless workers are forked.
+        Forking is unsafe in MPI processes and unavailable on some platforms,
+        use 'spawn' or 'forkserver' there.
+    '''
+    def __init__(self, workers=None, chunksize=1, start_method=None):
+        if workers is not None and workers <= 0:
+            raise ValueError('Invalid worker number')
+        self.workers = workers
+
+        if chunksize <= 0:
+            raise ValueError('Invalid chunk size')
+        self.chunksize = chunksize
+
+        if (start_method is not None and
+                start_method not in multiprocessing.get_all_start_methods()):
+            raise ValueError('Invalid start method({})'.format(start_method))
+        self.start_method = start_method
+
+        self._executor = None
+        self._objective = None
+
+    def evaluate(self, objective, individuals):
+        ''' Evaluate the objective function for individuals in worker processes.
+
+        :param objective: The user-defined objective function
+        :type objective: function
+
+        :param individuals: Individuals to be evaluated
+        :type individuals: list of :obj:`gaft.components.IndividualBase`
+
+        :return: Objective values in the same order with individuals
+        :rtype: list of float
+        '''
+        # Restart workers if objective function changed.
+        if self._executor is None or objective is not self._objective:
+            self.shutdown()
+            context = multiprocessing.get_context(self.start_method)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=context,
+                                                 initializer=_init_worker,
+                                                 initargs=(objective,))
+            self._objective = objective
+
+        return list(self._executor.map(_evaluate, individuals,
+                                       chunksize=self.chunksize))
+
+    def shutdown(self):
+        ''' Shut down all worker processes.
+        '''
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._objective = None
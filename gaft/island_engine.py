@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Island model Genetic Algorithm engine definition
+'''
+
+import random
+from math import sqrt
+from array import array
+from collections import namedtuple
+
+from .engine import GAEngine, do_profile, mpi
+
+# Statistics of fitness values in all islands.
+GlobalStatistics = namedtuple('GlobalStatistics', ['max', 'min', 'mean', 'std', 'size'])
+
+
+class IslandEngine(GAEngine):
+    ''' Genetic Algorithm engine for island model in MPI environment. Each
+    process evolves its own population (island) independently and only a few
+    best individuals (migrants) are exchanged between islands periodically with
+    non-blocking communications, the migrants are received while the islands
+    are evolving the next generation.
+
+    The operators, fitness decorators and analysis plugins are the same as
+    :obj:`gaft.engine.GAEngine`, statistical variables like ``fmax`` are the
+    ones of the island in current process, statistics of all islands are
+    reduced to ``global_stats`` and ``global_ori_stats`` in each generation.
+
+    :param migration_interval: The number of generations between two migrations,
+                               default is 10
+    :type migration_interval: int
+
+    :param migration_size: The number of migrants sent to each neighbor island,
+                           default is 2
+    :type migration_size: int
+
+    :param topology: The topology for migration, possible values:
+
+        - 'ring': migrants are sent to the island with the next rank (default).
+        - 'random': migrants are sent along a ring with random order shuffled
+          for each migration.
+        - 'full': migrants are sent to all the other islands.
+
+    :type topology: str
+
+    Other parameters are the same as :obj:`gaft.engine.GAEngine`.
+    '''
+    def __init__(self, population, selection, crossover, mutation,
+                 fitness=None, analysis=None, evaluator=None, cache=None,
+                 migration_interval=10, migration_size=2, topology='ring'):
+        super(IslandEngine, self).__init__(population, selection, crossover,
+                                           mutation, fitness=fitness,
+                                           analysis=analysis, evaluator=evaluator,
+                                           cache=cache)
+
+        if topology not in ['ring', 'random', 'full']:
+            raise ValueError('Invalid topology type({})'.format(topology))
+        if migration_interval < 1:
+            raise ValueError('migration_interval must be a positive integer')
+        if not 0 < migration_size < population.size:
+            raise ValueError('Invalid migration_size({})'.format(migration_size))
+
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+
+        # Statistics of all islands wrt original and decorated fitness.
+        self.global_ori_stats, self.global_stats = None, None
+
+        # Requests, receive buffers and send buffers of the migration in progress.
+        self._migration = None
+
+        # Seed for random topology which is the same in all processes.
+        self._topology_seed = 0
+
+    @do_profile(filename='gaft_run.prof')
+    def run(self, ng=100):
+        ''' Run the Genetic Algorithm optimization iteration in all islands.
+
+        :param ng: Evolution iteration steps (generation number)
+        :type ng: int
+        '''
+        if self.fitness is None:
+            raise AttributeError('No fitness function in GA engine')
+
+        self._topology_seed = mpi.bcast(random.getrandbits(32))
+        self._evaluate()
+        self._update_statvars()
+
+        # Setup analysis objects.
+        for a in self.analysis:
+            a.setup(ng=ng, engine=self)
+
+        # Enter evolution iteration.
+        try:
+            for g in range(ng):
+                self.current_generation = g
+
+                # The best individual in current island.
+                best_indv = self.population[self.stats.argmax]
+
+                # Fill the new population and retain the previous best individual.
+                # NOTE: One series of genetic operation generates 2 new individuals.
+                indvs = self._breed(self.population.size // 2)
+                indvs[0] = best_indv
+                self.population.individuals = indvs
+                self._evaluate()
+                self._update_statvars()
+
+                # Accept migrants sent in the previous migration and send new ones.
+                # NOTE: Individuals are ranked with statistics of the current
+                #       population, on which scaled fitness values depend.
+                if self._migration is not None:
+                    self._finish_migration()
+                    self._update_statvars()
+                if (g + 1) % self.migration_interval == 0:
+                    self._start_migration(g)
+
+                # Run all analysis if needed.
+                for a in self.analysis:
+                    if g % a.interval == 0:
+                        a.register_step(g=g, population=self.population, engine=self)
+
+            # Accept the last migrants.
+            if self._migration is not None:
+                self._finish_migration()
+                self._update_statvars()
+        except Exception as e:
+            # Log exception info.
+            msg = '{} exception is catched in island {}'.format(type(e).__name__, mpi.rank)
+            self.logger.exception(msg)
+            raise e
+        finally:
+            # Recover current generation number.
+            self.current_generation = -1
+            # Complete the migration in progress before releasing its buffers.
+            if self._migration is not None:
+                mpi.waitall(self._migration[0])
+                self._migration = None
+            # Release resources of evaluator.
+            if self.evaluator is not None:
+                self.evaluator.shutdown()
+            # Perform the analysis post processing.
+            for a in self.analysis:
+                a.finalize(population=self.population, engine=self)
+
+    def best_indv(self):
+        ''' The individual with the best original fitness in all islands, it must
+        be called in all processes.
+
+        :return: The best individual in all islands
+        :rtype: :obj:`gaft.components.IndividualBase`
+        '''
+        best_indv = self.population.best_indv(self.ori_fitness)
+        if mpi.size == 1:
+            return best_indv
+
+        all_fmax = mpi.allgather(self.ori_fmax)
+        owner = all_fmax.index(max(all_fmax))
+
+        data = best_indv.chromsome_bytes() if mpi.rank == owner else None
+        data = mpi.bcast(data, root=owner)
+
+        if mpi.rank == owner:
+            return best_indv
+        return self.population.indv_template.from_chromsome_bytes(data)
+
+    def neighbors(self, g):
+        ''' Get the ranks of islands exchanging migrants with current island in
+        a migration.
+
+        :param g: The generation number of the migration
+        :type g: int
+
+        :return: Ranks of islands where migrants are sent to and received from
+        :rtype: (list of int, list of int)
+        '''
+        rank, size = mpi.rank, mpi.size
+        if size == 1:
+            return [], []
+
+        if self.topology == 'full':
+            others = [r for r in range(size) if r != rank]
+            return others, others
+
+        order = list(range(size))
+        if self.topology == 'random':
+            # NOTE: The same order is shuffled in all processes.
+            random.Random(self._topology_seed + g).shuffle(order)
+
+        idx = order.index(rank)
+        return [order[(idx + 1) % size]], [order[(idx - 1) % size]]
+
+    def _start_migration(self, g):
+        '''
+        Private helper function to post non-blocking sends of the best
+        individuals and receives of migrants from neighbor islands.
+        '''
+        dests, sources = self.neighbors(g)
+        if not dests:
+            return
+
+        k = self.migration_size
+        with_values = self.objective is not None
+
+        emigrants = [self.population[i]
+                     for i in self.population.argsort(self.fitness)[-k:]]
+        chromsomes = self._pack_chromsomes(emigrants)
+        if with_values:
+            values = array('d', [self._objective_value(indv) for indv in emigrants])
+        else:
+            values = None
+
+        requests, buffers = [], []
+        for dest in dests:
+            requests.append(mpi.isend_array(chromsomes, dest, tag=0))
+            if with_values:
+                requests.append(mpi.isend_array(values, dest, tag=1))
+
+        for source in sources:
+            recv_chromsomes = array('B', bytes(k*self._chromsome_size()))
+            requests.append(mpi.irecv_array(recv_chromsomes, source, tag=0))
+            if with_values:
+                recv_values = array('d', bytes(k*8))
+                requests.append(mpi.irecv_array(recv_values, source, tag=1))
+            else:
+                recv_values = None
+            buffers.append((recv_chromsomes, recv_values))
+
+        # NOTE: Send buffers must be alive until the requests are completed.
+        self._migration = (requests, buffers, (chromsomes, values))
+
+    def _finish_migration(self):
+        '''
+        Private helper function to wait for the migration in progress and
+        replace the worst individuals in current island with migrants.
+        '''
+        if self._migration is None:
+            return
+
+        requests, buffers, _ = self._migration
+        mpi.waitall(requests)
+        self._migration = None
+
+        immigrants, values = [], []
+        for recv_chromsomes, recv_values in buffers:
+            immigrants.extend(self._unpack_chromsomes(recv_chromsomes))
+            if recv_values is not None:
+                values.extend(recv_values.tolist())
+
+        # The best individual in current island is always retained.
+        n = min(len(immigrants), len(self.population) - 1)
+        worst_indices = self.population.argsort(self.fitness)[:n]
+
+        # NOTE: Individuals in array population are new views of the rows
+        #       written, so values are stored for the individuals in population.
+        for idx, indv in zip(worst_indices, immigrants):
+            self.population.individuals[idx] = indv
+        for idx, value in zip(worst_indices, values):
+            indv = self.population[idx]
+            self._objective_values[id(indv)] = (indv, value)
+
+    def _distributed_values(self, indvs):
+        '''
+        Private helper function to compute objective values of individuals
+        in current island only.
+        '''
+        return self._local_values(indvs)
+
+    def _update_statvars(self):
+        '''
+        Private helper function to update statistic variables of current island
+        and reduce statistics of all islands.
+        '''
+        super(IslandEngine, self)._update_statvars()
+
+        if self.stats is self.ori_stats:
+            self.global_ori_stats, = self._reduce_statistics([self.ori_stats])
+            self.global_stats = self.global_ori_stats
+        else:
+            self.global_ori_stats, self.global_stats = self._reduce_statistics(
+                [self.ori_stats, self.stats])
+
+    def _reduce_statistics(self, all_stats):
+        '''
+        Private helper function to combine statistics of all islands with two
+        reductions.
+        '''
+        n = float(len(self.population))
+
+        # Sums of fitness values and their squares.
+        sums = [n]
+        for stats in all_stats:
+            sums.extend([stats.mean*n, (stats.std**2 + stats.mean**2)*n])
+        sums = mpi.allreduce(sums, op='sum')
+
+        extrema = []
+        for stats in all_stats:
+            extrema.extend([stats.max, -stats.min])
+        extrema = mpi.allreduce(extrema, op='max')
+
+        total, global_stats = sums[0], []
+        for i in range(len(all_stats)):
+            fmean = sums[2*i + 1]/total
+            fstd = sqrt(max(sums[2*i + 2]/total - fmean**2, 0.0))
+            global_stats.append(GlobalStatistics(max=extrema[2*i], min=-extrema[2*i + 1],
+                                                 mean=fmean, std=fstd, size=int(total)))
+
+        return global_stats
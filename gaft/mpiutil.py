@@ -5,9 +5,14 @@ A high-level utility class for parallelizing Genetic Algorithm by using MPI inte
 in distributed MPI environment.
 '''
 
+import json
 import logging
-from itertools import chain
+from time import perf_counter
+from contextlib import contextmanager
+from array import array
+from itertools import chain, accumulate
 from functools import wraps
+from collections import namedtuple
 
 try:
     from mpi4py import MPI
@@ -15,6 +20,17 @@ try:
 except ImportError:
     MPI_INSTALLED = False
 
+# Message tags for master-worker scheduling.
+_TASK_TAG, _REQUEST_TAG, _DONE_TAG = 101, 102, 103
+
+# Communicator duplicated from COMM_WORLD for master-worker scheduling only,
+# it is created on the first scheduling in all processes.
+_schedule_comm = None
+
+# Report of master-worker scheduling, per-process values are ordered by rank.
+ScheduleReport = namedtuple('ScheduleReport', ['n_tasks', 'busy_times', 'idle_times',
+                                               'chunk_sizes', 'elapsed'])
+
 
 class Singleton(type):
     def __call__(cls, *args, **kwargs):
@@ -34,15 +50,19 @@ class MPIUtil(object):
         logger_name = 'gaft.{}'.format(self.__class__.__name__)
         self._logger = logging.getLogger(logger_name)
 
-    def bcast(self, data):
+    def bcast(self, data, root=0):
         ''' Broadcast data to MPI processes
 
         :param data: Data to be broadcasted
         :type data: any Python object
+
+        :param root: Rank of the process where the data is broadcasted from,
+                     default is the master process
+        :type root: int
         '''
         if MPI_INSTALLED:
             mpi_comm = MPI.COMM_WORLD
-            bdata = mpi_comm.bcast(data, root=0)
+            bdata = mpi_comm.bcast(data, root=root)
         else:
             bdata = data
         return bdata
@@ -111,6 +131,19 @@ class MPIUtil(object):
                         'number({}), more processor would be ' +
                         'superflous').format(size, self.size)
             self._logger.warning(warn_msg)
+
+        return self.split_sizes(size)[self.rank]
+
+    def split_sizes(self, size):
+        ''' Split a size number(int) to sub-size numbers for all processes.
+
+        :param size: The size number to be splitted.
+        :type size: int
+
+        :return: Sub-sizes for all processes ordered by rank
+        :rtype: list of int
+        '''
+        if size < self.size:
             splited_sizes = [1]*size + [0]*(self.size - size)
         elif size % self.size != 0:
             residual = size % self.size
@@ -120,7 +153,437 @@ class MPIUtil(object):
         else:
             splited_sizes = [size // self.size]*self.size
 
-        return splited_sizes[self.rank]
+        return splited_sizes
+
+    def allgather(self, data):
+        ''' Gather data from all processes and distribute the combined data to
+        all processes.
+
+        :param data: Data in current process
+        :type data: any Python object
+
+        :return: Data from all processes ordered by rank
+        :rtype: list of any Python object
+        '''
+        if self.size == 1:
+            return [data]
+
+        mpi_comm = MPI.COMM_WORLD
+        return mpi_comm.allgather(data)
+
+    def allgatherv(self, data):
+        ''' Gather numeric arrays with different lengths from all processes and
+        distribute the concatenated array to all processes using buffer-based
+        Allgatherv without pickling.
+
+        :param data: Numeric array in current process
+        :type data: :obj:`array.array`
+
+        :return: The concatenated array and the lengths of arrays from all
+                 processes ordered by rank
+        :rtype: (:obj:`array.array`, list of int)
+        '''
+        if self.size == 1:
+            return data, [len(data)]
+
+        mpi_comm = MPI.COMM_WORLD
+
+        # Exchange lengths of arrays first.
+        counts = array('q', [0])*self.size
+        mpi_comm.Allgather(array('q', [len(data)]), counts)
+        counts = counts.tolist()
+        displs = [0] + list(accumulate(counts))[: -1]
+
+        recvbuf = array(data.typecode, bytes(sum(counts)*data.itemsize))
+        mpi_comm.Allgatherv(data, [recvbuf, (counts, displs)])
+
+        return recvbuf, counts
+
+    def alltoall(self, counts):
+        ''' Send an integer to each process and receive an integer from each
+        process using buffer-based Alltoall.
+
+        :param counts: Integers to be sent to all processes ordered by rank
+        :type counts: list of int
+
+        :return: Integers received from all processes ordered by rank
+        :rtype: list of int
+        '''
+        if self.size == 1:
+            return list(counts)
+
+        mpi_comm = MPI.COMM_WORLD
+
+        recvbuf = array('q', [0])*self.size
+        mpi_comm.Alltoall(array('q', counts), recvbuf)
+
+        return recvbuf.tolist()
+
+    def alltoallv(self, data, counts, recv_counts=None):
+        ''' Send consecutive parts of a numeric array to all processes and
+        receive parts from all processes using buffer-based Alltoallv.
+
+        :param data: Numeric array in current process
+        :type data: :obj:`array.array`
+
+        :param counts: Lengths of parts sent to all processes ordered by rank
+        :type counts: list of int
+
+        :param recv_counts: Lengths of parts received from all processes, they
+                            are exchanged with Alltoall if not provided
+        :type recv_counts: list of int
+
+        :return: The concatenated array received and the lengths of parts from
+                 all processes ordered by rank
+        :rtype: (:obj:`array.array`, list of int)
+        '''
+        if self.size == 1:
+            return data, list(counts)
+
+        mpi_comm = MPI.COMM_WORLD
+
+        if recv_counts is None:
+            recv_counts = self.alltoall(counts)
+        displs = [0] + list(accumulate(counts))[: -1]
+        recv_displs = [0] + list(accumulate(recv_counts))[: -1]
+
+        recvbuf = array(data.typecode, bytes(sum(recv_counts)*data.itemsize))
+        mpi_comm.Alltoallv([data, (list(counts), displs)],
+                           [recvbuf, (list(recv_counts), recv_displs)])
+
+        return recvbuf, list(recv_counts)
+
+    def iallgatherv(self, data, counts):
+        ''' Start a non-blocking gathering of numeric arrays with known lengths
+        from all processes using buffer-based Iallgatherv.
+
+        :param data: Numeric array in current process, it must not be modified
+                     until the request is completed
+        :type data: :obj:`array.array`
+
+        :param counts: Lengths of arrays in all processes ordered by rank
+        :type counts: list of int
+
+        :return: The request of the communication and the buffer for the
+                 concatenated array which is filled once the request is completed
+        :rtype: (:obj:`mpi4py.MPI.Request`, :obj:`array.array`)
+        '''
+        if self.size == 1:
+            return None, data
+
+        mpi_comm = MPI.COMM_WORLD
+
+        displs = [0] + list(accumulate(counts))[: -1]
+        recvbuf = array(data.typecode, bytes(sum(counts)*data.itemsize))
+        request = mpi_comm.Iallgatherv(data, [recvbuf, (list(counts), displs)])
+
+        return request, recvbuf
+
+    def bcast_array(self, data):
+        ''' Broadcast a numeric array in master process to all processes using
+        buffer-based Bcast without pickling.
+
+        :param data: Numeric array in master process (ignored in others)
+        :type data: :obj:`array.array`
+
+        :return: The broadcasted array
+        :rtype: :obj:`array.array`
+        '''
+        if self.size == 1:
+            return data
+
+        mpi_comm = MPI.COMM_WORLD
+
+        # Exchange type code and length of array first.
+        header = (data.typecode, len(data)) if self.is_master else None
+        typecode, length = mpi_comm.bcast(header, root=0)
+
+        if not self.is_master:
+            data = array(typecode, bytes(length*array(typecode).itemsize))
+        mpi_comm.Bcast(data, root=0)
+
+        return data
+
+    def allreduce(self, data, op='sum'):
+        ''' Combine float values from all processes element-wise with a reduction
+        operation and distribute the result to all processes using buffer-based
+        Allreduce.
+
+        :param data: Float values in current process
+        :type data: list of float
+
+        :param op: The reduction operation, possible values: 'sum', 'max', 'min'
+        :type op: str
+
+        :return: The reduced values
+        :rtype: list of float
+        '''
+        if op not in ['sum', 'max', 'min']:
+            raise ValueError('Invalid reduction operation({})'.format(op))
+
+        if self.size == 1:
+            return list(data)
+
+        mpi_comm = MPI.COMM_WORLD
+        mpi_op = {'sum': MPI.SUM, 'max': MPI.MAX, 'min': MPI.MIN}[op]
+
+        recvbuf = array('d', bytes(len(data)*8))
+        mpi_comm.Allreduce(array('d', data), recvbuf, op=mpi_op)
+
+        return recvbuf.tolist()
+
+    def isend_array(self, data, dest, tag=0):
+        ''' Start a non-blocking send of a numeric array to another process.
+
+        :param data: Numeric array to be sent, it must not be modified until
+                     the request is completed
+        :type data: :obj:`array.array`
+
+        :param dest: Rank of the destination process
+        :type dest: int
+
+        :param tag: Message tag
+        :type tag: int
+
+        :return: The request of the communication
+        :rtype: :obj:`mpi4py.MPI.Request`
+        '''
+        mpi_comm = MPI.COMM_WORLD
+        return mpi_comm.Isend(data, dest=dest, tag=tag)
+
+    def irecv_array(self, data, source, tag=0):
+        ''' Start a non-blocking receive of a numeric array from another process.
+
+        :param data: Numeric array with the size of the message as the receive
+                     buffer, it is filled once the request is completed
+        :type data: :obj:`array.array`
+
+        :param source: Rank of the source process
+        :type source: int
+
+        :param tag: Message tag
+        :type tag: int
+
+        :return: The request of the communication
+        :rtype: :obj:`mpi4py.MPI.Request`
+        '''
+        mpi_comm = MPI.COMM_WORLD
+        return mpi_comm.Irecv(data, source=source, tag=tag)
+
+    def waitall(self, requests):
+        ''' Block until all the non-blocking communications are completed.
+
+        :param requests: The requests of communications, None for completed ones
+        :type requests: list of :obj:`mpi4py.MPI.Request`
+        '''
+        requests = [r for r in requests if r is not None]
+        if requests:
+            MPI.Request.Waitall(requests)
+
+    def testall(self, requests):
+        ''' Test if all the non-blocking communications are completed without
+        blocking, it also drives the progress of communications in MPI
+        implementations without asynchronous progress.
+
+        :param requests: The requests of communications, None for completed ones
+        :type requests: list of :obj:`mpi4py.MPI.Request`
+
+        :return: If all communications are completed
+        :rtype: bool
+        '''
+        requests = [r for r in requests if r is not None]
+        if not requests:
+            return True
+        return MPI.Request.Testall(requests)
+
+    def dynamic_map(self, func, items, target_time=0.05, chunk_size=1):
+        ''' Apply a function to all items with master-worker dynamic scheduling.
+        Master process hands out chunks of items to worker processes on demand,
+        so a process with expensive items does not keep the others waiting.
+        Master computes single items itself only when no worker is waiting and
+        an item is known to take less than ``target_time``, so that workers are
+        not blocked for long by the master.
+
+        Each worker requests its next chunk before computing the current one
+        to hide the latency of the master. Chunk sizes adapt to the observed
+        time per item so that a chunk takes about ``target_time``, they are also
+        limited by the remaining items to balance the end of the schedule.
+
+        :param func: Function mapping a list of items to a list of results
+        :type func: function
+
+        :param items: Items which are the same in all processes, only their
+                      indices are sent to workers
+        :type items: list
+
+        :param target_time: The expected time in seconds to compute a chunk
+        :type target_time: float
+
+        :param chunk_size: Size of chunks before the time per item is observed
+        :type chunk_size: int
+
+        :return: Results for all items and the report of scheduling with busy
+                 and idle time of all processes in all processes
+        :rtype: (list, :obj:`gaft.mpiutil.ScheduleReport`)
+        '''
+        if self.size == 1 or not items:
+            start = perf_counter()
+            results = list(func(items)) if items else []
+            elapsed = perf_counter() - start
+            report = ScheduleReport(n_tasks=[len(items)] + [0]*(self.size - 1),
+                                    busy_times=[elapsed] + [0.0]*(self.size - 1),
+                                    idle_times=[0.0]*self.size,
+                                    chunk_sizes=[len(items)] if items else [],
+                                    elapsed=elapsed)
+            return results, report
+
+        if self.is_master:
+            results, report = self._dispatch(func, items, target_time, chunk_size)
+            msg = 'Idle time of processes: {}'.format(
+                ', '.join(['{:.3f}s'.format(t) for t in report.idle_times]))
+            self._logger.debug(msg)
+        else:
+            self._work(func, items)
+            results, report = None, None
+
+        return self.bcast((results, report))
+
+    def _dispatch(self, func, items, target_time, chunk_size):
+        '''
+        Private helper function for master process to hand out chunks of items
+        to workers and collect results.
+        '''
+        mpi_comm = self._schedule_comm()
+        status = MPI.Status()
+
+        n = len(items)
+        results = [None]*n
+        n_tasks, busy_times = [0]*self.size, [0.0]*self.size
+        idle_times, done_times = [0.0]*self.size, [0.0]*self.size
+        chunk_sizes = []
+
+        next_item, n_done = 0, 0
+        start = perf_counter()
+
+        while n_done < self.size - 1:
+            # Compute a single cheap item in master if no worker is waiting.
+            # NOTE: Only scheduling messages are sent in the communicator.
+            time_per_item = self._time_per_item(n_tasks, busy_times)
+            if (next_item < n and time_per_item is not None and
+                    time_per_item < target_time and
+                    not mpi_comm.Iprobe(source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG)):
+                t0 = perf_counter()
+                results[next_item], = func(items[next_item: next_item+1])
+                busy_times[0] += perf_counter() - t0
+                n_tasks[0] += 1
+                next_item += 1
+                continue
+
+            t0 = perf_counter()
+            chunk_results, busy, idle = mpi_comm.recv(source=MPI.ANY_SOURCE,
+                                                      tag=MPI.ANY_TAG,
+                                                      status=status)
+            if next_item >= n:
+                idle_times[0] += perf_counter() - t0
+            source, tag = status.Get_source(), status.Get_tag()
+
+            for i, result in chunk_results:
+                results[i] = result
+            n_tasks[source] += len(chunk_results)
+            busy_times[source] += busy
+            idle_times[source] += idle
+
+            if tag == _DONE_TAG:
+                n_done += 1
+                done_times[source] = perf_counter()
+                continue
+
+            # Hand out the next chunk, None means no more items.
+            if next_item < n:
+                size = self._chunk_size(n - next_item, n_tasks, busy_times,
+                                        target_time, chunk_size)
+                chunk = (next_item, next_item + size)
+                chunk_sizes.append(size)
+                next_item += size
+            else:
+                chunk = None
+            mpi_comm.send(chunk, dest=source, tag=_TASK_TAG)
+
+        end = perf_counter()
+
+        # Workers are idle after they finish until all results are collected.
+        for rank in range(1, self.size):
+            idle_times[rank] += end - done_times[rank]
+
+        report = ScheduleReport(n_tasks=n_tasks, busy_times=busy_times,
+                                idle_times=idle_times, chunk_sizes=chunk_sizes,
+                                elapsed=end - start)
+
+        return results, report
+
+    def _chunk_size(self, n_remaining, n_tasks, busy_times, target_time, chunk_size):
+        '''
+        Private helper function to get the size of next chunk from the observed
+        time per item, one chunk is not larger than a half of the remaining items
+        shared by all processes.
+        '''
+        time_per_item = self._time_per_item(n_tasks, busy_times)
+        if time_per_item is not None:
+            chunk_size = int(target_time/time_per_item)
+
+        max_size = n_remaining // (2*self.size)
+        return max(1, min(chunk_size, max_size))
+
+    @staticmethod
+    def _time_per_item(n_tasks, busy_times):
+        '''
+        Private helper function to get the observed time per item, None is
+        returned if no item is computed yet.
+        '''
+        n_computed = sum(n_tasks)
+        if n_computed > 0 and sum(busy_times) > 0.0:
+            return sum(busy_times)/n_computed
+        return None
+
+    @staticmethod
+    def _schedule_comm():
+        '''
+        Private helper function to get the communicator for master-worker
+        scheduling, which keeps scheduling messages apart from other point to
+        point messages in COMM_WORLD.
+        '''
+        global _schedule_comm
+        if _schedule_comm is None:
+            _schedule_comm = MPI.COMM_WORLD.Dup()
+        return _schedule_comm
+
+    def _work(self, func, items):
+        '''
+        Private helper function for worker processes to compute chunks of items
+        from master process and send the results back.
+        '''
+        mpi_comm = self._schedule_comm()
+
+        mpi_comm.send(([], 0.0, 0.0), dest=0, tag=_REQUEST_TAG)
+        t0 = perf_counter()
+        chunk = mpi_comm.recv(source=0, tag=_TASK_TAG)
+        idle = perf_counter() - t0
+
+        results, busy = [], 0.0
+        while chunk is not None:
+            # Report results of the previous chunk and request the next one in advance.
+            mpi_comm.send((results, busy, idle), dest=0, tag=_REQUEST_TAG)
+
+            start, stop = chunk
+            t0 = perf_counter()
+            results = list(zip(range(start, stop), func(items[start: stop])))
+            busy = perf_counter() - t0
+
+            t0 = perf_counter()
+            chunk = mpi_comm.recv(source=0, tag=_TASK_TAG)
+            idle = perf_counter() - t0
+
+        mpi_comm.send((results, busy, idle), dest=0, tag=_DONE_TAG)
 
     def merge_seq(self, seq):
         ''' Gather data in sub-process to root process.
@@ -134,9 +597,138 @@ class MPIUtil(object):
         if self.size == 1:
             return seq
 
-        mpi_comm = MPI.COMM_WORLD
-        merged_seq= mpi_comm.allgather(seq)
-        return list(chain(*merged_seq))
+        return list(chain(*self.allgather(seq)))
+
+
+class CommTrace(object):
+    ''' Timeline of computation and communication in current process for
+    checking how much communication is hidden behind computation.
+
+    Three categories of spans are recorded:
+
+        - 'compute': computation like breeding and evaluation.
+        - 'comm': a non-blocking communication from posting to completion.
+        - 'wait': blocking time waiting for communications to complete.
+
+    Only communications with outstanding requests are recorded, so nothing is
+    hidden in a single process.
+
+    .. Note::
+        Completion of a non-blocking communication is only observed when it
+        is tested or waited, so 'comm' spans are upper bounds of the time in
+        flight and so is the hidden fraction. Compare the wall time with the
+        one without overlapping to know if the overlap pays off.
+    '''
+    def __init__(self):
+        self.events = []
+        self._start = perf_counter()
+
+    @contextmanager
+    def span(self, name, category='compute'):
+        ''' Context manager recording a span of the code block.
+
+        :param name: Name of the span
+        :type name: str
+
+        :param category: Category of the span, 'compute', 'comm' or 'wait'
+        :type category: str
+        '''
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, category, start, perf_counter())
+
+    def add(self, name, category, start, end):
+        ''' Add a span with the start and end time from :func:`time.perf_counter`.
+        '''
+        self.events.append((name, category, start - self._start, end - self._start))
+
+    def summary(self):
+        ''' Get total time of all categories, the wall time from the first span
+        to the last one and the fraction of communication time hidden behind
+        computation.
+
+        The hidden fraction is the time communications are in flight while
+        computing over the time they are in flight while computing or waiting,
+        it is None if there is no communication (e.g. in a single process).
+
+        :rtype: dict
+        '''
+        totals = {'compute': 0.0, 'comm': 0.0, 'wait': 0.0}
+        spans = {}
+        for _, category, start, end in self.events:
+            totals[category] = totals.get(category, 0.0) + (end - start)
+            spans.setdefault(category, []).append((start, end))
+
+        if self.events:
+            totals['wall'] = (max(end for _, _, _, end in self.events) -
+                              min(start for _, _, start, _ in self.events))
+        else:
+            totals['wall'] = 0.0
+
+        comm = _merge_spans(spans.get('comm', []))
+        if MPIUtil().size == 1 or not comm:
+            totals['hidden'] = None
+        else:
+            computing = _overlap(comm, _merge_spans(spans.get('compute', [])))
+            waiting = _overlap(comm, _merge_spans(spans.get('wait', [])))
+            busy = computing + waiting
+            totals['hidden'] = computing/busy if busy > 0.0 else 0.0
+
+        return totals
+
+    def dump(self, filename):
+        ''' Gather traces in all processes and write them to a file in Chrome
+        trace event format in master process (open with chrome://tracing or
+        Perfetto), it must be called in all processes.
+
+        :param filename: The name of the output file
+        :type filename: str
+        '''
+        mpi = MPIUtil()
+        all_events = mpi.allgather(self.events)
+        if not mpi.is_master:
+            return
+
+        trace_events = []
+        for rank, events in enumerate(all_events):
+            for name, category, start, end in events:
+                trace_events.append({'name': name, 'cat': category, 'ph': 'X',
+                                     'ts': start*1e6, 'dur': (end - start)*1e6,
+                                     'pid': 0, 'tid': rank})
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace_events}, f)
+
+
+def _merge_spans(spans):
+    '''
+    Helper function to merge spans into sorted disjoint ones.
+    '''
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _overlap(spans1, spans2):
+    '''
+    Helper function to get the total length of intersections of two lists of
+    sorted disjoint spans.
+    '''
+    total, i, j = 0.0, 0, 0
+    while i < len(spans1) and j < len(spans2):
+        (start1, end1), (start2, end2) = spans1[i], spans2[j]
+        total += max(min(end1, end2) - max(start1, start2), 0.0)
+        if end1 < end2:
+            i += 1
+        else:
+            j += 1
+    return total
 
 
 def master_only(func):
@@ -8,6 +8,7 @@ from .selection.roulette_wheel_selection import RouletteWheelSelection
 from .selection.tournament_selection import TournamentSelection
 from .selection.linear_ranking_selection import LinearRankingSelection
 from .selection.exponential_ranking_selection import ExponentialRankingSelection
+from .selection.stochastic_universal_sampling import StochasticUniversalSampling
 from .mutation.flip_bit_mutation import FlipBitMutation
 from .mutation.flip_bit_mutation import FlipBitBigMutation
 
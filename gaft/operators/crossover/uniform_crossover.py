@@ -4,9 +4,9 @@
 ''' Uniform Crossover operator implementation. '''
 
 from random import random
-from copy import deepcopy
 
 from ...plugin_interfaces.operators.crossover import Crossover
+from ...components.binary_individual import BinaryIndividual, random_mask
 
 
 class UniformCrossover(Crossover):
@@ -42,9 +42,17 @@ class UniformCrossover(Crossover):
         if not do_cross:
             return father.clone(), mother.clone()
 
+        if isinstance(father, BinaryIndividual) and isinstance(mother, BinaryIndividual):
+            # Exchange all selected bits with one blend mask.
+            diff = (father.bits ^ mother.bits) & random_mask(father.length, self.pe)
+            child1, child2 = father.clone(), father.clone()
+            child1.init(bits=father.bits ^ diff)
+            child2.init(bits=mother.bits ^ diff)
+            return child1, child2
+
         # Chromsomes for two children.
-        chrom1 = deepcopy(father.chromsome)
-        chrom2 = deepcopy(mother.chromsome)
+        chrom1 = list(father.chromsome)
+        chrom2 = list(mother.chromsome)
 
         for i, (g1, g2) in enumerate(zip(chrom1, chrom2)):
             do_exchange = True if random() < self.pe else False
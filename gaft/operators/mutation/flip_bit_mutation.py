@@ -7,7 +7,7 @@ from random import random, uniform
 
 from ...mpiutil import MPIUtil
 from ...plugin_interfaces.operators.mutation import Mutation
-from ...components.binary_individual import BinaryIndividual
+from ...components.binary_individual import BinaryIndividual, random_mask
 from ...components.decimal_individual import DecimalIndividual
 
 mpi = MPIUtil()
@@ -39,25 +39,32 @@ class FlipBitMutation(Mutation):
         '''
         do_mutation = True if random() <= self.pm else False
 
-        if do_mutation:
+        if do_mutation and isinstance(individual, BinaryIndividual):
+            # Flip all selected bits with one XOR mask.
+            mask = random_mask(individual.length, self.pm)
+            if mask:
+                # Solution would be decoded on demand.
+                individual.bits ^= mask
+        elif do_mutation:
+            mutated = False
             for i, genome in enumerate(individual.chromsome):
                 no_flip = True if random() > self.pm else False
                 if no_flip:
                     continue
 
-                if type(individual) is BinaryIndividual:
-                    individual.chromsome[i] = genome^1
-                elif type(individual) is DecimalIndividual:
+                if isinstance(individual, DecimalIndividual):
                     a, b = individual.ranges[i]
                     eps = individual.precisions[i]
                     n_intervals = (b - a)//eps
                     n = int(uniform(0, n_intervals + 1))
                     individual.chromsome[i] = a + n*eps
+                    mutated = True
                 else:
                     raise TypeError('Wrong individual type: {}'.format(type(individual)))
 
-            # Update solution.
-            individual.solution = individual.decode()
+            # Solution would be decoded on demand.
+            if mutated:
+                individual.chromsome = individual.chromsome
 
         return individual
 
@@ -3,5 +3,6 @@
 from .exponential_ranking_selection import ExponentialRankingSelection
 from .linear_ranking_selection import LinearRankingSelection
 from .roulette_wheel_selection import RouletteWheelSelection
+from .stochastic_universal_sampling import StochasticUniversalSampling
 from .tournament_selection import TournamentSelection
 
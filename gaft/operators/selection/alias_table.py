@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Alias table for sampling from discrete distributions in constant time. '''
+
+from random import random
+
+
+class AliasTable(object):
+    ''' Alias table built by Vose's alias method for drawing indices with
+    probabilities proportional to non-negative weights, each draw costs O(1)
+    after the O(N) setup.
+
+    :param weights: Non-negative weights for all indices, uniform distribution
+                    is used if all weights are zero.
+    :type weights: list of float
+    '''
+    def __init__(self, weights):
+        n = len(weights)
+        if n == 0:
+            raise ValueError('Weights must not be empty')
+
+        total = sum(weights)
+        if total < 0.0 or any(w < 0.0 for w in weights):
+            raise ValueError('Weights must be non-negative')
+
+        # Scaled probabilities with average 1.0.
+        if total == 0.0:
+            scaled = [1.0]*n
+        else:
+            scaled = [w*n/total for w in weights]
+
+        self.n = n
+        self.prob, self.alias = [1.0]*n, list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s], self.alias[s] = scaled[s], l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+
+        # NOTE: Remaining probabilities are 1.0 except for round-off errors.
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def draw(self):
+        ''' Draw an index.
+
+        :return: The index drawn
+        :rtype: int
+        '''
+        u = random()*self.n
+        i = int(u)
+        return i if (u - i) < self.prob[i] else self.alias[i]
+
+    def draw_many(self, k):
+        ''' Draw indices independently.
+
+        :param k: The number of indices to be drawn
+        :type k: int
+
+        :return: The indices drawn
+        :rtype: list of int
+        '''
+        n, prob, alias = self.n, self.prob, self.alias
+        indices = []
+        append = indices.append
+        for u in [random()*n for _ in range(k)]:
+            i = int(u)
+            append(i if (u - i) < prob[i] else alias[i])
+        return indices
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Base class for ranking selection operators. '''
+
+from ...plugin_interfaces.operators.selection import Selection
+from .roulette_wheel import RouletteWheel
+
+
+class RankingSelection(Selection):
+    ''' Base class for selection operators drawing parents on a wheel of ranks,
+    the wheel depends only on the population size and the parameters of the
+    operator, so it is created only once for them.
+
+    Subclasses provide the selection probabilities of ranks in
+    :meth:`rank_probabilities` and the parameters they depend on in
+    :meth:`wheel_params`.
+    '''
+    def __init__(self):
+        # Cached rank wheels for different population sizes and parameters.
+        self._wheels = {}
+
+    def select(self, population, fitness):
+        ''' Select a pair of parent individuals using the ranking method.
+
+        :param population: Population where the selection operation occurs.
+        :type population: :obj:`gaft.components.Population`
+
+        :return: Selected parents (a father and a mother)
+        :rtype: list of :obj:`gaft.components.IndividualBase`
+        '''
+        # Add rank to all individuals in population.
+        indvs = population.individuals
+        sorted_indices = population.argsort(fitness)
+
+        # Select parents.
+        father_idx, mother_idx = self._wheel(len(population)).spin()
+        father = indvs[sorted_indices[father_idx]]
+        mother = indvs[sorted_indices[mother_idx]]
+
+        return father, mother
+
+    def select_batch(self, population, fitness, n_pairs):
+        ''' Select pairs of parent individuals using the ranking method with
+        the population ranked only once.
+
+        :param population: Population where the selection operation occurs.
+        :type population: :obj:`gaft.components.Population`
+
+        :param n_pairs: The number of parent pairs to be selected.
+        :type n_pairs: int
+
+        :return: Indices of selected parents (fathers and mothers)
+        :rtype: list of (int, int)
+        '''
+        sorted_indices = population.argsort(fitness)
+        wheel = self._wheel(len(population))
+
+        return [(sorted_indices[father_idx], sorted_indices[mother_idx])
+                for father_idx, mother_idx in wheel.spin_many(n_pairs)]
+
+    def rank_probabilities(self, NP):
+        ''' **NEED IMPLIMENTATION**
+
+        Get the selection probabilities of ranks from the worst to the best.
+
+        :param NP: The number of individuals
+        :type NP: int
+
+        :return: Selection probabilities (not necessarily normalized)
+        :rtype: list of float
+        '''
+        raise NotImplementedError
+
+    def wheel_params(self):
+        ''' **NEED IMPLIMENTATION**
+
+        Get the parameters the selection probabilities depend on.
+
+        :return: The parameters
+        :rtype: tuple
+        '''
+        raise NotImplementedError
+
+    def _wheel(self, NP):
+        '''
+        Helper function to get the wheel of ranks for NP individuals, the wheel
+        is created only once for the same population size and parameters.
+        '''
+        key = (NP, self.wheel_params())
+        if key not in self._wheels:
+            self._wheels[key] = RouletteWheel(self.rank_probabilities(NP))
+        return self._wheels[key]
+
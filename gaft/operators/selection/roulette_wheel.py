@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Roulette wheel for sampling parents with cumulative probabilities. '''
+
+from random import random
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class RouletteWheel(object):
+    ''' Roulette wheel with cumulative probabilities proportional to
+    non-negative weights, a father is drawn by binary search on the wheel and
+    the mother is the next individual of the father.
+
+    :param weights: Non-negative weights for all indices, uniform distribution
+                    is used if all weights are zero.
+    :type weights: list of float
+    '''
+    def __init__(self, weights):
+        total = sum(weights)
+        if total == 0.0:
+            weights, total = [1.0]*len(weights), float(len(weights))
+        self.cumulative = tuple(accumulate([w/total for w in weights]))
+
+    def __len__(self):
+        return len(self.cumulative)
+
+    def __getitem__(self, key):
+        return self.cumulative[key]
+
+    def spin(self):
+        ''' Get indices of a father and a mother on the wheel.
+
+        :return: Indices of the father and the mother
+        :rtype: (int, int)
+        '''
+        n = len(self.cumulative)
+        # NOTE: The last cumulative probability may be slightly less than 1.0
+        father_idx = min(bisect_right(self.cumulative, random()), n - 1)
+        return father_idx, (father_idx + 1) % n
+
+    def spin_many(self, k):
+        ''' Get indices of k pairs of fathers and mothers on the wheel.
+
+        :param k: The number of pairs
+        :type k: int
+
+        :return: Indices of fathers and mothers
+        :rtype: list of (int, int)
+        '''
+        cumulative, n = self.cumulative, len(self.cumulative)
+        father_indices = [min(bisect_right(cumulative, r), n - 1)
+                          for r in [random() for _ in range(k)]]
+        return [(i, (i + 1) % n) for i in father_indices]
+
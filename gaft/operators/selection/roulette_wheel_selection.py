@@ -3,18 +3,30 @@
 
 ''' Roulette Wheel Selection implementation. '''
 
-from random import random
-from bisect import bisect_right
-from itertools import accumulate
-
 from ...plugin_interfaces.operators.selection import Selection
+from .alias_table import AliasTable
+from .roulette_wheel import RouletteWheel
 
 class RouletteWheelSelection(Selection):
     ''' Selection operator with fitness proportionate selection(FPS) or
     so-called roulette-wheel selection implementation.
+
+    :param sampler: The sampling method on the roulette wheel, possible values:
+
+        - 'wheel': binary search on the cumulative wheel for the father, the
+          mother is the next individual of the father (default).
+        - 'alias': Walker's alias method with the alias table built once for
+          a generation, the father and mother are drawn independently in O(1).
+
+    :type sampler: str
     '''
-    def __init__(self):
-        pass
+    def __init__(self, sampler='wheel'):
+        if sampler not in ['wheel', 'alias']:
+            raise ValueError('Invalid sampler type({})'.format(sampler))
+        self.sampler = sampler
+
+        # Alias table and the population state it was built for.
+        self._table, self._table_key = None, None
 
     def select(self, population, fitness):
         ''' Select a pair of parent using FPS algorithm.
@@ -25,20 +37,58 @@ class RouletteWheelSelection(Selection):
         :return: Selected parents (a father and a mother)
         :rtype: list of :obj:`gaft.components.IndividualBase`
         '''
-        # Normalize fitness values for all individuals.
-        fit = population.all_fits(fitness)
-        min_fit = min(fit)
-        fit = [(i - min_fit) for i in fit]
-
-        # Create roulette wheel.
-        sum_fit = sum(fit)
-        wheel = list(accumulate([i/sum_fit for i in fit]))
+        if self.sampler == 'alias':
+            table = self._alias_table(population, fitness)
+            father_idx, mother_idx = table.draw(), table.draw()
+        else:
+            father_idx, mother_idx = self._wheel(population, fitness).spin()
 
         # Select a father and a mother.
-        father_idx = bisect_right(wheel, random())
         father = population[father_idx]
-        mother_idx = (father_idx + 1) % len(wheel)
         mother = population[mother_idx]
 
         return father, mother
 
+    def select_batch(self, population, fitness, n_pairs):
+        ''' Select pairs of parents using FPS algorithm with the roulette wheel
+        created only once.
+
+        :param population: Population where the selection operation occurs.
+        :type population: :obj:`gaft.components.Population`
+
+        :param n_pairs: The number of parent pairs to be selected.
+        :type n_pairs: int
+
+        :return: Indices of selected parents (fathers and mothers)
+        :rtype: list of (int, int)
+        '''
+        if self.sampler == 'alias':
+            indices = self._alias_table(population, fitness).draw_many(2*n_pairs)
+            return list(zip(indices[::2], indices[1::2]))
+
+        return self._wheel(population, fitness).spin_many(n_pairs)
+
+    def _alias_table(self, population, fitness):
+        '''
+        Helper function to get the alias table of the population, the table is
+        rebuilt only when the population or the fitness function changes.
+        '''
+        key = (population, population.version, fitness)
+        if (self._table_key is None or
+                any(a is not b for a, b in zip(key, self._table_key))):
+            fit = population.all_fits(fitness)
+            min_fit = min(fit)
+            self._table = AliasTable([(i - min_fit) for i in fit])
+            self._table_key = key
+        return self._table
+
+    @staticmethod
+    def _wheel(population, fitness):
+        '''
+        Helper function to create the roulette wheel.
+        '''
+        # Normalize fitness values for all individuals.
+        fit = population.all_fits(fitness)
+        min_fit = min(fit)
+        return RouletteWheel([(i - min_fit) for i in fit])
+
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Stochastic Universal Sampling implementation. '''
+
+from random import random, shuffle
+
+from ...plugin_interfaces.operators.selection import Selection
+
+
+class StochasticUniversalSampling(Selection):
+    ''' Selection operator using Stochastic Universal Sampling (SUS) method,
+    all parents are selected with equally spaced pointers on the roulette wheel
+    with only one random offset.
+
+    Reference: Baker J E. Reducing bias and inefficiency in the selection
+    algorithm[C]//Proceedings of the second international conference on genetic
+    algorithms. 1987: 14-21.
+    '''
+    def select(self, population, fitness):
+        ''' Select a pair of parent using SUS algorithm.
+
+        :param population: Population where the selection operation occurs.
+        :type population: :obj:`gaft.components.Population`
+
+        :return: Selected parents (a father and a mother)
+        :rtype: list of :obj:`gaft.components.IndividualBase`
+        '''
+        father_idx, mother_idx = self.select_batch(population, fitness, 1)[0]
+        indvs = population.individuals
+
+        return indvs[father_idx], indvs[mother_idx]
+
+    def select_batch(self, population, fitness, n_pairs):
+        ''' Select pairs of parents using SUS algorithm with one sweep of the
+        roulette wheel.
+
+        :param population: Population where the selection operation occurs.
+        :type population: :obj:`gaft.components.Population`
+
+        :param n_pairs: The number of parent pairs to be selected.
+        :type n_pairs: int
+
+        :return: Indices of selected parents (fathers and mothers)
+        :rtype: list of (int, int)
+        '''
+        indices = self._sample(population.all_fits(fitness), 2*n_pairs)
+
+        # Selected indices are in order of the wheel, shuffle them before pairing.
+        shuffle(indices)
+
+        return list(zip(indices[::2], indices[1::2]))
+
+    @staticmethod
+    def _sample(all_fits, n):
+        '''
+        Helper function to get indices of n individuals selected by equally
+        spaced pointers on the roulette wheel.
+        '''
+        # Normalize fitness values for all individuals.
+        min_fit = min(all_fits)
+        fit = [(i - min_fit) for i in all_fits]
+        sum_fit = sum(fit)
+
+        # Uniform wheel if all fitness values are the same.
+        if sum_fit == 0.0:
+            fit, sum_fit = [1.0]*len(fit), float(len(fit))
+
+        step = sum_fit/n
+        pointer = random()*step
+
+        indices = []
+        idx, cumulative = 0, fit[0]
+        last = len(fit) - 1
+        for _ in range(n):
+            # NOTE: Round-off errors may push the last pointer out of the wheel.
+            while pointer >= cumulative and idx < last:
+                idx += 1
+                cumulative += fit[idx]
+            indices.append(idx)
+            pointer += step
+
+        return indices
+
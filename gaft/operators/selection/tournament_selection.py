@@ -3,7 +3,7 @@
 
 ''' Tournament Selection implementation. '''
 
-from random import sample
+from random import random, sample
 
 from ...plugin_interfaces.operators.selection import Selection
 
@@ -14,9 +14,24 @@ class TournamentSelection(Selection):
 
     :param tournament_size: Individual number in one tournament
     :type tournament_size: int
+
+    :param replacement: Whether the competitors in one tournament are drawn with
+                        replacement, default is False
+    :type replacement: bool
+
+    :param pressure: Selection pressure, the probability that the best competitor
+                     wins the tournament, if it loses the second best wins with
+                     the same probability and so on. Default is 1.0
+                     (deterministic tournament)
+    :type pressure: float in range (0.0, 1.0]
     '''
-    def __init__(self, tournament_size=2):
+    def __init__(self, tournament_size=2, replacement=False, pressure=1.0):
+        if not (0.0 < pressure <= 1.0):
+            raise ValueError('Selection pressure must in range (0.0, 1.0]')
+
         self.tournament_size = tournament_size
+        self.replacement = replacement
+        self.pressure = pressure
 
     def select(self, population, fitness):
         ''' Select a pair of parent using Tournament strategy.
@@ -27,24 +42,58 @@ class TournamentSelection(Selection):
         :return: Selected parents (a father and a mother)
         :rtype: list of :obj:`gaft.components.IndividualBase`
         '''
-        # Competition function.
+        father_idx, mother_idx = self.select_batch(population, fitness, 1)[0]
+        indvs = population.individuals
+
+        return indvs[father_idx], indvs[mother_idx]
+
+    def select_batch(self, population, fitness, n_pairs):
+        ''' Select pairs of parents using Tournament strategy with all
+        tournaments drawn at once.
+
+        :param population: Population where the selection operation occurs.
+        :type population: :obj:`gaft.components.Population`
+
+        :param n_pairs: The number of parent pairs to be selected.
+        :type n_pairs: int
+
+        :return: Indices of selected parents (fathers and mothers)
+        :rtype: list of (int, int)
+        '''
         all_fits = population.all_fits(fitness)
-        def complete(competitors):
-            '''
-            Competition function.
-            '''
-            key = lambda indv: all_fits[population.individuals.index(indv)]
-            return max(competitors, key=key)
+        tournaments = self._tournaments(len(population), 2*n_pairs)
+        winners = [self._compete(competitors, all_fits) for competitors in tournaments]
+
+        return list(zip(winners[::2], winners[1::2]))
+
+    def _tournaments(self, NP, n):
+        '''
+        Helper function to draw competitor indices of n tournaments.
+        '''
+        k = self.tournament_size
+
+        if self.replacement:
+            indices = [int(random()*NP) for _ in range(n*k)]
+            return [indices[i: i+k] for i in range(0, n*k, k)]
 
         # Check validity of tournament size.
-        if self.tournament_size >= len(population):
+        if k >= NP:
             msg = 'Tournament size({}) is larger than population size({})'
-            raise ValueError(msg.format(self.tournament_size, len(population)))
+            raise ValueError(msg.format(k, NP))
+
+        indices = range(NP)
+        return [sample(indices, k) for _ in range(n)]
 
-        # Pick winners of two groups as parent.
-        competitors_1 = sample(population.individuals, self.tournament_size)
-        competitors_2 = sample(population.individuals, self.tournament_size)
-        father, mother = complete(competitors_1), complete(competitors_2)
+    def _compete(self, competitors, all_fits):
+        '''
+        Helper function to get the index of the winner in a tournament.
+        '''
+        if self.pressure >= 1.0:
+            return max(competitors, key=all_fits.__getitem__)
 
-        return father, mother
+        ranked = sorted(competitors, key=all_fits.__getitem__, reverse=True)
+        for idx in ranked[: -1]:
+            if random() < self.pressure:
+                return idx
+        return ranked[-1]
 
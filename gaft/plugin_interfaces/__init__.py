@@ -1,3 +1,4 @@
 from ..plugin_interfaces.operators import *
 from ..plugin_interfaces.analysis import OnTheFlyAnalysis
 
+from ..plugin_interfaces.evaluator import Evaluator
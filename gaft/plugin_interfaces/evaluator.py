@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Module for fitness evaluator class '''
+
+from .metaclasses import EvaluatorMeta
+
+
+class Evaluator(metaclass=EvaluatorMeta):
+    ''' Class for providing an interface to easily extend the way how the
+    objective function is evaluated for all individuals in a generation.
+    '''
+
+    def evaluate(self, objective, individuals):
+        ''' Called when the objective values of individuals in a new generation
+        are needed.
+
+        :param objective: The user-defined objective function
+        :type objective: function
+
+        :param individuals: Individuals to be evaluated
+        :type individuals: list of gaft.components.IndividualBase
+
+        :return values: Objective values in the same order with individuals
+        :type values: list of float
+        '''
+        raise NotImplementedError
+
+    def shutdown(self):
+        ''' Called after the evolution iteration to release resources held by
+        the evaluator.
+        '''
+        pass
@@ -131,36 +131,88 @@ class SelectionMeta(type):
     '''
     def __new__(cls, name, bases, attrs):
         # Check select method.
-        if 'select' not in attrs:
+        # NOTE: The select method inherited from a base selection operator
+        #       (not the interface) has been checked and wrapped already.
+        inherited = any(isinstance(b, SelectionMeta)
+                        for base in bases for b in base.__mro__[1:])
+        if 'select' not in attrs and not inherited:
             raise AttributeError('selection operator class must have select method')
 
-        select = attrs['select']
+        if 'select' in attrs:
+            select = attrs['select']
+
+            # Check select arguments.
+            sig = inspect.signature(select)
+            if 'population' not in sig.parameters:
+                raise NameError('select method must have population parameter')
+            if 'fitness' not in sig.parameters:
+                raise NameError('select method must have fitness parameter')
+
+            # Add parameter check to user-defined method.
+            @wraps(select)
+            def _wrapped_select(self, population, fitness):
+                ''' Wrapper to add parameters type checking.
+                '''
+                # Check parameter types.
+                if not isinstance(population, Population):
+                    raise TypeError('population must be Population object')
+                if not callable(fitness):
+                    raise TypeError('fitness must be a callable object')
+
+                return select(self, population, fitness)
+
+            attrs['select'] = _wrapped_select
+
+        # Check optional batch select method.
+        select_batch = attrs.get('select_batch', None)
+        if select_batch is not None:
+            sig = inspect.signature(select_batch)
+            for param in ['population', 'fitness', 'n_pairs']:
+                if param not in sig.parameters:
+                    raise NameError('select_batch method must have {} parameter'.format(param))
+
+            @wraps(select_batch)
+            def _wrapped_select_batch(self, population, fitness, n_pairs):
+                ''' Wrapper to add parameters type checking.
+                '''
+                # Check parameter types.
+                if not isinstance(population, Population):
+                    raise TypeError('population must be Population object')
+                if not callable(fitness):
+                    raise TypeError('fitness must be a callable object')
+                if type(n_pairs) is not int or n_pairs < 0:
+                    raise ValueError('n_pairs must be a non-negative integer')
+
+                return select_batch(self, population, fitness, n_pairs)
+
+            attrs['select_batch'] = _wrapped_select_batch
 
-        # Check select arguments.
-        sig = inspect.signature(select)
-        if 'population' not in sig.parameters:
-            raise NameError('select method must have population parameter')
-        if 'fitness' not in sig.parameters:
-            raise NameError('select method must have fitness parameter')
+        # Set logger.
+        logger_name = 'gaft.{}'.format(name)
+        attrs['logger'] = logging.getLogger(logger_name)
 
-        # Add parameter check to user-defined method.
-        @wraps(select)
-        def _wrapped_select(self, population, fitness):
-            ''' Wrapper to add parameters type checking.
-            '''
-            # Check parameter types.
-            if not isinstance(population, Population):
-                raise TypeError('population must be Population object')
-            if not callable(fitness):
-                raise TypeError('fitness must be a callable object')
+        return type.__new__(cls, name, bases, attrs)
+
+
+class EvaluatorMeta(type):
+    ''' Metaclass for fitness evaluator class.
+    '''
+    def __new__(cls, name, bases, attrs):
+        # Check evaluate method.
+        if 'evaluate' not in attrs:
+            raise AttributeError('evaluator class must have evaluate method')
 
-            return select(self, population, fitness)
+        evaluate = attrs['evaluate']
 
-        attrs['select'] = _wrapped_select
+        # Check evaluate arguments.
+        sig = inspect.signature(evaluate)
+        if 'objective' not in sig.parameters:
+            raise NameError('evaluate method must have objective parameter')
+        if 'individuals' not in sig.parameters:
+            raise NameError('evaluate method must have individuals parameter')
 
         # Set logger.
         logger_name = 'gaft.{}'.format(name)
         attrs['logger'] = logging.getLogger(logger_name)
 
         return type.__new__(cls, name, bases, attrs)
-
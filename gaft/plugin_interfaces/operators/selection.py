@@ -8,6 +8,12 @@ from ..metaclasses import SelectionMeta
 class Selection(metaclass=SelectionMeta):
     ''' Class for providing an interface to easily extend the behavior of selection
     operation.
+
+    .. Note::
+        A selection operator can optionally provide a method
+        ``select_batch(self, population, fitness, n_pairs)`` returning indices
+        of all parent pairs for a generation, the engine would use it instead
+        of calling ``select`` for each pair.
     '''
 
     def select(self, population, fitness):
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Genetic Algorithm engine definition for population sharded in MPI processes
+'''
+
+from random import choices, shuffle
+from array import array
+
+from .engine import GAEngine, do_profile, mpi
+from .components import ShardedPopulation
+
+
+class ShardedEngine(GAEngine):
+    ''' Genetic Algorithm engine for a population too large to be replicated in
+    all MPI processes. Each process holds a shard of a
+    :obj:`gaft.components.ShardedPopulation` and breeds the children replacing
+    its own shard, individuals are never gathered to a single process.
+
+    Parents are selected globally in two steps: the owner process of each parent
+    is sampled proportional to the fitness mass of its shard (sum of fitness
+    values shifted by the global minimum), then the owner selects parents in its
+    shard with the selection operator and sends only the chosen parents to the
+    processes requesting them.
+
+    Statistical variables like ``fmax`` are about the whole population and are
+    reduced from all shards in each generation, the best individual of the whole
+    population is retained by its owner process.
+
+    Parameters are the same as :obj:`gaft.engine.GAEngine` except that the
+    population must be a :obj:`gaft.components.ShardedPopulation`.
+    '''
+    @do_profile(filename='gaft_run.prof')
+    def run(self, ng=100):
+        ''' Run the Genetic Algorithm optimization iteration with the population
+        sharded in all processes.
+
+        :param ng: Evolution iteration steps (generation number)
+        :type ng: int
+        '''
+        if self.fitness is None:
+            raise AttributeError('No fitness function in GA engine')
+
+        self._evaluate()
+        self._update_statvars()
+
+        # Setup analysis objects.
+        for a in self.analysis:
+            a.setup(ng=ng, engine=self)
+
+        # Enter evolution iteration.
+        try:
+            for g in range(ng):
+                self.current_generation = g
+
+                # The best individual in the whole population.
+                best_idx = self.population.local_index(self.stats.argmax)
+
+                # Fill the new shard.
+                shard_size = self.population.shard_size
+                indvs = self._breed((shard_size + 1) // 2)[: shard_size]
+
+                # Retain the previous best individual in its owner process.
+                if best_idx is not None:
+                    indvs[0] = self.population[best_idx]
+                self.population.individuals = indvs
+
+                # Evaluate the new shard and update statistic variables.
+                self._evaluate()
+                self._update_statvars()
+
+                # Run all analysis if needed.
+                for a in self.analysis:
+                    if g % a.interval == 0:
+                        a.register_step(g=g, population=self.population, engine=self)
+        except Exception as e:
+            # Log exception info.
+            if mpi.is_master:
+                msg = '{} exception is catched'.format(type(e).__name__)
+                self.logger.exception(msg)
+            raise e
+        finally:
+            # Recover current generation number.
+            self.current_generation = -1
+            # Release resources of evaluator.
+            if self.evaluator is not None:
+                self.evaluator.shutdown()
+            # Perform the analysis post processing.
+            for a in self.analysis:
+                a.finalize(population=self.population, engine=self)
+
+    def _select_parents(self, n_pairs):
+        '''
+        Private helper function to select pairs of parents from the whole
+        population, owners of parents are sampled by the fitness mass of
+        their shards and only chosen parents are transferred.
+        '''
+        n = 2*n_pairs
+        population = self.population
+
+        if mpi.size == 1:
+            parents = self._select_in_shard(n)
+        else:
+            # Fitness mass of shards in all processes.
+            all_fits = population.all_fits(self.fitness)
+            mass = sum(all_fits) - population.min(self.fitness)*len(all_fits)
+            masses = mpi.allgatherv(array('d', [mass]))[0].tolist()
+            if sum(masses) <= 0.0:
+                masses = population.shard_sizes
+
+            # Number of parents requested from each process.
+            counts = [0]*mpi.size
+            for owner in choices(range(mpi.size), weights=masses, k=n):
+                counts[owner] += 1
+            requested = mpi.alltoall(counts)
+
+            # Select parents in current shard for all requesting processes.
+            selected = self._select_in_shard(sum(requested))
+
+            size = self._chromsome_size()
+            chromsomes, _ = mpi.alltoallv(self._pack_chromsomes(selected),
+                                          [c*size for c in requested],
+                                          [c*size for c in counts])
+            parents = self._unpack_chromsomes(chromsomes)
+
+            # NOTE: Received parents are grouped by their owners.
+            shuffle(parents)
+
+        return list(zip(parents[::2], parents[1::2]))
+
+    def _select_in_shard(self, n):
+        '''
+        Private helper function to select individuals in the shard of current
+        process using the selection operator.
+        '''
+        if n == 0:
+            return []
+
+        pairs = super(ShardedEngine, self)._select_parents((n + 1) // 2)
+        return [indv for pair in pairs for indv in pair][: n]
+
+    def _distributed_values(self, indvs):
+        '''
+        Private helper function to compute objective values of individuals
+        in the shard of current process only.
+        '''
+        return self._local_values(indvs)
+
+    def _update_statvars(self):
+        '''
+        Private helper function to update statistic variables of the whole
+        population and fetch the best individual for analysis plugins.
+        '''
+        super(ShardedEngine, self)._update_statvars()
+        self.population.best_indv(self.fitness)
+
+    def _check_parameters(self):
+        '''
+        Helper function to check parameters of engine.
+        '''
+        if not isinstance(self.population, ShardedPopulation):
+            raise TypeError('population must be a ShardedPopulation object')
+        super(ShardedEngine, self)._check_parameters()
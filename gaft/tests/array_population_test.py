@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Test case for ArrayPopulation
+'''
+
+import unittest
+import pickle
+from math import sin, cos
+
+from .. import GAEngine
+from ..components import ArrayPopulation, BinaryIndividual, DecimalIndividual
+from ..operators import RouletteWheelSelection, UniformCrossover, FlipBitMutation
+
+
+class ArrayPopulationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = True
+        self.indv_template = BinaryIndividual(ranges=[(0, 1), (0, 10)], eps=0.001)
+
+    def test_initialization(self):
+        ''' Make sure an array population can be initialized correctly. '''
+        population = ArrayPopulation(indv_template=self.indv_template, size=10)
+        self.assertListEqual(population.individuals, [])
+
+        population.init()
+        length = len(self.indv_template.chromsome)
+        self.assertEqual(len(population), 10)
+        self.assertEqual(population.chromsomes.typecode, 'B')
+        self.assertEqual(len(population.chromsomes), 10*length)
+        self.assertEqual(population.matrix.shape, (10, length))
+
+        # Individuals are row views of the chromsome array.
+        indv = population[3]
+        self.assertTrue(isinstance(indv, BinaryIndividual))
+        self.assertListEqual(list(indv.chromsome),
+                             population.matrix.tolist()[3])
+        self.assertEqual(indv.gene_indices, self.indv_template.gene_indices)
+        for x, (a, b) in zip(indv.solution, indv.ranges):
+            self.assertTrue(a <= x <= b)
+
+    def test_row_view(self):
+        ''' Make sure row views write through to the chromsome array. '''
+        population = ArrayPopulation(indv_template=self.indv_template, size=10).init()
+        indv = population[0]
+        solution = [0.5, 5.0]
+        indv.init(solution=solution)
+        for x, y in zip(indv.solution, solution):
+            self.assertAlmostEqual(x, y, places=2)
+        self.assertListEqual(population.matrix.tolist()[0], list(indv.chromsome))
+
+        # Clone is detached from the population.
+        indv_clone = indv.clone()
+        indv_clone.chromsome[0] ^= 1
+        self.assertNotEqual(list(indv_clone.chromsome), list(indv.chromsome))
+
+    def test_set_individuals(self):
+        ''' Make sure individuals can be packed into a new chromsome array. '''
+        population = ArrayPopulation(indv_template=self.indv_template, size=10).init()
+        indvs = [indv.clone() for indv in population.individuals]
+        indvs[0] = BinaryIndividual(ranges=[(0, 1), (0, 10)], eps=0.001)
+
+        population.individuals = indvs
+        self.assertTrue(population.updated)
+        self.assertListEqual(population.matrix.tolist(),
+                             [list(indv.chromsome) for indv in indvs])
+
+    def test_write_through_individuals(self):
+        ''' Make sure assigning individuals to indices writes the chromsome
+        array and invalidates memoized statistics. '''
+        population = ArrayPopulation(indv_template=self.indv_template, size=10).init()
+        fitness = lambda indv: indv.solution[0]
+        fmax = population.max(fitness)
+
+        indv = BinaryIndividual(ranges=[(0, 1), (0, 10)], eps=0.001).init(solution=[0.0, 5.0])
+        version = population.version
+        row = population[3]
+        population.individuals[3] = indv
+        self.assertFalse(population[3] is row)
+        self.assertTrue(population[3]._row.obj is row._row.obj)
+        self.assertTrue(population.version > version)
+        self.assertListEqual(population.matrix.tolist()[3], list(indv.chromsome))
+
+        for i in range(len(population)):
+            population.individuals[i] = indv
+        self.assertNotEqual(fmax, 0.0)
+        self.assertEqual(population.max(fitness), 0.0)
+
+        # Other changes repack the chromsome array.
+        version = population.version
+        population.individuals.append(indv)
+        self.assertEqual(len(population), 11)
+        self.assertEqual(len(population.chromsomes), 11*population.length)
+        self.assertListEqual(population.matrix.tolist()[10], list(indv.chromsome))
+        self.assertTrue(population.version > version)
+
+        population.individuals.pop()
+        self.assertEqual(len(population.chromsomes), 10*population.length)
+
+    def test_pickle(self):
+        ''' Make sure row views can be pickled for MPI communication. '''
+        population = ArrayPopulation(indv_template=self.indv_template, size=10).init()
+        indv = pickle.loads(pickle.dumps(population[1]))
+        self.assertTrue(isinstance(indv, BinaryIndividual))
+        self.assertListEqual(list(indv.chromsome), list(population[1].chromsome))
+
+    def test_decimal_population(self):
+        ''' Make sure decimal individuals are stored in a float array. '''
+        indv_template = DecimalIndividual(ranges=[(0, 1), (0, 2)], eps=0.001)
+        population = ArrayPopulation(indv_template=indv_template, size=10).init()
+        self.assertEqual(population.chromsomes.typecode, 'd')
+        self.assertEqual(population.matrix.shape, (10, 2))
+        self.assertListEqual(population[2].solution, population.matrix.tolist()[2])
+
+    def test_engine_run(self):
+        ''' Make sure GA engine can run with array population. '''
+        for IndvType in [BinaryIndividual, DecimalIndividual]:
+            indv_template = IndvType(ranges=[(0, 10)], eps=0.001)
+            population = ArrayPopulation(indv_template=indv_template, size=50).init()
+
+            selection = RouletteWheelSelection()
+            crossover = UniformCrossover(pc=0.8, pe=0.5)
+            mutation = FlipBitMutation(pm=0.1)
+
+            engine = GAEngine(population=population, selection=selection,
+                              crossover=crossover, mutation=mutation)
+
+            @engine.fitness_register
+            def fitness(indv):
+                x, = indv.solution
+                return x + 10*sin(5*x) + 7*cos(4*x)
+
+            engine.run(10)
+            self.assertEqual(len(population.chromsomes), 50*population.length)
+
+    def test_assign_evaluated_individuals(self):
+        ''' Make sure values of replaced individuals are not reused after
+        assigning individuals to an evaluated population. '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = ArrayPopulation(indv_template=indv_template, size=10).init()
+        for i, indv in enumerate(population.individuals):
+            indv.init(solution=[i*0.5])
+
+        engine = GAEngine(population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1))
+
+        @engine.fitness_register
+        def fitness(indv):
+            x, = indv.solution
+            return x
+
+        engine._evaluate()
+        self.assertAlmostEqual(engine.fitness(population[1]), 0.5, places=2)
+        fmax = population.max(engine.fitness)
+
+        indv = indv_template.clone().init(solution=[9.5])
+        population.individuals[1] = indv
+        self.assertAlmostEqual(engine.fitness(population[1]), 9.5, places=2)
+        self.assertAlmostEqual(population.max(engine.fitness), 9.5, places=2)
+        self.assertTrue(fmax < 9.5)
+
+        engine._evaluate()
+        self.assertAlmostEqual(engine.fitness(population[1]), 9.5, places=2)
+
+if '__main__' == __name__:
+    suite = unittest.TestLoader().loadTestsFromTestCase(ArrayPopulationTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Test case for built-in asyncio evaluator.
+'''
+
+import unittest
+import asyncio
+from math import sin, cos
+
+from .. import GAEngine
+from ..components import BinaryIndividual, Population
+from ..operators import RouletteWheelSelection, UniformCrossover, FlipBitMutation
+from ..evaluators import AsyncEvaluator
+
+
+class AsyncEvaluatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = True
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        self.population = Population(indv_template=indv_template, size=20).init()
+
+    def test_evaluate(self):
+        ''' Make sure coroutine objective can be evaluated concurrently with
+        concurrency limit.
+        '''
+        running = []
+        max_running = []
+
+        async def objective(indv):
+            running.append(indv)
+            max_running.append(len(running))
+            await asyncio.sleep(0.001)
+            running.remove(indv)
+            x, = indv.solution
+            return x
+
+        evaluator = AsyncEvaluator(concurrency=4)
+        try:
+            values = evaluator.evaluate(objective, self.population.individuals)
+        finally:
+            evaluator.shutdown()
+
+        self.assertListEqual(values, [indv.solution[0] for indv in self.population.individuals])
+        self.assertEqual(max(max_running), 4)
+
+    def test_evaluate_function(self):
+        ''' Make sure normal objective function can be evaluated in executor.
+        '''
+        evaluator = AsyncEvaluator()
+        try:
+            values = evaluator.evaluate(lambda indv: indv.solution[0],
+                                        self.population.individuals)
+        finally:
+            evaluator.shutdown()
+
+        self.assertListEqual(values, [indv.solution[0] for indv in self.population.individuals])
+
+    def test_engine_run(self):
+        ''' Make sure GA engine can run with coroutine fitness function.
+        '''
+        engine = GAEngine(population=self.population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1),
+                          evaluator=AsyncEvaluator(concurrency=8))
+
+        @engine.fitness_register
+        @engine.minimize
+        async def fitness(indv):
+            await asyncio.sleep(0)
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        engine.run(5)
+
+        # Coroutine fitness function can be called directly for one individual.
+        indv = self.population[0].clone()
+        x, = indv.solution
+        self.assertEqual(engine.fitness(indv), -(x + 10*sin(5*x) + 7*cos(4*x)))
+
+    def test_running_loop(self):
+        ''' Make sure GA engine and evaluator can run inside a running event
+        loop (e.g. in Jupyter).
+        '''
+        engine = GAEngine(population=self.population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1),
+                          evaluator=AsyncEvaluator())
+
+        @engine.fitness_register
+        async def fitness(indv):
+            await asyncio.sleep(0)
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        async def main():
+            engine.run(2)
+            return engine.fitness(self.population[0].clone())
+
+        value = asyncio.run(main())
+        x, = self.population[0].solution
+        self.assertEqual(value, x + 10*sin(5*x) + 7*cos(4*x))
+
+if '__main__' == __name__:
+    suite = unittest.TestLoader().loadTestsFromTestCase(AsyncEvaluatorTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
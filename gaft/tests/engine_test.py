@@ -13,6 +13,9 @@ from ..components import Population
 from ..operators import RouletteWheelSelection
 from ..operators import UniformCrossover
 from ..operators import FlipBitMutation
+from ..mpiutil import MPIUtil
+
+mpi = MPIUtil()
 
 
 class GAEngineTest(unittest.TestCase):
@@ -68,6 +71,207 @@ class GAEngineTest(unittest.TestCase):
 
         engine.run(50)
 
+    def test_consecutive_runs(self):
+        '''
+        Make sure GA engine can run again with known objective values of the
+        population reused in all processes.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=50).init()
+
+        engine = GAEngine(population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1))
+
+        ncalls = []
+
+        @engine.fitness_register
+        def fitness(indv):
+            ncalls.append(1)
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        engine.run(5)
+        self.assertEqual(sum(mpi.allgather(len(ncalls))), 50 + 5*49)
+
+        # Only new children are evaluated in the second run.
+        del ncalls[:]
+        engine.run(5)
+        self.assertEqual(sum(mpi.allgather(len(ncalls))), 5*49)
+
+    def test_batch_run(self):
+        '''
+        Make sure GA engine can run with batch fitness function.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=50).init()
+
+        # Create genetic operators.
+        selection = RouletteWheelSelection()
+        crossover = UniformCrossover(pc=0.8, pe=0.5)
+        mutation = FlipBitMutation(pm=0.1)
+
+        # Create genetic algorithm engine.
+        engine = GAEngine(population=population, selection=selection,
+                          crossover=crossover, mutation=mutation)
+
+        ncalls = []
+
+        @engine.fitness_register(batch=True)
+        @engine.minimize
+        def fitness(solutions):
+            ncalls.append(len(solutions))
+            return [x + 10*sin(5*x) + 7*cos(4*x) for x, in solutions]
+
+        engine.run(10)
+
+        # Only one call for each generation.
+        self.assertEqual(len(ncalls), 11)
+        # Individuals are evaluated in different processes.
+        self.assertEqual(ncalls[0], len(range(mpi.rank, 50, mpi.size)))
+
+        # Fitness function can still be called for a single individual.
+        indv = population[0]
+        x, = indv.solution
+        self.assertEqual(engine.fitness(indv.clone()), -(x + 10*sin(5*x) + 7*cos(4*x)))
+
+    def test_invalid_batch_fitness(self):
+        '''
+        Make sure invalid batch fitness values can be detected.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=50).init()
+        engine = GAEngine(population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1))
+
+        @engine.fitness_register(batch=True)
+        def fitness(solutions):
+            return [1 for _ in solutions]
+
+        self.assertRaises(ValueError, engine.run, 1)
+
+    def test_distributed_evaluation(self):
+        '''
+        Make sure each individual is evaluated only once in all processes and
+        populations in all processes are the same.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=50).init()
+
+        engine = GAEngine(population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1))
+
+        ncalls = []
+
+        @engine.fitness_register
+        def fitness(indv):
+            ncalls.append(1)
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        engine.run(10)
+
+        # The best individual is retained without evaluation.
+        self.assertEqual(sum(mpi.allgather(len(ncalls))), 50 + 10*49)
+
+        chromsomes = [indv.chromsome for indv in population.individuals]
+        for other in mpi.allgather(chromsomes):
+            self.assertListEqual(other, chromsomes)
+        self.assertEqual(engine.ori_fmax, max(engine.fitness(indv) for indv in population.individuals))
+
+    def test_dynamic_schedule(self):
+        '''
+        Make sure individuals are evaluated only once with dynamic schedule.
+        '''
+        indv_template = DecimalIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=50).init()
+
+        engine = GAEngine(population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1),
+                          schedule='dynamic')
+
+        ncalls = []
+
+        @engine.fitness_register
+        def fitness(indv):
+            ncalls.append(1)
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        engine.run(10)
+
+        self.assertEqual(sum(mpi.allgather(len(ncalls))), 50 + 10*49)
+        chromsomes = [indv.chromsome for indv in population.individuals]
+        for other in mpi.allgather(chromsomes):
+            self.assertListEqual(other, chromsomes)
+
+        if mpi.size > 1:
+            self.assertEqual(sum(engine.schedule_report.n_tasks), 49)
+
+        self.assertRaises(ValueError, GAEngine, population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1),
+                          schedule='guided')
+
+    def test_pipeline_batches(self):
+        '''
+        Make sure children bred and gathered in batches are evaluated only once
+        and communications are traced.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=50).init()
+
+        engine = GAEngine(population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1),
+                          pipeline_batches=3, trace=True)
+
+        ncalls = []
+
+        @engine.fitness_register
+        def fitness(indv):
+            ncalls.append(1)
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        engine.run(10)
+
+        self.assertEqual(sum(mpi.allgather(len(ncalls))), 50 + 10*49)
+        self.assertEqual(len(population), 50)
+        chromsomes = [indv.chromsome for indv in population.individuals]
+        for other in mpi.allgather(chromsomes):
+            self.assertListEqual(other, chromsomes)
+
+        # One breeding for each batch.
+        names = [name for name, _, _, _ in engine.trace.events]
+        self.assertEqual(names.count('breed'), 30)
+        self.assertEqual(names.count('wait'), 10)
+        summary = engine.trace.summary()
+        self.assertTrue(summary['compute'] > 0.0)
+        self.assertTrue(summary['wall'] >= summary['compute'])
+        if mpi.size > 1:
+            self.assertEqual(names.count('gather'), 30)
+            self.assertTrue(0.0 <= summary['hidden'] <= 1.0)
+        else:
+            # Nothing is in flight in a single process.
+            self.assertEqual(names.count('gather'), 0)
+            self.assertIsNone(summary['hidden'])
+
+        self.assertRaises(ValueError, GAEngine, population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1),
+                          pipeline_batches=0)
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(GAEngineTest)
     unittest.TextTestRunner(verbosity=2).run(suite)
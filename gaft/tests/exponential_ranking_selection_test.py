@@ -30,6 +30,32 @@ class ExponentialRankingSelectionTest(unittest.TestCase):
         self.assertTrue(isinstance(mother, BinaryIndividual))
         self.assertNotEqual(father.chromsome, mother.chromsome)
 
+    def test_select_batch(self):
+        indv = BinaryIndividual(ranges=[(0, 30)])
+        p = Population(indv)
+        p.init()
+
+        selection = ExponentialRankingSelection()
+        pairs = selection.select_batch(p, fitness=self.fitness, n_pairs=50)
+
+        self.assertEqual(len(pairs), 50)
+        for father_idx, mother_idx in pairs:
+            self.assertTrue(0 <= father_idx < len(p))
+            self.assertTrue(0 <= mother_idx < len(p))
+            self.assertNotEqual(father_idx, mother_idx)
+
+    def test_cached_wheel(self):
+        selection = ExponentialRankingSelection()
+        wheel = selection._wheel(100)
+
+        self.assertEqual(len(wheel), 100)
+        self.assertAlmostEqual(wheel[-1], 1.0)
+        self.assertTrue(selection._wheel(100) is wheel)
+
+        # Wheel is recreated once the parameters are changed.
+        selection.base = 0.8
+        self.assertFalse(selection._wheel(100) is wheel)
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(ExponentialRankingSelectionTest)
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Test case for fitness cache.
+'''
+
+import os
+import unittest
+import tempfile
+from math import sin, cos
+
+from .. import GAEngine
+from ..cache import FitnessCache, PersistentFitnessCache, chromsome_key, bits_key
+from ..components import BinaryIndividual, DecimalIndividual, Population
+from ..components import ArrayPopulation
+from ..operators import RouletteWheelSelection, UniformCrossover, FlipBitMutation
+
+
+class FitnessCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = True
+
+    def test_chromsome_key(self):
+        ''' Make sure chromsomes can be hashed to compact keys.
+        '''
+        indv = BinaryIndividual(ranges=[(0, 1)]).init(solution=[0.398])
+        key = chromsome_key(indv.chromsome)
+        self.assertEqual(len(key), 16)
+        self.assertEqual(key, chromsome_key(indv.clone().chromsome))
+        self.assertNotEqual(key, chromsome_key(indv.init(solution=[0.298]).chromsome))
+
+        indv = DecimalIndividual(ranges=[(0, 1)]).init(solution=[0.398])
+        self.assertEqual(chromsome_key(indv.chromsome), chromsome_key([0.398]))
+
+        # Equal int and float genes have the same key.
+        self.assertEqual(chromsome_key([1, 0]), chromsome_key([1.0, 0.0]))
+        self.assertNotEqual(chromsome_key([2**60]), chromsome_key([2**60 + 1]))
+
+    def test_individual_key(self):
+        ''' Make sure individuals with the same genes have the same cache key.
+        '''
+        cache = FitnessCache()
+
+        # Packed chromsomes are hashed directly.
+        indv = BinaryIndividual(ranges=[(0, 1)]).init(solution=[0.398])
+        self.assertEqual(cache.key(indv), bits_key(indv.bits, indv.length))
+        self.assertTrue(indv._chromsome is None)
+        population = ArrayPopulation(indv_template=indv, size=2).init(indvs=[indv, indv])
+        self.assertEqual(cache.key(population[0]), cache.key(indv))
+
+        indv = DecimalIndividual(ranges=[(0, 1)]).init(solution=[0.5])
+        population = ArrayPopulation(indv_template=indv, size=2).init(indvs=[indv, indv])
+        self.assertEqual(cache.key(population[0]), cache.key(indv))
+        self.assertEqual(cache.key(indv), chromsome_key([0.5]))
+
+    def test_lru_eviction(self):
+        ''' Make sure the least recently used value is evicted.
+        '''
+        cache = FitnessCache(maxsize=2)
+        cache.put(b'a', 1.0)
+        cache.put(b'b', 2.0)
+        self.assertEqual(cache.get(b'a'), 1.0)
+        cache.put(b'c', 3.0)
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn(b'b', cache)
+        self.assertIsNone(cache.get(b'b'))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_persistent_cache(self):
+        ''' Make sure values can be stored in database with versions.
+        '''
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'fitness.db')
+
+            cache = PersistentFitnessCache(path, version='1', maxsize=3)
+            cache.put_many([(b'a', 1.0), (b'b', 2.0)])
+            self.assertListEqual(cache.get_many([b'a', b'b', b'c']), [1.0, 2.0, None])
+            self.assertEqual(cache.hits, 2)
+            self.assertEqual(cache.misses, 1)
+            cache.close()
+
+            # Values are shared across runs with the same version.
+            cache = PersistentFitnessCache(path, version='1', maxsize=3)
+            self.assertEqual(cache.get(b'a'), 1.0)
+            cache.put_many([(b'c', 3.0), (b'd', 4.0)])
+            self.assertEqual(len(cache), 3)
+            self.assertNotIn(b'a', cache)
+            cache.close()
+
+            # Values of other versions are neither found nor evicted.
+            cache = PersistentFitnessCache(path, version='2', maxsize=1)
+            self.assertIsNone(cache.get(b'd'))
+            self.assertEqual(len(cache), 0)
+            cache.put_many([(b'e', 5.0), (b'f', 6.0)])
+            self.assertEqual(len(cache), 1)
+            self.assertListEqual(cache.get_many([b'e', b'f']), [None, 6.0])
+            cache.close()
+
+            cache = PersistentFitnessCache(path, version='1', maxsize=3)
+            self.assertEqual(len(cache), 3)
+            self.assertListEqual(cache.get_many([b'b', b'c', b'd']), [2.0, 3.0, 4.0])
+
+            # Values of other types are not converted to float.
+            cache.put_many([(b'g', 7), (b'h', 8.0)])
+            self.assertIsNone(cache.get(b'g'))
+            self.assertEqual(cache.get(b'h'), 8.0)
+            cache.close()
+
+    def _run_engine(self, cache):
+        '''
+        Helper function to run GA engine with fitness cache.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=50).init()
+
+        engine = GAEngine(population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1),
+                          cache=cache)
+
+        ncalls = []
+
+        @engine.fitness_register
+        @engine.minimize
+        def fitness(indv):
+            ncalls.append(1)
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        engine.run(20)
+
+        return len(ncalls)
+
+    def test_engine_run(self):
+        ''' Make sure GA engine skips evaluation of cached chromsomes.
+        '''
+        cache = FitnessCache()
+        ncalls = self._run_engine(cache)
+
+        self.assertEqual(ncalls, cache.misses)
+        self.assertTrue(cache.hits > 0)
+        self.assertTrue(ncalls < 50*21)
+
+    def test_engine_rerun(self):
+        ''' Make sure GA engine reuses values in persistent cache.
+        '''
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'fitness.db')
+
+            cache = PersistentFitnessCache(path)
+            ncalls = self._run_engine(cache)
+            self.assertEqual(ncalls, cache.misses)
+            cache.close()
+
+            # Only new chromsomes are evaluated in the warm run.
+            cache = PersistentFitnessCache(path)
+            nvalues = len(cache)
+            ncalls = self._run_engine(cache)
+            self.assertEqual(len(cache), nvalues + ncalls)
+            cache.close()
+
+if '__main__' == __name__:
+    suite = unittest.TestLoader().loadTestsFromTestCase(FitnessCacheTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -36,6 +36,27 @@ class FlipBitMutationTest(unittest.TestCase):
         for a, b in zip(indv.chromsome, chromsome_before):
             self.assertNotEqual(a, b)
 
+    def test_mutate_clone(self):
+        ''' Make sure mutation of a clone does not change the original individual.
+        '''
+        indv = DecimalIndividual(ranges=[(0, 1), (0, 2)]).init(solution=[0.5, 1.5])
+        indv_clone = indv.clone()
+        self.assertFalse(indv_clone.chromsome is indv.chromsome)
+
+        FlipBitMutation(pm=1.0).mutate(indv_clone, engine=None)
+        self.assertListEqual(indv.chromsome, [0.5, 1.5])
+        self.assertListEqual(indv.solution, [0.5, 1.5])
+        self.assertListEqual(indv_clone.solution, indv_clone.chromsome)
+
+        indv = BinaryIndividual(ranges=[(0, 1)]).init(solution=[0.398])
+        indv_clone = indv.clone()
+        self.assertListEqual(indv_clone.solution, indv.solution)
+
+        FlipBitMutation(pm=1.0).mutate(indv_clone, engine=None)
+        self.assertListEqual(indv.chromsome, [0, 1, 1, 0, 0, 1, 0, 1, 1])
+        self.assertListEqual(indv.solution, [0.398])
+        self.assertFalse(indv_clone.solution is indv.solution)
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(FlipBitMutationTest)
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -6,7 +6,9 @@
 
 import unittest
 
-from ..components import BinaryIndividual
+from ..components import BinaryIndividual, GrayBinaryIndividual, ArrayPopulation
+from ..components import DecimalIndividual, GeneSpec
+from ..components.binary_individual import pack_bits, unpack_bits, random_mask
 
 class IndividualTest(unittest.TestCase):
 
@@ -73,12 +75,204 @@ class IndividualTest(unittest.TestCase):
         self.assertEqual(indv.ranges, indv_clone.ranges)
         self.assertEqual(indv.eps, indv_clone.eps)
 
+    def test_gene_spec(self):
+        ''' Make sure the gene specification is immutable and shared by clones.
+        '''
+        indv = BinaryIndividual(ranges=[(0, 1), (-1, 1)], eps=0.001)
+        spec = indv.spec
+        self.assertTrue(isinstance(spec, GeneSpec))
+        self.assertEqual(spec.ranges, ((0, 1), (-1, 1)))
+        self.assertEqual(spec.lengths, (9, 10))
+        self.assertEqual(spec.gene_indices, ((0, 9), (9, 19)))
+        self.assertRaises(AttributeError, setattr, spec, 'ranges', [(0, 2)])
+
+        # Clones share the same specification.
+        indv_clone = indv.clone()
+        self.assertTrue(indv_clone.spec is spec)
+        self.assertEqual(indv_clone.bits, indv.bits)
+        self.assertListEqual(indv_clone.solution, indv.solution)
+
+        # Individuals carry no instance dict.
+        self.assertRaises(AttributeError, setattr, indv, 'foo', 1)
+
+        # Instance attributes of subclasses are not shared with clones.
+        class TaggedIndividual(DecimalIndividual):
+            def __init__(self, ranges, eps=0.001):
+                self.tags = []
+                super(TaggedIndividual, self).__init__(ranges, eps)
+
+        tagged = TaggedIndividual(ranges=[(0, 1)])
+        tagged.tags.append('parent')
+        tagged_clone = tagged.clone()
+        self.assertTrue(tagged_clone.spec is tagged.spec)
+        self.assertListEqual(tagged_clone.tags, ['parent'])
+        tagged_clone.tags.append('child')
+        self.assertListEqual(tagged.tags, ['parent'])
+        self.assertListEqual(tagged.from_chromsome_bytes(tagged.chromsome_bytes()).tags,
+                             ['parent'])
+
+        # Specifications of different individuals are independent.
+        other = BinaryIndividual(ranges=[(0, 2)], eps=0.01)
+        self.assertEqual(indv.ranges, ((0, 1), (-1, 1)))
+        self.assertEqual(other.ranges, ((0, 2),))
+
+        indv = DecimalIndividual(ranges=[(0, 1), (0, 2)]).init(solution=[0.5, 1.5])
+        indv_clone = indv.clone()
+        self.assertTrue(indv_clone.spec is indv.spec)
+        self.assertListEqual(indv_clone.solution, [0.5, 1.5])
+        self.assertListEqual(indv_clone.chromsome, [0.5, 1.5])
+
+        # Chromsome and solution of the clone can be modified in place.
+        indv_clone.chromsome[0] = 0.9
+        indv_clone.solution[0] = 0.9
+        self.assertListEqual(indv.solution, [0.5, 1.5])
+        self.assertListEqual(indv.chromsome, [0.5, 1.5])
+
+    def test_lazy_decode(self):
+        ''' Make sure the solution is decoded lazily after chromsome changes.
+        '''
+        indv = BinaryIndividual(ranges=[(0, 1)], eps=0.001).init(solution=[0.398])
+        self.assertListEqual(indv.solution, [0.398])
+
+        indv.bits ^= 1
+        self.assertTrue(indv._solution is None)
+        self.assertListEqual(indv.solution, [0.39453125])
+        self.assertTrue(indv._solution is indv.solution)
+
+        indv.init(chromsome=[0, 1, 1, 0, 0, 1, 0, 1, 1])
+        self.assertTrue(indv._solution is None)
+        self.assertListEqual(indv.solution, [0.396484375])
+
+    def test_decode_many(self):
+        ''' Make sure solutions of individuals can be decoded at once.
+        '''
+        for indv_cls in [BinaryIndividual, GrayBinaryIndividual]:
+            template = indv_cls(ranges=[(0, 1), (-1, 1)], eps=0.001)
+            indvs = [template.clone().init() for _ in range(10)]
+            ref_solutions = [indv.decode() for indv in indvs]
+            for indv in indvs:
+                indv.bits = indv.bits
+
+            solutions = template.decode_many(indvs)
+            self.assertListEqual(solutions, ref_solutions)
+            self.assertListEqual([indv.solution for indv in indvs], ref_solutions)
+
+            # Row views in array population.
+            population = ArrayPopulation(indv_template=template, size=10).init()
+            ref_solutions = [indv.decode() for indv in population.individuals]
+            population.init(indvs=[indv.clone() for indv in population.individuals])
+            self.assertListEqual(template.decode_many(population.individuals),
+                                 ref_solutions)
+
+    def test_chromsome_bytes(self):
+        ''' Make sure individuals can be rebuilt from serialized chromsomes.
+        '''
+        for indv_cls in [BinaryIndividual, GrayBinaryIndividual, DecimalIndividual]:
+            template = indv_cls(ranges=[(0, 1), (-1, 1)], eps=0.001)
+            indv = template.clone().init()
+
+            data = indv.chromsome_bytes()
+            self.assertEqual(len(data), len(template.chromsome_bytes()))
+
+            indv_copy = template.from_chromsome_bytes(data)
+            self.assertTrue(indv_copy.spec is template.spec)
+            self.assertListEqual(indv_copy.chromsome, indv.chromsome)
+
+        # Binary chromsome is packed into bytes.
+        self.assertEqual(len(template.chromsome_bytes()), 2*8)
+        indv = BinaryIndividual(ranges=[(0, 1), (-1, 1)], eps=0.001)
+        self.assertEqual(len(indv.chromsome_bytes()), 3)
+
     def test_multi_precisions(self):
         ''' Make sure we can construct individual using different decrete precisions.
         '''
         indv = BinaryIndividual(ranges=[(0, 1), (0, 10)], eps=[0.01, 1.0]).init(solution=[0.3, 0.5])
         self.assertNotEqual(indv.precisions[0], indv.precisions[1])
 
+    def test_packed_bits(self):
+        ''' Make sure the chromsome is packed into an integer correctly.
+        '''
+        indv = BinaryIndividual(ranges=[(0, 1), (-1, 1)], eps=0.001)
+        indv.init(solution=[0.398, 0.66])
+        chromsome = [0, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1]
+        self.assertEqual(indv.bits, int(''.join(str(bit) for bit in chromsome), 2))
+        self.assertEqual(indv.length, len(chromsome))
+
+        # Initialize with packed bits.
+        indv_copy = BinaryIndividual(ranges=[(0, 1), (-1, 1)], eps=0.001)
+        indv_copy.init(bits=indv.bits)
+        self.assertListEqual(indv_copy.chromsome, chromsome)
+        self.assertListEqual(indv_copy.solution, [0.396484375, 0.658203125])
+
+        # List view of the packed chromsome is cached and written through.
+        self.assertTrue(indv.chromsome is indv.chromsome)
+        self.assertListEqual(indv.solution, [0.398, 0.66])
+        indv.chromsome[0] = 1
+        self.assertTrue(indv._solution is None)
+        self.assertEqual(indv.bits, pack_bits([1] + chromsome[1:]))
+        self.assertListEqual(indv.chromsome, [1] + chromsome[1:])
+        indv.chromsome[:2] = [0, 0]
+        self.assertEqual(indv.bits, pack_bits([0, 0] + chromsome[2:]))
+
+        # The view is updated with the packed chromsome and detached from it.
+        view = indv.chromsome
+        indv.bits ^= 1 << (indv.length - 1)
+        self.assertListEqual(indv.chromsome, [1, 0] + chromsome[2:])
+        view[0] = 0
+        self.assertListEqual(indv.chromsome, [1, 0] + chromsome[2:])
+
+        # Clones have their own views.
+        indv_clone = indv.clone()
+        indv_clone.chromsome[0] = 0
+        self.assertListEqual(indv.chromsome, [1, 0] + chromsome[2:])
+
+        self.assertEqual(pack_bits([0, 0, 1, 0, 1]), 5)
+        self.assertEqual(pack_bits([]), 0)
+        self.assertListEqual(unpack_bits(5, 5), [0, 0, 1, 0, 1])
+
+    def test_random_mask(self):
+        ''' Make sure random bit masks can be created correctly.
+        '''
+        self.assertEqual(random_mask(10, 1.0), 2**10 - 1)
+        self.assertEqual(random_mask(10, 0.0), 0)
+        self.assertTrue(0 <= random_mask(10, 0.5) < 2**10)
+
+        mask = random_mask(10000, 0.1)
+        self.assertTrue(mask < 2**10000)
+        self.assertTrue(800 < bin(mask).count('1') < 1200)
+
+    def test_gray_encoding(self):
+        ''' Make sure individual can decode and encode Gray gene correctly.
+        '''
+        indv = GrayBinaryIndividual(ranges=[(0, 1), (-1, 1)], eps=0.001)
+        indv.init(solution=[0.398, 0.66])
+
+        # Same layout with binary encoding.
+        ref_indv = BinaryIndividual(ranges=[(0, 1), (-1, 1)], eps=0.001)
+        self.assertEqual(indv.gene_indices, ref_indv.gene_indices)
+
+        # Test Gray chromsome.
+        ref_chromsome = [0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 0, 1]
+        self.assertListEqual(indv.chromsome, ref_chromsome)
+
+        # Test decode.
+        self.assertListEqual(indv.decode(), [0.396484375, 0.658203125])
+
+        # Adjacent values differ in only one bit.
+        indv = GrayBinaryIndividual(ranges=[(0, 1)], eps=0.01)
+        for n in range(2**indv.length - 1):
+            bits1 = indv.init(solution=[n*indv.precisions[0]]).bits
+            bits2 = indv.init(solution=[(n + 1)*indv.precisions[0]]).bits
+            self.assertEqual(bin(bits1 ^ bits2).count('1'), 1)
+            self.assertAlmostEqual(indv.decode()[0], (n + 1)*indv.precisions[0])
+
+        # Gray row views in array population.
+        indv = GrayBinaryIndividual(ranges=[(0, 1), (-1, 1)], eps=0.001)
+        population = ArrayPopulation(indv_template=indv, size=4).init()
+        indv = population[0].init(solution=[0.398, 0.66])
+        self.assertListEqual(list(indv.chromsome), ref_chromsome)
+        self.assertListEqual(indv.decode(), [0.396484375, 0.658203125])
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(IndividualTest)
     unittest.TextTestRunner(verbosity=2).run(suite)
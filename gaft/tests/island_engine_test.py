@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Test case for island model engine run.
+'''
+
+import unittest
+from math import sin, cos
+
+from .. import IslandEngine
+from ..components import BinaryIndividual, DecimalIndividual
+from ..components import Population
+from ..operators import TournamentSelection
+from ..operators import UniformCrossover
+from ..operators import FlipBitMutation
+from ..plugin_interfaces import OnTheFlyAnalysis
+from ..mpiutil import MPIUtil
+
+mpi = MPIUtil()
+
+
+class IslandEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = True
+
+    def _create_engine(self, indv_template, **kwargs):
+        population = Population(indv_template=indv_template, size=20).init()
+        engine = IslandEngine(population=population,
+                              selection=TournamentSelection(),
+                              crossover=UniformCrossover(pc=0.8, pe=0.5),
+                              mutation=FlipBitMutation(pm=0.1),
+                              **kwargs)
+
+        @engine.fitness_register
+        @engine.minimize
+        def fitness(indv):
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        return engine
+
+    def test_run(self):
+        '''
+        Make sure islands can evolve and exchange migrants with all topologies.
+        '''
+        for topology in ['ring', 'random', 'full']:
+            for indv_template in [BinaryIndividual(ranges=[(0, 10)], eps=0.001),
+                                  DecimalIndividual(ranges=[(0, 10)], eps=0.001)]:
+                engine = self._create_engine(indv_template, topology=topology,
+                                             migration_interval=3, migration_size=2)
+                engine.run(10)
+                self.assertEqual(len(engine.population), 20)
+
+                # Statistics of all islands.
+                all_fmax = mpi.allgather(engine.ori_fmax)
+                all_fmin = mpi.allgather(engine.ori_fmin)
+                self.assertEqual(engine.global_ori_stats.max, max(all_fmax))
+                self.assertEqual(engine.global_ori_stats.min, min(all_fmin))
+                self.assertEqual(engine.global_ori_stats.size, 20*mpi.size)
+                self.assertTrue(engine.global_stats is engine.global_ori_stats)
+
+                best_indv = engine.best_indv()
+                self.assertAlmostEqual(engine.ori_fitness(best_indv),
+                                       engine.global_ori_stats.max)
+
+    def test_migration(self):
+        '''
+        Make sure migrants replace the worst individuals in neighbor islands.
+        '''
+        engine = self._create_engine(BinaryIndividual(ranges=[(0, 10)], eps=0.001),
+                                     migration_size=3)
+        engine._evaluate()
+        engine._update_statvars()
+
+        best_indv = engine.population.best_indv(engine.fitness)
+        emigrants = [engine.population[i].chromsome
+                     for i in engine.population.argsort(engine.fitness)[-3:]]
+        all_emigrants = mpi.allgather(emigrants)
+
+        engine._start_migration(0)
+        if mpi.size > 1:
+            # Send buffers of chromsomes and values are kept alive.
+            _, _, (send_chromsomes, send_values) = engine._migration
+            self.assertEqual(len(send_chromsomes), 3*engine._chromsome_size())
+            self.assertEqual(send_values is None, engine.objective is None)
+        engine._finish_migration()
+        engine._update_statvars()
+
+        chromsomes = [indv.chromsome for indv in engine.population.individuals]
+        self.assertTrue(best_indv in engine.population.individuals)
+        if mpi.size > 1:
+            source = (mpi.rank - 1) % mpi.size
+            for chromsome in all_emigrants[source]:
+                self.assertTrue(chromsome in chromsomes)
+
+    def test_migration_with_scaling(self):
+        '''
+        Make sure migrants are ranked with scaled fitness of current population.
+        '''
+        population = Population(indv_template=DecimalIndividual(ranges=[(0, 10)],
+                                                                 eps=0.001),
+                                size=20).init()
+        engine = IslandEngine(population=population,
+                              selection=TournamentSelection(),
+                              crossover=UniformCrossover(pc=0.8, pe=0.5),
+                              mutation=FlipBitMutation(pm=0.1),
+                              migration_interval=1, migration_size=2)
+
+        @engine.fitness_register
+        @engine.linear_scaling(ksi=0.5)
+        def fitness(indv):
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        all_fmin = []
+
+        @engine.analysis_register
+        class FminAnalysis(OnTheFlyAnalysis):
+            interval = 1
+
+            def register_step(self, g, population, engine):
+                all_fmin.append(engine.fmin)
+
+        engine.run(10)
+        self.assertEqual(len(all_fmin), 10)
+        for fmin in all_fmin + [engine.fmin]:
+            self.assertAlmostEqual(fmin, 0.5)
+
+    def test_neighbors(self):
+        '''
+        Make sure each island receives migrants from the islands sending to it.
+        '''
+        for topology in ['ring', 'random', 'full']:
+            engine = self._create_engine(BinaryIndividual(ranges=[(0, 10)], eps=0.001),
+                                         topology=topology)
+            dests, sources = engine.neighbors(5)
+            all_dests = mpi.allgather(dests)
+            received_from = [r for r, ds in enumerate(all_dests) if mpi.rank in ds]
+            self.assertListEqual(sorted(sources), received_from)
+            self.assertFalse(mpi.rank in dests)
+
+            if topology == 'full':
+                self.assertEqual(len(dests), mpi.size - 1)
+            elif mpi.size > 1:
+                self.assertEqual(len(dests), 1)
+
+    def test_invalid_parameters(self):
+        '''
+        Make sure invalid migration parameters are rejected.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        self.assertRaises(ValueError, self._create_engine, indv_template, topology='star')
+        self.assertRaises(ValueError, self._create_engine, indv_template, migration_interval=0)
+        self.assertRaises(ValueError, self._create_engine, indv_template, migration_size=20)
+
+if '__main__' == __name__:
+    suite = unittest.TestLoader().loadTestsFromTestCase(IslandEngineTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
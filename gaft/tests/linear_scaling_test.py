@@ -13,6 +13,9 @@ from gaft.components import Population
 from gaft.operators import RouletteWheelSelection
 from gaft.operators import UniformCrossover
 from gaft.operators import FlipBitMutation
+from gaft.mpiutil import MPIUtil
+
+mpi = MPIUtil()
 
 
 class LinearScalingTest(unittest.TestCase):
@@ -44,6 +47,38 @@ class LinearScalingTest(unittest.TestCase):
 
         engine.run(50)
 
+    def test_statistics(self):
+        '''
+        Make sure the objective is evaluated once for each individual in a
+        generation and statistics are consistent with population.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=50).init()
+
+        engine = GAEngine(population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1))
+
+        ncalls = []
+
+        @engine.fitness_register
+        @engine.linear_scaling(target='max', ksi=0.5)
+        def fitness(indv):
+            ncalls.append(1)
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        engine.run(10)
+
+        # The best individual of last generation is retained without evaluation.
+        self.assertEqual(sum(mpi.allgather(len(ncalls))), 50 + 10*49)
+
+        self.assertEqual(engine.ori_fmax, population.max(engine.ori_fitness))
+        self.assertEqual(engine.fmin, population.min(engine.fitness))
+        self.assertAlmostEqual(engine.fmax, engine.ori_fmax - engine.ori_fmin + 0.5)
+        self.assertEqual(engine.stats.argmax, engine.ori_stats.argmax)
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(LinearScalingTest)
     unittest.TextTestRunner(verbosity=2).run(suite)
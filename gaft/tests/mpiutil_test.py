@@ -5,8 +5,10 @@
 '''
 
 import unittest
+import time
+from array import array
 
-from gaft.mpiutil import MPIUtil
+from gaft.mpiutil import MPIUtil, CommTrace
 
 mpi = MPIUtil()
 
@@ -57,6 +59,138 @@ class MPIUtilTest(unittest.TestCase):
                 self.assertEqual(mpi.split_size(49), 24)
                 self.assertEqual(mpi.split_size(1), 0)
 
+    def test_allgatherv(self):
+        '''
+        Make sure arrays with different lengths can be gathered correctly.
+        '''
+        data = array('d', [float(mpi.rank)]*(mpi.rank + 1))
+        recv_data, counts = mpi.allgatherv(data)
+
+        self.assertListEqual(counts, list(range(1, mpi.size + 1)))
+        ref_data = [float(rank) for rank in range(mpi.size) for _ in range(rank + 1)]
+        self.assertListEqual(recv_data.tolist(), ref_data)
+
+    def test_bcast_array(self):
+        '''
+        Make sure array in master process can be broadcasted correctly.
+        '''
+        data = array('B', [1, 2, 3]) if mpi.is_master else None
+        self.assertListEqual(mpi.bcast_array(data).tolist(), [1, 2, 3])
+
+    def test_allreduce(self):
+        '''
+        Make sure values in all processes can be reduced correctly.
+        '''
+        data = [float(mpi.rank), -float(mpi.rank)]
+        self.assertListEqual(mpi.allreduce(data, op='sum'),
+                             [float(sum(range(mpi.size))), -float(sum(range(mpi.size)))])
+        self.assertListEqual(mpi.allreduce(data, op='max'), [float(mpi.size - 1), 0.0])
+        self.assertListEqual(mpi.allreduce(data, op='min'), [0.0, -float(mpi.size - 1)])
+        self.assertRaises(ValueError, mpi.allreduce, data, op='prod')
+
+    def test_alltoallv(self):
+        '''
+        Make sure parts of arrays can be exchanged between all processes.
+        '''
+        # Process i sends i+1 values of i to process j.
+        counts = [mpi.rank + 1]*mpi.size
+        self.assertListEqual(mpi.alltoall(counts), list(range(1, mpi.size + 1)))
+
+        data = array('d', [float(mpi.rank)]*sum(counts))
+        recv_data, recv_counts = mpi.alltoallv(data, counts)
+        self.assertListEqual(recv_counts, list(range(1, mpi.size + 1)))
+        ref_data = [float(rank) for rank in range(mpi.size) for _ in range(rank + 1)]
+        self.assertListEqual(recv_data.tolist(), ref_data)
+
+    def test_dynamic_map(self):
+        '''
+        Make sure items are computed once with master-worker scheduling.
+        '''
+        def square(items):
+            # Expensive items at the beginning.
+            time.sleep(sum([0.002 for i in items if i < 10]))
+            return [i**2 for i in items]
+
+        items = list(range(100))
+        results, report = mpi.dynamic_map(square, items, target_time=0.005)
+
+        self.assertListEqual(results, [i**2 for i in items])
+        self.assertEqual(sum(report.n_tasks), 100)
+        self.assertEqual(len(report.idle_times), mpi.size)
+        self.assertTrue(all(t >= 0.0 for t in report.idle_times))
+        self.assertTrue(all(s >= 1 for s in report.chunk_sizes))
+
+        results, report = mpi.dynamic_map(square, [])
+        self.assertListEqual(results, [])
+
+    def test_dynamic_map_dispatcher(self):
+        '''
+        Make sure master does not compute expensive items and scheduling
+        messages are kept apart from other messages.
+        '''
+        def slow(items):
+            time.sleep(0.01*len(items))
+            return items
+
+        # A pending message with the same tag as scheduling messages.
+        if mpi.size > 1 and mpi.rank == 1:
+            data = array('d', [1.0])
+            request = mpi.isend_array(data, 0, tag=102)
+
+        items = list(range(10))
+        results, report = mpi.dynamic_map(slow, items, target_time=0.005)
+        self.assertListEqual(results, items)
+
+        if mpi.size > 1:
+            self.assertEqual(report.n_tasks[0], 0)
+            if mpi.rank == 0:
+                data = array('d', [0.0])
+                mpi.waitall([mpi.irecv_array(data, 1, tag=102)])
+                self.assertListEqual(data.tolist(), [1.0])
+            elif mpi.rank == 1:
+                mpi.waitall([request])
+
+    def test_iallgatherv(self):
+        '''
+        Make sure arrays with known lengths can be gathered without blocking.
+        '''
+        counts = list(range(1, mpi.size + 1))
+        data = array('d', [float(mpi.rank)]*(mpi.rank + 1))
+        request, recv_data = mpi.iallgatherv(data, counts)
+        mpi.waitall([request])
+        self.assertTrue(mpi.testall([request]))
+
+        ref_data = [float(rank) for rank in range(mpi.size) for _ in range(rank + 1)]
+        self.assertListEqual(recv_data.tolist(), ref_data)
+
+    def test_comm_trace(self):
+        '''
+        Make sure spans of computation and communication are recorded.
+        '''
+        trace = CommTrace()
+        with trace.span('breed'):
+            time.sleep(0.01)
+        trace.add('gather', 'comm', 0.0, 0.0)
+
+        summary = trace.summary()
+        self.assertTrue(summary['compute'] >= 0.01)
+        self.assertEqual(summary['wait'], 0.0)
+        self.assertEqual([name for name, _, _, _ in trace.events], ['breed', 'gather'])
+
+        # Only the time communications are in flight counts.
+        trace = CommTrace()
+        trace.add('breed', 'compute', trace._start, trace._start + 1.0)
+        trace.add('gather', 'comm', trace._start + 0.5, trace._start + 2.0)
+        trace.add('wait', 'wait', trace._start + 1.0, trace._start + 2.0)
+        trace.add('evaluate', 'compute', trace._start + 2.0, trace._start + 3.0)
+
+        summary = trace.summary()
+        self.assertAlmostEqual(summary['wall'], 3.0)
+        if mpi.size > 1:
+            self.assertAlmostEqual(summary['hidden'], 1.0/3.0)
+        else:
+            self.assertIsNone(summary['hidden'])
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(MPIUtilTest)
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -48,6 +48,70 @@ class PopulationTest(unittest.TestCase):
         for fit in all_fits:
             self.assertTrue(type(fit) is float)
 
+    def test_memoized_all_fits(self):
+        ''' Make sure fitness values are cached for each population and each
+        fitness function until the population changes. '''
+        ncalls = []
+        def fitness(indv):
+            ncalls.append(indv)
+            return self.fitness(indv)
+        def neg_fitness(indv):
+            return -fitness(indv)
+
+        population = Population(indv_template=self.indv_template, size=10).init()
+        other_population = Population(indv_template=self.indv_template, size=10).init()
+
+        all_fits = population.all_fits(fitness)
+        neg_fits = population.all_fits(neg_fitness)
+        other_fits = other_population.all_fits(fitness)
+        self.assertEqual(len(ncalls), 30)
+
+        # Alternating fitness functions and populations hits the cache.
+        self.assertIs(population.all_fits(fitness), all_fits)
+        self.assertIs(population.all_fits(neg_fitness), neg_fits)
+        self.assertIs(other_population.all_fits(fitness), other_fits)
+        self.assertEqual(len(ncalls), 30)
+
+        # Cache is invalidated by individual list mutations.
+        version = population.version
+        population.individuals[0] = population.individuals[1].clone()
+        self.assertTrue(population.version > version)
+        population.all_fits(fitness)
+        self.assertEqual(len(ncalls), 40)
+
+        population.individuals.pop()
+        self.assertEqual(len(population.all_fits(fitness)), 9)
+
+    def test_index_lookup(self):
+        ''' Make sure individuals can be looked up by fitness indices. '''
+        population = Population(indv_template=self.indv_template, size=10).init()
+        all_fits = population.all_fits(self.fitness)
+
+        best, worst = population.argmax(self.fitness), population.argmin(self.fitness)
+        self.assertEqual(all_fits[best], max(all_fits))
+        self.assertEqual(all_fits[worst], min(all_fits))
+        self.assertIs(population.best_indv(self.fitness), population[best])
+        self.assertIs(population.worst_indv(self.fitness), population[worst])
+
+        indices = population.argsort(self.fitness)
+        self.assertListEqual([all_fits[i] for i in indices], sorted(all_fits))
+        self.assertEqual(population.fitness_of(best, self.fitness), max(all_fits))
+
+    def test_statistics(self):
+        ''' Make sure statistics of fitness values can be calculated correctly. '''
+        population = Population(indv_template=self.indv_template, size=10)
+        population.init()
+        all_fits = population.all_fits(fitness=self.fitness)
+        stats = population.statistics(fitness=self.fitness)
+
+        self.assertEqual(stats.max, max(all_fits))
+        self.assertEqual(stats.min, min(all_fits))
+        self.assertAlmostEqual(stats.mean, sum(all_fits)/10)
+        var = sum([(f - stats.mean)**2 for f in all_fits])/10
+        self.assertAlmostEqual(stats.std, var**0.5)
+        self.assertEqual(all_fits[stats.argmax], stats.max)
+        self.assertEqual(all_fits[stats.argmin], stats.min)
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(PopulationTest)
     unittest.TextTestRunner(verbosity=2).run(suite)
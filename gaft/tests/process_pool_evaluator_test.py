@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Test case for built-in process pool evaluator.
+'''
+
+import unittest
+from math import sin, cos
+
+from .. import GAEngine
+from ..components import BinaryIndividual, Population
+from ..operators import RouletteWheelSelection, UniformCrossover, FlipBitMutation
+from ..evaluators import ProcessPoolEvaluator
+from ..mpiutil import MPIUtil
+
+mpi = MPIUtil()
+
+
+def objective(indv):
+    x, = indv.solution
+    return x + 10*sin(5*x) + 7*cos(4*x)
+
+
+class ProcessPoolEvaluatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = True
+
+    def test_evaluate(self):
+        ''' Make sure individuals can be evaluated in worker processes in order.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=20).init()
+
+        evaluator = ProcessPoolEvaluator(workers=2, chunksize=4)
+        try:
+            values = evaluator.evaluate(objective, population.individuals)
+            executor = evaluator._executor
+            evaluator.evaluate(objective, population.individuals)
+            # Workers are reused.
+            self.assertIs(evaluator._executor, executor)
+        finally:
+            evaluator.shutdown()
+
+        self.assertListEqual(values, [objective(indv) for indv in population.individuals])
+
+    # NOTE: Spawned workers importing mpi4py can not initialize MPI in MPI jobs.
+    @unittest.skipIf(mpi.size > 1, 'spawned workers are not supported in MPI jobs')
+    def test_start_method(self):
+        ''' Make sure workers can be started with a specific start method.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=10).init()
+
+        evaluator = ProcessPoolEvaluator(workers=2, start_method='spawn')
+        try:
+            values = evaluator.evaluate(objective, population.individuals)
+        finally:
+            evaluator.shutdown()
+
+        self.assertListEqual(values, [objective(indv) for indv in population.individuals])
+        self.assertRaises(ValueError, ProcessPoolEvaluator, start_method='foo')
+
+    def test_engine_run(self):
+        ''' Make sure GA engine can run with process pool evaluator.
+        '''
+        indv_template = BinaryIndividual(ranges=[(0, 10)], eps=0.001)
+        population = Population(indv_template=indv_template, size=20).init()
+
+        engine = GAEngine(population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1),
+                          evaluator=ProcessPoolEvaluator(workers=2))
+
+        @engine.fitness_register
+        @engine.minimize
+        def fitness(indv):
+            x, = indv.solution
+            return x + 10*sin(5*x) + 7*cos(4*x)
+
+        engine.run(5)
+        self.assertIsNone(engine.evaluator._executor)
+        self.assertAlmostEqual(engine.ori_fmax, max(-objective(indv) for indv in population.individuals))
+
+if '__main__' == __name__:
+    suite = unittest.TestLoader().loadTestsFromTestCase(ProcessPoolEvaluatorTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -8,6 +8,8 @@ import unittest
 
 from gaft.components import Population, BinaryIndividual
 from gaft.operators.selection.roulette_wheel_selection import RouletteWheelSelection
+from gaft.operators.selection.alias_table import AliasTable
+from gaft.operators.selection.roulette_wheel import RouletteWheel
 
 class RouletteWheelSelectionTest(unittest.TestCase):
 
@@ -30,6 +32,71 @@ class RouletteWheelSelectionTest(unittest.TestCase):
         self.assertTrue(isinstance(mother, BinaryIndividual))
         self.assertNotEqual(father.chromsome, mother.chromsome)
 
+    def test_select_batch(self):
+        indv = BinaryIndividual(ranges=[(0, 30)])
+        p = Population(indv)
+        p.init()
+
+        selection = RouletteWheelSelection()
+        pairs = selection.select_batch(p, fitness=self.fitness, n_pairs=50)
+
+        self.assertEqual(len(pairs), 50)
+        for father_idx, mother_idx in pairs:
+            self.assertTrue(0 <= father_idx < len(p))
+            self.assertTrue(0 <= mother_idx < len(p))
+            self.assertNotEqual(father_idx, mother_idx)
+
+    def test_alias_sampler(self):
+        indv = BinaryIndividual(ranges=[(0, 30)])
+        p = Population(indv)
+        p.init()
+
+        selection = RouletteWheelSelection(sampler='alias')
+        father, mother = selection.select(p, fitness=self.fitness)
+        self.assertTrue(isinstance(father, BinaryIndividual))
+        self.assertTrue(isinstance(mother, BinaryIndividual))
+
+        table = selection._table
+        pairs = selection.select_batch(p, fitness=self.fitness, n_pairs=50)
+        self.assertEqual(len(pairs), 50)
+        for father_idx, mother_idx in pairs:
+            self.assertTrue(0 <= father_idx < len(p))
+            self.assertTrue(0 <= mother_idx < len(p))
+
+        # Alias table is reused until the population changes.
+        self.assertTrue(selection._table is table)
+        p.individuals[0] = indv.clone()
+        selection.select_batch(p, fitness=self.fitness, n_pairs=1)
+        self.assertFalse(selection._table is table)
+
+        self.assertRaises(ValueError, RouletteWheelSelection, sampler='foo')
+
+    def test_alias_table(self):
+        table = AliasTable([0.0, 1.0, 3.0, 0.0])
+        indices = table.draw_many(4000)
+        self.assertEqual(set(indices), {1, 2})
+        self.assertTrue(600 < indices.count(1) < 1400)
+        self.assertTrue(table.draw() in (1, 2))
+
+        # Uniform distribution for all-zero weights.
+        self.assertEqual(AliasTable([0.0, 0.0]).prob, [1.0, 1.0])
+        self.assertRaises(ValueError, AliasTable, [1.0, -1.0])
+
+    def test_roulette_wheel(self):
+        wheel = RouletteWheel([0.0, 1.0, 3.0, 0.0])
+        self.assertEqual(len(wheel), 4)
+        self.assertAlmostEqual(wheel[-1], 1.0)
+
+        pairs = wheel.spin_many(4000)
+        fathers = [father_idx for father_idx, _ in pairs]
+        self.assertEqual(set(fathers), {1, 2})
+        self.assertTrue(600 < fathers.count(1) < 1400)
+        for father_idx, mother_idx in pairs + [wheel.spin()]:
+            self.assertEqual(mother_idx, (father_idx + 1) % 4)
+
+        # Uniform wheel for all-zero weights.
+        self.assertEqual(RouletteWheel([0.0, 0.0]).cumulative, (0.5, 1.0))
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(RouletteWheelSelectionTest)
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Test case for engine run with sharded population.
+'''
+
+import unittest
+from math import sin, cos
+
+from .. import ShardedEngine
+from ..components import BinaryIndividual, DecimalIndividual
+from ..components import Population, ShardedPopulation
+from ..operators import RouletteWheelSelection, TournamentSelection
+from ..operators import UniformCrossover
+from ..operators import FlipBitMutation
+from ..mpiutil import MPIUtil
+
+mpi = MPIUtil()
+
+
+class ShardedEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = True
+
+    def test_run(self):
+        '''
+        Make sure GA engine can run correctly with sharded population.
+        '''
+        for indv_template in [BinaryIndividual(ranges=[(0, 10)], eps=0.001),
+                              DecimalIndividual(ranges=[(0, 10)], eps=0.001)]:
+            for selection in [RouletteWheelSelection(), TournamentSelection()]:
+                population = ShardedPopulation(indv_template=indv_template, size=50).init()
+                engine = ShardedEngine(population=population, selection=selection,
+                                       crossover=UniformCrossover(pc=0.8, pe=0.5),
+                                       mutation=FlipBitMutation(pm=0.1))
+
+                @engine.fitness_register
+                @engine.linear_scaling(target='min', ksi=0.5)
+                def fitness(indv):
+                    x, = indv.solution
+                    return x + 10*sin(5*x) + 7*cos(4*x)
+
+                engine.run(20)
+
+                # Only the shard is held in current process.
+                self.assertEqual(len(population), population.shard_size)
+
+                # Statistics are about the whole population.
+                all_fmin = mpi.allgather(min(population.all_fits(engine.ori_fitness)))
+                self.assertEqual(engine.ori_fmin, min(all_fmin))
+                best_indv = population.best_indv(engine.fitness)
+                self.assertAlmostEqual(engine.fitness(best_indv), engine.fmax)
+
+    def test_population_type(self):
+        '''
+        Make sure only sharded population is accepted.
+        '''
+        population = Population(indv_template=BinaryIndividual(ranges=[(0, 10)]))
+        self.assertRaises(TypeError, ShardedEngine, population=population,
+                          selection=RouletteWheelSelection(),
+                          crossover=UniformCrossover(pc=0.8, pe=0.5),
+                          mutation=FlipBitMutation(pm=0.1))
+
+if '__main__' == __name__:
+    suite = unittest.TestLoader().loadTestsFromTestCase(ShardedEngineTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
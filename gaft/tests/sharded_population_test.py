@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Test case for ShardedPopulation
+'''
+
+import unittest
+from math import sqrt
+
+from gaft.components import ShardedPopulation, BinaryIndividual
+from gaft.mpiutil import MPIUtil
+
+mpi = MPIUtil()
+
+
+class ShardedPopulationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = True
+        self.indv_template = BinaryIndividual(ranges=[(0, 30)])
+        def fitness(indv):
+            x, = indv.solution
+            return x**3 - 60*x**2 + 900*x + 100
+        self.fitness = fitness
+
+    def test_initialization(self):
+        ''' Make sure only the shard in current process is initialized. '''
+        population = ShardedPopulation(indv_template=self.indv_template, size=10)
+        population.init()
+
+        self.assertEqual(sum(population.shard_sizes), 10)
+        self.assertEqual(len(population), population.shard_size)
+        self.assertEqual(population.offset, sum(population.shard_sizes[: mpi.rank]))
+        self.assertTrue(max(population.shard_sizes) - min(population.shard_sizes) <= 1)
+
+        self.assertRaises(ValueError, population.init, [self.indv_template]*11)
+
+    def test_owner(self):
+        ''' Make sure global indices are mapped to shards correctly. '''
+        population = ShardedPopulation(indv_template=self.indv_template, size=10).init()
+
+        owners = [population.owner(i) for i in range(10)]
+        self.assertListEqual(owners, sorted(owners))
+        for rank in range(mpi.size):
+            self.assertEqual(owners.count(rank), population.shard_sizes[rank])
+
+        self.assertEqual(population.local_index(population.offset), 0)
+        self.assertRaises(IndexError, population.owner, 10)
+
+    def test_statistics(self):
+        ''' Make sure statistics are reduced from all shards. '''
+        population = ShardedPopulation(indv_template=self.indv_template, size=10).init()
+
+        all_fits = [f for fits in mpi.allgather(population.all_fits(self.fitness))
+                    for f in fits]
+        stats = population.statistics(self.fitness)
+
+        fmean = sum(all_fits)/len(all_fits)
+        fstd = sqrt(sum([(f - fmean)**2 for f in all_fits])/len(all_fits))
+        self.assertEqual(stats.max, max(all_fits))
+        self.assertEqual(stats.min, min(all_fits))
+        self.assertAlmostEqual(stats.mean, fmean)
+        self.assertAlmostEqual(stats.std, fstd, places=5)
+        self.assertEqual(stats.argmax, all_fits.index(max(all_fits)))
+        self.assertEqual(stats.argmin, all_fits.index(min(all_fits)))
+
+        self.assertEqual(population.max(self.fitness), stats.max)
+        self.assertEqual(population.min(self.fitness), stats.min)
+        self.assertEqual(population.mean(self.fitness), stats.mean)
+
+        # Best and worst individuals are fetched from their owners.
+        self.assertEqual(self.fitness(population.best_indv(self.fitness)), stats.max)
+        self.assertEqual(self.fitness(population.worst_indv(self.fitness)), stats.min)
+
+if '__main__' == __name__:
+    suite = unittest.TestLoader().loadTestsFromTestCase(ShardedPopulationTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
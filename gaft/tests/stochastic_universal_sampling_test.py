@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+''' Test case for built-in Stochastic Universal Sampling selection
+'''
+
+import unittest
+
+from gaft.components import Population, BinaryIndividual
+from gaft.operators import StochasticUniversalSampling
+
+class StochasticUniversalSamplingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff
+        def fitness(indv):
+            x, = indv.solution
+            return x**3 - 60*x**2 + 900*x + 100
+        self.fitness = fitness
+
+    def test_selection(self):
+        indv = BinaryIndividual(ranges=[(0, 30)])
+        p = Population(indv)
+        p.init()
+
+        selection = StochasticUniversalSampling()
+        father, mother = selection.select(p, fitness=self.fitness)
+
+        self.assertTrue(isinstance(father, BinaryIndividual))
+        self.assertTrue(isinstance(mother, BinaryIndividual))
+
+    def test_select_batch(self):
+        indv = BinaryIndividual(ranges=[(0, 30)])
+        p = Population(indv)
+        p.init()
+
+        selection = StochasticUniversalSampling()
+        pairs = selection.select_batch(p, fitness=self.fitness, n_pairs=50)
+
+        self.assertEqual(len(pairs), 50)
+        for father_idx, mother_idx in pairs:
+            self.assertTrue(0 <= father_idx < len(p))
+            self.assertTrue(0 <= mother_idx < len(p))
+
+    def test_sample(self):
+        # Numbers of copies are bounded by the expected numbers of copies.
+        indices = StochasticUniversalSampling._sample([1.0, 2.0, 5.0, 1.0], 6)
+        self.assertEqual(len(indices), 6)
+        self.assertEqual(indices, sorted(indices))
+        self.assertEqual(indices.count(0), 0)
+        self.assertTrue(1 <= indices.count(1) <= 2)
+        self.assertTrue(4 <= indices.count(2) <= 5)
+        self.assertEqual(indices.count(3), 0)
+
+        # Uniform sampling for the same fitness values.
+        indices = StochasticUniversalSampling._sample([1.0]*4, 4)
+        self.assertEqual(indices, [0, 1, 2, 3])
+
+if '__main__' == __name__:
+    suite = unittest.TestLoader().loadTestsFromTestCase(StochasticUniversalSamplingTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
@@ -8,17 +8,25 @@ import unittest
 
 from .individual_test import IndividualTest
 from .population_test import PopulationTest
+from .sharded_population_test import ShardedPopulationTest
 from .roulette_wheel_selection_test import RouletteWheelSelectionTest
 from .uniform_crossover_test import UniformCrossoverTest
 from .flip_bit_mutation_test import FlipBitMutationTest
 from .mpiutil_test import MPIUtilTest
 from .engine_test import GAEngineTest
+from .island_engine_test import IslandEngineTest
+from .sharded_engine_test import ShardedEngineTest
 from .tournament_selection_test import TournamentSelectionTest
 from .linear_ranking_selection_test import LinearRankingSelectionTest
 from .exponential_ranking_selection_test import ExponentialRankingSelectionTest
+from .stochastic_universal_sampling_test import StochasticUniversalSamplingTest
 from .linear_scaling_test import LinearScalingTest
 from .dynamic_linear_scaling_test import DynamicLinearScalingTest
 from .flip_bit_big_mutation_test import FlipBitBigMutationTest
+from .array_population_test import ArrayPopulationTest
+from .process_pool_evaluator_test import ProcessPoolEvaluatorTest
+from .async_evaluator_test import AsyncEvaluatorTest
+from .fitness_cache_test import FitnessCacheTest
 
 def suite():
     ''' Generate test suite for all test cases in GAFT
@@ -26,17 +34,25 @@ def suite():
     test_cases = [
         IndividualTest,
         PopulationTest,
+        ShardedPopulationTest,
         RouletteWheelSelectionTest,
         UniformCrossoverTest,
         FlipBitMutationTest,
         MPIUtilTest,
         GAEngineTest,
+        IslandEngineTest,
+        ShardedEngineTest,
         TournamentSelectionTest,
         LinearRankingSelectionTest,
         ExponentialRankingSelectionTest,
+        StochasticUniversalSamplingTest,
         LinearScalingTest,
         DynamicLinearScalingTest,
-        FlipBitBigMutationTest
+        FlipBitBigMutationTest,
+        ArrayPopulationTest,
+        ProcessPoolEvaluatorTest,
+        AsyncEvaluatorTest,
+        FitnessCacheTest
     ]
 
     test_suite = unittest.TestSuite([
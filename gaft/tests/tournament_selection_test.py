@@ -29,6 +29,34 @@ class TournamentSelectionTest(unittest.TestCase):
         self.assertTrue(isinstance(father, BinaryIndividual))
         self.assertTrue(isinstance(mother, BinaryIndividual))
 
+    def test_select_batch(self):
+        indv = BinaryIndividual(ranges=[(0, 30)])
+        p = Population(indv)
+        p.init()
+
+        for selection in [TournamentSelection(tournament_size=3),
+                          TournamentSelection(tournament_size=3, replacement=True),
+                          TournamentSelection(tournament_size=3, pressure=0.7)]:
+            pairs = selection.select_batch(p, fitness=self.fitness, n_pairs=50)
+
+            self.assertEqual(len(pairs), 50)
+            for father_idx, mother_idx in pairs:
+                self.assertTrue(0 <= father_idx < len(p))
+                self.assertTrue(0 <= mother_idx < len(p))
+
+    def test_tournament_winner(self):
+        all_fits = [3.0, 1.0, 2.0]
+
+        selection = TournamentSelection(tournament_size=3)
+        self.assertEqual(selection._compete([1, 0, 2], all_fits), 0)
+
+        # The worst competitor can win with a low selection pressure.
+        selection = TournamentSelection(tournament_size=3, pressure=0.01)
+        winners = [selection._compete([1, 0, 2], all_fits) for _ in range(100)]
+        self.assertTrue(1 in winners)
+
+        self.assertRaises(ValueError, TournamentSelection, pressure=0.0)
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(TournamentSelectionTest)
     unittest.TextTestRunner(verbosity=2).run(suite)
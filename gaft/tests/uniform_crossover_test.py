@@ -22,6 +22,10 @@ class UniformCrossoverTest(unittest.TestCase):
         crossover = UniformCrossover(pc=1.0, pe=0.5)
         child1, child2 = crossover.cross(father, mother)
 
+        # Genes of children come from the parents at the same positions.
+        self.assertEqual(child1.bits ^ child2.bits, father.bits ^ mother.bits)
+        self.assertEqual(child1.bits & child2.bits, father.bits & mother.bits)
+
 if '__main__' == __name__:
     suite = unittest.TestLoader().loadTestsFromTestCase(UniformCrossoverTest)
     unittest.TextTestRunner(verbosity=2).run(suite)